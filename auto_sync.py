@@ -8,60 +8,210 @@ import os
 import subprocess
 import time
 import logging
+import logging.handlers
+import queue
+import threading
+import signal
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional, Tuple
 import json
+import random
+import re
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:  # watchdog is optional - continuous_sync falls back to polling
+    Observer = None
+    PatternMatchingEventHandler = object
+
+class _WorktreeEventHandler(PatternMatchingEventHandler):
+    """Forward worktree file events into the sync queue"""
+    
+    IGNORE_PATTERNS = ["*/.git", "*/.git/*", "*.log*", "*/.auto_sync.pid", "*/__pycache__/*"]
+    
+    def __init__(self, events: queue.SimpleQueue):
+        super().__init__(ignore_patterns=self.IGNORE_PATTERNS, ignore_directories=True)
+        self.events = events
+    
+    def on_any_event(self, event):
+        self.events.put(event.src_path)
 
 class GitHubAutoSync:
     """Automated GitHub synchronization"""
     
+    DEBOUNCE_SECONDS = 2.0  # Quiet period that ends a burst of file events
+    MAX_WAIT_SECONDS = 5.0  # Upper bound on how long a burst can delay a sync
+    
+    # Files whose mtimes change whenever staging, commits or pushes happen
+    GIT_STATE_FILES = ("index", "HEAD", "refs/heads/main", "refs/remotes/origin/main")
+    
+    FSMONITOR_MIN_GIT_VERSION = (2, 37)  # First release with the built-in daemon
+    
+    # Path keyword -> commit change type, in priority order
+    _TYPE_MAP = {
+        'production': 'production',
+        'deployment': 'deployment',
+        'docker': 'docker',
+        'health': 'monitoring',
+        'broker': 'trading',
+        'config': 'configuration',
+    }
+    _TYPE_PATTERN = re.compile('|'.join(_TYPE_MAP))
+    
+    # Push retry backoff: base * 2**attempt, plus up to 50% jitter, capped
+    RETRY_MAX_DELAY = 30.0
+    RETRY_JITTER = 0.5
+    
+    # Push failures that retrying cannot fix
+    UNRECOVERABLE_PUSH_ERRORS = ("authentication failed", "permission denied", "does not exist")
+    
     def __init__(self, repo_path: str = "."):
         self.repo_path = Path(repo_path).resolve()
         self.logger = self._setup_logging()
         self.last_commit = None
+        self._last_state = None
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._events: Optional[queue.SimpleQueue] = None
+        self._enable_fsmonitor()
         
     def _setup_logging(self):
-        """Setup logging for auto-sync"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(message)s',
-            handlers=[
-                logging.FileHandler('auto_sync.log'),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(__name__)
-    
-    def _run_command(self, cmd: str, check=True) -> subprocess.CompletedProcess:
-        """Run git command safely"""
+        """Setup logging for auto-sync (handlers are installed once per process)"""
+        logger = logging.getLogger("auto_sync")
+        if not logger.handlers:
+            formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+            
+            # File writes are batched: flushed every 100 records or on WARNING+
+            file_handler = logging.handlers.RotatingFileHandler(
+                'auto_sync.log', maxBytes=1_000_000, backupCount=3
+            )
+            file_handler.setFormatter(formatter)
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=100, flushLevel=logging.WARNING, target=file_handler
+            )
+            
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            
+            logger.addHandler(buffered_handler)
+            logger.addHandler(console_handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        return logger
+    
+    def _enable_fsmonitor(self):
+        """Let `git status` query git's fsmonitor daemon instead of lstat-ing the tree"""
+        try:
+            result = self._run_command(["git", "--version"], check=False)
+            match = re.search(r'(\d+)\.(\d+)', result.stdout)
+            if not match or tuple(map(int, match.groups())) < self.FSMONITOR_MIN_GIT_VERSION:
+                return
+            
+            # The untracked cache works everywhere and pairs with fsmonitor
+            self._run_command(["git", "config", "core.untrackedCache", "true"], check=False)
+            
+            # Only switch fsmonitor on where the daemon can actually run
+            # (it is not supported on every platform, e.g. Linux on older git)
+            daemon = self._run_command(["git", "fsmonitor--daemon", "start"], check=False)
+            if daemon.returncode == 0 or "already running" in daemon.stderr:
+                self._run_command(["git", "config", "core.fsmonitor", "true"], check=False)
+                self.logger.info("git fsmonitor enabled for faster status checks")
+        except Exception as e:
+            self.logger.debug(f"fsmonitor not enabled: {e}")
+    
+    def _run_command(self, argv: List[str], check=True, **kwargs) -> subprocess.CompletedProcess:
+        """Run git command safely (argv list, no shell)"""
         try:
             result = subprocess.run(
-                f"cd {self.repo_path} && {cmd}",
-                shell=True,
+                argv,
+                cwd=str(self.repo_path),
                 check=check,
                 capture_output=True,
-                text=True
+                text=True,
+                **kwargs
             )
             return result
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Command failed: {cmd}")
+            self.logger.error(f"Command failed: {' '.join(argv)}")
             self.logger.error(f"Error: {e.stderr}")
             raise
     
-    def check_changes(self) -> bool:
+    def _git_state(self) -> Tuple[Optional[int], ...]:
+        """Cheap fingerprint of git metadata (stat calls only, no subprocess)"""
+        git_dir = self.repo_path / ".git"
+        state = []
+        for name in self.GIT_STATE_FILES:
+            try:
+                state.append(os.stat(git_dir / name).st_mtime_ns)
+            except OSError:
+                state.append(None)  # e.g. packed refs or no remote yet
+        return tuple(state)
+    
+    def _snapshot(self) -> Tuple[int, int, List[str]]:
+        """Get (ahead, behind, changed paths) from a single `git status` call"""
+        result = self._run_command(["git", "status", "--porcelain=v2", "--branch", "-z"], check=False)
+        
+        ahead = behind = 0
+        paths = []
+        entries = iter(result.stdout.split('\0'))
+        for entry in entries:
+            if entry.startswith('# branch.ab '):
+                # "# branch.ab +<ahead> -<behind>" (only present with an upstream)
+                ahead_str, behind_str = entry[len('# branch.ab '):].split()
+                ahead, behind = int(ahead_str), -int(behind_str)
+            elif entry.startswith('1 '):
+                paths.append(entry.split(' ', 8)[8])
+            elif entry.startswith('2 '):
+                paths.append(entry.split(' ', 9)[9])
+                next(entries, None)  # Skip the rename/copy source path
+            elif entry.startswith('u '):
+                paths.append(entry.split(' ', 10)[10])
+            elif entry.startswith('? '):
+                paths.append(entry[2:])
+        
+        return ahead, behind, paths
+    
+    def check_changes(self, snapshot: Optional[Tuple[int, int, List[str]]] = None) -> bool:
         """Check if there are uncommitted changes"""
         try:
-            result = self._run_command("git status --porcelain", check=False)
-            return result.stdout.strip() != ""
+            if snapshot is not None:
+                _, _, paths = snapshot
+                return bool(paths)
+            
+            # Only emptiness matters: read one byte and stop git early
+            process = subprocess.Popen(
+                ["git", "status", "--porcelain", "-z"],
+                cwd=str(self.repo_path),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            try:
+                first = process.stdout.read(1)
+            finally:
+                process.stdout.close()
+                process.terminate()
+                process.wait()
+            return bool(first)
         except Exception as e:
             self.logger.error(f"Error checking changes: {e}")
             return False
     
-    def check_unpushed_commits(self) -> bool:
+    def check_unpushed_commits(self, snapshot: Optional[Tuple[int, int, List[str]]] = None) -> bool:
         """Check if there are unpushed commits"""
         try:
-            result = self._run_command("git log --oneline origin/main..HEAD", check=False)
-            return result.stdout.strip() != ""
+            if snapshot is not None:
+                ahead, _, _ = snapshot
+                return ahead > 0
+            
+            # A single integer instead of a formatted log. A non-zero exit means
+            # origin/main does not exist yet, which doubles as the show-ref check
+            result = self._run_command(["git", "rev-list", "--count", "origin/main..HEAD"], check=False)
+            if result.returncode != 0:
+                self.logger.debug("origin/main not found - nothing to compare against")
+                return False
+            return int(result.stdout.strip() or "0") > 0
         except Exception as e:
             self.logger.error(f"Error checking unpushed commits: {e}")
             return False
@@ -69,20 +219,20 @@ class GitHubAutoSync:
     def stage_changes(self) -> bool:
         """Stage all changes"""
         try:
-            self._run_command("git add .")
+            self._run_command(["git", "add", "."])
             self.logger.info("Changes staged successfully")
             return True
         except Exception as e:
             self.logger.error(f"Error staging changes: {e}")
             return False
     
-    def commit_changes(self) -> bool:
+    def commit_changes(self, changed_files: Optional[List[str]] = None) -> bool:
         """Commit changes with auto-generated message"""
         try:
             # Generate commit message
-            commit_msg = self._generate_commit_message()
+            commit_msg = self._generate_commit_message(changed_files)
             
-            self._run_command(f'git commit -m "{commit_msg}"')
+            self._run_command(["git", "commit", "-m", commit_msg])
             self.logger.info(f"Changes committed: {commit_msg}")
             
             self.last_commit = commit_msg
@@ -92,30 +242,22 @@ class GitHubAutoSync:
             self.logger.error(f"Error committing changes: {e}")
             return False
     
-    def _generate_commit_message(self) -> str:
+    def _generate_commit_message(self, changed_files: Optional[List[str]] = None) -> str:
         """Generate descriptive commit message based on changes"""
         try:
-            # Get changed files
-            result = self._run_command("git diff --cached --name-only")
-            changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
+            # Get changed files (reuse the sync snapshot when available)
+            if changed_files is None:
+                result = self._run_command(["git", "diff", "--cached", "--name-only"])
+                changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
             
-            # Analyze changes
-            changes_type = []
-            if any('production' in f for f in changed_files):
-                changes_type.append('production')
-            if any('deployment' in f for f in changed_files):
-                changes_type.append('deployment')
-            if any('docker' in f for f in changed_files):
-                changes_type.append('docker')
-            if any('health' in f for f in changed_files):
-                changes_type.append('monitoring')
-            if any('broker' in f for f in changed_files):
-                changes_type.append('trading')
-            if any('config' in f for f in changed_files):
-                changes_type.append('configuration')
+            # Analyze changes (one regex pass per file)
+            found = set()
+            for f in changed_files:
+                found.update(self._TYPE_PATTERN.findall(f))
+            changes_type = [label for key, label in self._TYPE_MAP.items() if key in found]
             
             # Get diff statistics
-            diff_result = self._run_command("git diff --cached --stat")
+            diff_result = self._run_command(["git", "diff", "--cached", "--stat"])
             
             primary_type = changes_type[0] if changes_type else "general"
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
@@ -140,12 +282,9 @@ class GitHubAutoSync:
                 self.logger.info(f"Pushing to GitHub (attempt {attempt + 1}/{max_retries})...")
                 
                 # Push with timeout handling (macOS compatible)
-                push_cmd = f"cd {self.repo_path} && git push origin main"
-                result = subprocess.run(
-                    push_cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
+                result = self._run_command(
+                    ["git", "push", "origin", "main"],
+                    check=False,
                     timeout=60  # Total timeout
                 )
                 
@@ -157,12 +296,16 @@ class GitHubAutoSync:
                     self.logger.warning(f"Push attempt {attempt + 1} failed: {error_msg}")
                     
                     # Handle specific errors
-                    if "timeout" in error_msg.lower():
+                    error_lower = error_msg.lower()
+                    if any(err in error_lower for err in self.UNRECOVERABLE_PUSH_ERRORS):
+                        self.logger.error(f"Non-recoverable error: {error_msg}")
+                        break
+                    elif "timeout" in error_lower:
                         self.logger.info("Network timeout, retrying...")
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    elif "network" in error_msg.lower():
+                        time.sleep(self._retry_delay(1, attempt))  # Exponential backoff
+                    elif "network" in error_lower:
                         self.logger.info("Network error, retrying...")
-                        time.sleep(5)
+                        time.sleep(self._retry_delay(5))
                     else:
                         self.logger.error(f"Non-recoverable error: {error_msg}")
                         break
@@ -170,7 +313,7 @@ class GitHubAutoSync:
             except subprocess.TimeoutExpired:
                 self.logger.error(f"Push timeout on attempt {attempt + 1}")
                 if attempt < max_retries - 1:
-                    time.sleep(10)
+                    time.sleep(self._retry_delay(10))
                 continue
             except Exception as e:
                 self.logger.error(f"Unexpected error during push: {e}")
@@ -178,23 +321,54 @@ class GitHubAutoSync:
         
         return False
     
-    def sync_to_github(self) -> bool:
-        """Complete sync workflow"""
+    def _retry_delay(self, base: float, attempt: int = 0) -> float:
+        """Jittered, capped backoff so concurrent syncers don't retry in lockstep"""
+        delay = base * (2 ** attempt) * (1 + random.uniform(0, self.RETRY_JITTER))
+        return min(self.RETRY_MAX_DELAY, delay)
+    
+    def sync_to_github(self, use_cache: bool = False) -> bool:
+        """Complete sync workflow
+        
+        With use_cache=True the sync is skipped when git metadata is unchanged
+        since the last successful sync. Only use it when the worktree is known
+        not to have changed (the fingerprint does not see unstaged edits).
+        """
+        # In-flight guard: a sync already running will pick up these changes
+        if not self._sync_lock.acquire(blocking=False):
+            return True
+        
+        try:
+            if use_cache and self._last_state is not None and self._git_state() == self._last_state:
+                return True
+            
+            if self._sync_workflow():
+                self._last_state = self._git_state()
+                return True
+            return False
+        finally:
+            self._sync_lock.release()
+    
+    def _sync_workflow(self) -> bool:
+        """Check, stage, commit and push"""
         try:
             self.logger.info("🔄 Starting auto-sync to GitHub...")
             
-            # Step 1: Check if there are changes
-            if not self.check_changes() and not self.check_unpushed_commits():
+            # Step 1: Check if there are changes (one git call for the whole cycle)
+            snapshot = self._snapshot()
+            _, _, changed_files = snapshot
+            has_changes = self.check_changes(snapshot)
+            
+            if not has_changes and not self.check_unpushed_commits(snapshot):
                 self.logger.info("✅ Repository is up to date")
                 return True
             
             # Step 2: Stage changes if needed
-            if self.check_changes():
+            if has_changes:
                 if not self.stage_changes():
                     return False
                 
                 # Step 3: Commit changes
-                if not self.commit_changes():
+                if not self.commit_changes(changed_files):
                     return False
             
             # Step 4: Push to GitHub
@@ -210,19 +384,88 @@ class GitHubAutoSync:
             return False
     
     def continuous_sync(self, interval_minutes: int = 5):
-        """Run continuous auto-sync in background"""
-        self.logger.info(f"🚀 Starting continuous auto-sync (check every {interval_minutes} minutes)")
+        """Run continuous auto-sync, triggered by worktree file changes"""
+        if Observer is None:
+            self.logger.warning("watchdog not installed - falling back to polling. Install with: pip install watchdog")
+            self._poll_sync(interval_minutes)
+            return
         
-        while True:
+        self.logger.info(f"🚀 Starting continuous auto-sync (watching {self.repo_path}, "
+                         f"idle flush every {interval_minutes} minutes)")
+        
+        events = self._events = queue.SimpleQueue()  # Reentrant put: stop() runs from the SIGTERM handler
+        observer = Observer()
+        observer.schedule(_WorktreeEventHandler(events), str(self.repo_path), recursive=True)
+        observer.start()
+        
+        try:
+            self._event_sync_loop(events, interval_minutes * 60)
+        except KeyboardInterrupt:
+            self.logger.info("👋 Auto-sync stopped by user")
+        finally:
+            observer.stop()
+            observer.join()
+            self._events = None
+    
+    def stop(self):
+        """Stop continuous sync (safe to call from another thread or a signal handler)"""
+        self._stop.set()
+        events = self._events
+        if events is not None:
+            events.put(None)  # Wake the event loop immediately
+    
+    def _event_sync_loop(self, events: queue.SimpleQueue, idle_seconds: float):
+        """Sync once per debounced burst of file events"""
+        self.sync_to_github()
+        
+        while not self._stop.is_set():
             try:
-                self.sync_to_github()
-                time.sleep(interval_minutes * 60)
-            except KeyboardInterrupt:
-                self.logger.info("👋 Auto-sync stopped by user")
+                event = events.get(timeout=idle_seconds)
+            except queue.Empty:
+                # Max-idle fallback flush: pushes commits made outside auto-sync,
+                # skipped entirely when git metadata is untouched
+                self.sync_to_github(use_cache=True)
+                continue
+            
+            if event is None:
                 break
-            except Exception as e:
-                self.logger.error(f"Error in continuous sync: {e}")
-                time.sleep(minutes * 60)
+            
+            self._wait_for_quiet(events)
+            if self._stop.is_set():
+                break
+            self.sync_to_github()
+        
+        self.logger.info("👋 Auto-sync stopped")
+    
+    def _wait_for_quiet(self, events: queue.SimpleQueue):
+        """Coalesce a burst of events until it goes quiet or MAX_WAIT_SECONDS passes"""
+        deadline = time.monotonic() + self.MAX_WAIT_SECONDS
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                if events.get(timeout=min(self.DEBOUNCE_SECONDS, remaining)) is None:
+                    return  # Stop requested
+            except queue.Empty:
+                return
+    
+    def _poll_sync(self, interval_minutes: int):
+        """Fixed-interval sync loop used when watchdog is unavailable"""
+        self.logger.info(f"🚀 Starting continuous auto-sync (check every {interval_minutes} minutes)")
+        
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.sync_to_github()
+                except Exception as e:
+                    self.logger.error(f"Error in continuous sync: {e}")
+                
+                # Interruptible sleep: stop() ends the wait immediately
+                self._stop.wait(timeout=interval_minutes * 60)
+        except KeyboardInterrupt:
+            self.logger.info("👋 Auto-sync stopped by user")
 
 def main():
     """Main auto-sync function"""
@@ -232,7 +475,7 @@ def main():
     parser.add_argument("--continuous", "-c", action="store_true", 
                        help="Run continuous auto-sync in background")
     parser.add_argument("--interval", "-i", type=int, default=5,
-                       help="Sync interval in minutes (default: 5)")
+                       help="Max idle minutes between syncs (default: 5)")
     parser.add_argument("--once", "-o", action="store_true",
                        help="Run sync once and exit")
     
@@ -241,6 +484,9 @@ def main():
     # Initialize auto-sync
     syncer = GitHubAutoSync()
     
+    # `start_auto_sync.sh stop` sends SIGTERM: finish the current cycle and exit cleanly
+    signal.signal(signal.SIGTERM, lambda signum, frame: syncer.stop())
+    
     try:
         if args.once or not args.continuous:
             # One-time sync
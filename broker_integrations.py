@@ -5,11 +5,33 @@ Supports multiple brokers: Alpaca, Binance, Interactive Brokers, TD Ameritrade
 
 import os
 import time
+import operator
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Any
 from dataclasses import dataclass
 from trade_executor import TradeOrder, TradeExecution
 
+# Broker SDKs are optional and slow to import: each is loaded on first use
+# and the result (module or "not installed") is cached for later calls
+_SDK_UNAVAILABLE = object()
+_sdk_cache: Dict[str, Any] = {}
+
+def _import_sdk(module: str, attr: Optional[str] = None) -> Any:
+    """Import an optional broker SDK once; returns None if it is not installed"""
+    key = f"{module}:{attr}" if attr else module
+    sdk = _sdk_cache.get(key)
+    if sdk is None:
+        try:
+            sdk = importlib.import_module(module)
+            if attr:
+                sdk = getattr(sdk, attr)
+        except ImportError:
+            sdk = _SDK_UNAVAILABLE
+        _sdk_cache[key] = sdk
+    return None if sdk is _SDK_UNAVAILABLE else sdk
+
 @dataclass
 class BrokerCredentials:
     api_key: str
@@ -21,8 +43,8 @@ class BrokerInterface(ABC):
     """Abstract base class for broker integrations"""
     
     @abstractmethod
-    def authenticate(self) -> bool:
-        """Authenticate with broker API"""
+    def authenticate(self, force: bool = False) -> bool:
+        """Authenticate with broker API (force=True bypasses any cached result)"""
         pass
     
     @abstractmethod
@@ -35,6 +57,10 @@ class BrokerInterface(ABC):
         """Get current market data for symbol"""
         pass
     
+    def get_market_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get current market data for several symbols (override to batch requests)"""
+        return {symbol: self.get_market_data(symbol) for symbol in symbols}
+    
     @abstractmethod
     def place_order(self, order: TradeOrder) -> Optional[TradeExecution]:
         """Place order with broker"""
@@ -58,17 +84,31 @@ class BrokerInterface(ABC):
 class AlpacaBroker(BrokerInterface):
     """Alpaca Markets integration for stocks and ETFs"""
     
+    # Fetches every position field in one C-level call per row
+    _POSITION_FIELDS = operator.attrgetter(
+        'symbol', 'qty', 'market_value', 'current_price', 'unrealized_pl', 'unrealized_plpc'
+    )
+    
     def __init__(self, credentials: BrokerCredentials, paper: bool = True):
         self.credentials = credentials
         self.paper = paper
         self.base_url = "https://paper-api.alpaca.markets" if paper else "https://api.alpaca.markets"
         self.api = None
+        self._auth_ts = 0.0
+        self._auth_ttl = 300  # Seconds a successful authentication is reused
         
-    def authenticate(self) -> bool:
+    def authenticate(self, force: bool = False) -> bool:
         """Authenticate with Alpaca API"""
+        if not force and self.api and (time.monotonic() - self._auth_ts) < self._auth_ttl:
+            return True
+        
+        self._auth_ts = 0.0
+        alpaca = _import_sdk('alpaca_trade_api')
+        if alpaca is None:
+            print("❌ Alpaca library not installed. Install with: pip install alpaca-trade-api")
+            return False
+        
         try:
-            import alpaca_trade_api as alpaca
-            
             self.api = alpaca.REST(
                 key_id=self.credentials.api_key,
                 secret_key=self.credentials.api_secret,
@@ -77,11 +117,10 @@ class AlpacaBroker(BrokerInterface):
             
             # Test connection by getting account
             account = self.api.get_account()
+            if account is not None:
+                self._auth_ts = time.monotonic()
             return account is not None
             
-        except ImportError:
-            print("❌ Alpaca library not installed. Install with: pip install alpaca-trade-api")
-            return False
         except Exception as e:
             print(f"❌ Alpaca authentication failed: {e}")
             return False
@@ -110,23 +149,40 @@ class AlpacaBroker(BrokerInterface):
             return {}
         
         try:
-            # Get last quote
-            quote = self.api.get_latest_quote(symbol)
-            
-            # Get last trade
-            trade = self.api.get_latest_trade(symbol)
-            
+            # Last trade and quote in one round trip
+            return self._format_snapshot(self.api.get_snapshot(symbol))
+        except Exception as e:
+            print(f"❌ Failed to get Alpaca market data: {e}")
+            return {}
+    
+    def get_market_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get current market data for several symbols in one request"""
+        if not self.api or not symbols:
+            return {}
+        
+        try:
+            snapshots = self.api.get_snapshots(symbols)
             return {
-                'price': float(trade.price),
-                'ask': float(quote.ask_price),
-                'bid': float(quote.bid_price),
-                'size': int(trade.size),
-                'timestamp': trade.timestamp.timestamp() if trade.timestamp else time.time()
+                symbol: self._format_snapshot(snapshot)
+                for symbol, snapshot in snapshots.items()
+                if snapshot is not None
             }
         except Exception as e:
             print(f"❌ Failed to get Alpaca market data: {e}")
             return {}
     
+    def _format_snapshot(self, snapshot) -> Dict:
+        """Convert an Alpaca snapshot into the market data dict"""
+        trade = snapshot.latest_trade
+        quote = snapshot.latest_quote
+        return {
+            'price': float(trade.price),
+            'ask': float(quote.ask_price),
+            'bid': float(quote.bid_price),
+            'size': int(trade.size),
+            'timestamp': trade.timestamp.timestamp() if trade.timestamp else time.time()
+        }
+    
     def place_order(self, order: TradeOrder) -> Optional[TradeExecution]:
         """Place order with Alpaca"""
         if not self.api:
@@ -177,14 +233,15 @@ class AlpacaBroker(BrokerInterface):
             positions = self.api.list_positions()
             return [
                 {
-                    'symbol': pos.symbol,
-                    'quantity': int(pos.qty),
-                    'market_value': float(pos.market_value),
-                    'current_price': float(pos.current_price),
-                    'unrealized_pl': float(pos.unrealized_pl),
-                    'unrealized_plpc': float(pos.unrealized_plpc)*100
+                    'symbol': symbol,
+                    'quantity': int(qty),
+                    'market_value': float(market_value),
+                    'current_price': float(current_price),
+                    'unrealized_pl': float(unrealized_pl),
+                    'unrealized_plpc': float(unrealized_plpc)*100
                 }
-                for pos in positions
+                for symbol, qty, market_value, current_price, unrealized_pl, unrealized_plpc
+                in map(self._POSITION_FIELDS, positions)
             ]
         except Exception as e:
             print(f"❌ Failed to get Alpaca positions: {e}")
@@ -215,12 +272,24 @@ class BinanceBroker(BrokerInterface):
         self.credentials = credentials
         self.testnet = testnet
         self.api = None
+        self._auth_ts = 0.0
+        self._auth_ttl = 300  # Seconds a successful authentication is reused
+        self._account_cache = None
+        self._account_cache_ts = 0.0
+        self._account_ttl = 1.0  # Shared by get_account_info / get_positions
         
-    def authenticate(self) -> bool:
+    def authenticate(self, force: bool = False) -> bool:
         """Authenticate with Binance API"""
+        if not force and self.api and (time.monotonic() - self._auth_ts) < self._auth_ttl:
+            return True
+        
+        self._auth_ts = 0.0
+        Client = _import_sdk('binance.client', 'Client')
+        if Client is None:
+            print("❌ python-binance library not installed. Install with: pip install python-binance")
+            return False
+        
         try:
-            from binance.client import Client
-            
             self.api = Client(
                 api_key=self.credentials.api_key,
                 api_secret=self.credentials.api_secret,
@@ -229,33 +298,44 @@ class BinanceBroker(BrokerInterface):
             
             # Test connection by getting account
             account = self.api.get_account()
+            if account is not None:
+                self._auth_ts = time.monotonic()
+                self._account_cache = account
+                self._account_cache_ts = self._auth_ts
             return account is not None
             
-        except ImportError:
-            print("❌ python-binance library not installed. Install with: pip install python-binance")
-            return False
         except Exception as e:
             print(f"❌ Binance authentication failed: {e}")
             return False
     
+    def _get_account_cached(self) -> Dict:
+        """Signed get_account() call, reused for _account_ttl seconds"""
+        now = time.monotonic()
+        if self._account_cache is None or now - self._account_cache_ts > self._account_ttl:
+            self._account_cache = self.api.get_account()
+            self._account_cache_ts = now
+        return self._account_cache
+    
     def get_account_info(self) -> Dict:
         """Get Binance account information"""
         if not self.api:
             return {}
         
         try:
-            account = self.api.get_account()
+            account = self._get_account_cached()
             
-            # Get BTC balance for example
+            # Total and BTC balance (for example) in a single pass
             btc_balance = 0
+            total_balance = 0.0
             for balance in account['balances']:
+                free = float(balance['free'])
+                total_balance += free + float(balance['locked'])
                 if balance['asset'] == 'BTC':
-                    btc_balance = float(balance['free'])
-                    break
+                    btc_balance = free
             
             return {
                 'btc_balance': btc_balance,
-                'total_balance_btc': sum(float(b['free']) + float(b['locked']) for b in account['balances']),
+                'total_balance_btc': total_balance,
                 'permissions': account['permissions']
             }
         except Exception as e:
@@ -268,21 +348,39 @@ class BinanceBroker(BrokerInterface):
             return {}
         
         try:
-            ticker = self.api.get_symbol_ticker(symbol=symbol)
-            depth = self.api.get_orderbook_ticker(symbol=symbol)
-            
+            # The 24hr ticker carries last price and best bid/ask in one call
+            return self._format_ticker(self.api.get_ticker(symbol=symbol))
+        except Exception as e:
+            print(f"❌ Failed to get Binance market data: {e}")
+            return {}
+    
+    def get_market_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get current market data for several symbols in one request"""
+        if not self.api or not symbols:
+            return {}
+        
+        try:
+            wanted = set(symbols)
             return {
-                'price': float(ticker['price']),
-                'ask': float(depth['askPrice']),
-                'bid': float(depth['bidPrice']),
-                'ask_size': float(depth['askQty']),
-                'bid_size': float(depth['bidQty']),
-                'timestamp': int(ticker['closeTime']) / 1000
+                ticker['symbol']: self._format_ticker(ticker)
+                for ticker in self.api.get_ticker()
+                if ticker['symbol'] in wanted
             }
         except Exception as e:
             print(f"❌ Failed to get Binance market data: {e}")
             return {}
     
+    def _format_ticker(self, ticker: Dict) -> Dict:
+        """Convert a Binance 24hr ticker into the market data dict"""
+        return {
+            'price': float(ticker['lastPrice']),
+            'ask': float(ticker['askPrice']),
+            'bid': float(ticker['bidPrice']),
+            'ask_size': float(ticker['askQty']),
+            'bid_size': float(ticker['bidQty']),
+            'timestamp': int(ticker['closeTime']) / 1000
+        }
+    
     def place_order(self, order: TradeOrder) -> Optional[TradeExecution]:
         """Place order with Binance"""
         if not self.api:
@@ -329,7 +427,7 @@ class BinanceBroker(BrokerInterface):
             return []
         
         try:
-            account = self.api.get_account()
+            account = self._get_account_cached()
             positions = []
             
             for balance in account['balances']:
@@ -364,6 +462,9 @@ class BrokerManager:
     def __init__(self):
         self.brokers: Dict[str, BrokerInterface] = {}
         self.active_broker: Optional[BrokerInterface] = None
+        self.active_broker_name: Optional[str] = None  # Display name of active_broker, e.g. "Alpaca"
+        self.connected = False  # Some broker authenticated in the last connect_all
+        self._connection_results: Dict[str, bool] = {}
         
         # Try to load credentials from environment variables
         self._load_credentials()
@@ -393,18 +494,39 @@ class BrokerManager:
     def set_active_broker(self, name: str) -> bool:
         """Set the active broker for trading"""
         if name in self.brokers:
-            self.active_broker = self.brokers[name]
+            self._activate(self.brokers[name])
             return self.active_broker.authenticate()
         return False
     
-    def connect_all(self) -> Dict[str, bool]:
-        """Connect to all available brokers"""
+    def _activate(self, broker: BrokerInterface):
+        """Make broker the active one, naming it once rather than on every trade"""
+        self.active_broker = broker
+        self.active_broker_name = type(broker).__name__.replace('Broker', '')
+    
+    def connect_all(self, force: bool = False) -> Dict[str, bool]:
+        """Connect to all available brokers (force=True re-authenticates)"""
+        if not self.brokers:
+            return {}
+        if self.connected and not force:
+            return dict(self._connection_results)  # Already connected; reconnecting needs force=True
+        
+        # Authenticate concurrently so startup waits for the slowest broker,
+        # not the sum of every broker's round trip
+        with ThreadPoolExecutor(max_workers=len(self.brokers)) as pool:
+            futures = {
+                name: pool.submit(broker.authenticate, force=force)
+                for name, broker in self.brokers.items()
+            }
+        
+        # Pick the active broker in registration order, as before
         results = {}
-        for name, broker in self.brokers.items():
-            results[name] = broker.authenticate()
+        for name, future in futures.items():
+            results[name] = future.result()
             if results[name] and not self.active_broker:
-                self.active_broker = broker
-        return results
+                self._activate(self.brokers[name])
+        self._connection_results = results
+        self.connected = any(results.values())
+        return dict(results)
     
     def get_available_brokers(self) -> List[str]:
         """Get list of available brokers"""
@@ -418,6 +540,13 @@ class BrokerManager:
         
         return self.active_broker.place_order(order)
     
+    def get_market_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get market data for several symbols from active broker"""
+        if not self.active_broker:
+            return {}
+        
+        return self.active_broker.get_market_data_batch(symbols)
+    
     def get_account_status(self) -> Dict:
         """Get account status from active broker"""
         if not self.active_broker:
@@ -1,5 +1,6 @@
 import re
-from typing import List, Dict, Any
+import functools
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
 @dataclass
@@ -11,8 +12,15 @@ class Condition:
     value: float
     completed: bool = False
     current_value: float = None
+    symbol: Optional[str] = None  # None applies the condition to every symbol
 
 class ConditionParser:
+    # Compiled once for every parser instance
+    _TASK_PATTERN = re.compile(r'(?:(?:check if|when|if)\s+)?([^,.?!]+?)(?:\s*(?:$|[,.?!]))', re.IGNORECASE)
+    _TRIGGER_PATTERN = re.compile(
+        r'condition task list|task list|conditions|check if|trade conditions', re.IGNORECASE
+    )
+    
     def __init__(self):
         self.indicators = {
             'rsi': 'RSI',
@@ -38,6 +46,21 @@ class ConditionParser:
             'spike': '>',
             'drop': '<'
         }
+        
+        # One alternation over all indicator names, longest first so that
+        # 'volume' wins over 'vol' at the same position
+        indicator_keys = sorted(self.indicators, key=len, reverse=True)
+        self._indicator_re = re.compile('|'.join(re.escape(k) for k in indicator_keys), re.IGNORECASE)
+        
+        # One pattern for every operator/value form, scanned once per condition:
+        # "< 30", "above 50" (word operators) and "2x average"
+        keywords = '|'.join(re.escape(k) for k in self.operators if k.isalpha())
+        self._value_re = re.compile(
+            r'(?P<sym>[<>=]+)\s*(?P<n1>[\d.]+)'
+            rf'|(?P<kw>{keywords})\s*(?P<n2>[\d.]+)'
+            r'|(?P<mult>\d+)x\s*(?:average|avg)',
+            re.IGNORECASE
+        )
     
     def parse_task_list(self, input_text: str) -> List[Condition]:
         """Parse user's 'Condition Task List' input into structured conditions"""
@@ -48,8 +71,7 @@ class ConditionParser:
             return conditions
         
         # Extract conditions using regex matching
-        pattern = r'(?:(?:check if|when|if)\s+)?([^,.?!]+?)(?:\s*(?:$|[,.?!]))'
-        matches = re.findall(pattern, input_text, re.IGNORECASE)
+        matches = self._TASK_PATTERN.findall(input_text)
         
         for i, match in enumerate(matches):
             condition = self._parse_single_condition(match.strip(), f"task_{i+1}")
@@ -58,11 +80,11 @@ class ConditionParser:
         
         return conditions
     
-    def _is_condition_task_list(self, text: str) -> bool:
-        """Check if input is a Condition Task List"""
-        triggers = ['condition task list', 'task list', 'conditions', 'check if', 'trade conditions']
-        text_lower = text.lower()
-        return any(trigger in text_lower for trigger in triggers)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_condition_task_list(text: str) -> bool:
+        """Check if input is a Condition Task List (cached for repeated inputs)"""
+        return ConditionParser._TRIGGER_PATTERN.search(text) is not None
     
     def _parse_single_condition(self, condition_text: str, task_id: str) -> Condition:
         """Parse individual condition text into structured format"""
@@ -86,34 +108,24 @@ class ConditionParser:
     
     def _extract_indicator(self, text: str) -> str:
         """Extract technical indicator from condition text"""
-        text_lower = text.lower()
-        for key, value in self.indicators.items():
-            if key in text_lower:
-                return value
-        return None
+        match = self._indicator_re.search(text)
+        return self.indicators[match.group(0).lower()] if match else None
     
     def _extract_operator_and_value(self, text: str) -> tuple:
         """Extract comparison operator and value from condition text"""
         # Look for patterns like "< 30", "above 50", "2x average", etc.
+        match = self._value_re.search(text)
+        if not match:
+            return None, None
         
         # Direct comparison operators
-        match = re.search(r'([<>=]+)\s*([\d.]+)', text)
-        if match:
-            return match.group(1), float(match.group(2))
+        if match.group('sym'):
+            return match.group('sym'), float(match.group('n1'))
         
         # Text-based operators
-        for key, op in self.operators.items():
-            if key in text.lower():
-                # Extract number after the operator
-                pattern = rf'{re.escape(key)}\s*([\d.]+)'
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return op, float(match.group(1))
+        if match.group('kw'):
+            return self.operators[match.group('kw').lower()], float(match.group('n2'))
         
         # Handle special cases like "2x average"
-        match = re.search(r'(\d+)x\s*(?:average|avg)', text, re.IGNORECASE)
-        if match:
-            multiplier = float(match.group(1))
-            return '>', multiplier
-        
-        return None, None
+        multiplier = float(match.group('mult'))
+        return '>', multiplier
@@ -1,50 +1,327 @@
 import time
-from typing import List, Dict
+import operator
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 import threading
-import queue
+import numpy as np
 from condition_parser import Condition
+from production_logger import LocalQueueHandler
+
+try:
+    from numba import njit
+except ImportError:  # Optional JIT; the NumPy expression below is used instead
+    njit = None
+
+class _ForwardingHandler(logging.Handler):
+    """Hands records taken off the log queue to the handlers above this module's logger"""
+    
+    def handle(self, record):
+        logger.parent.handle(record)
+
+logger = logging.getLogger(__name__)
+
+# While a matcher runs, its thread only enqueues log records; a listener thread does the formatting and I/O
+_log_queue_lock = threading.Lock()
+_log_queue_users = 0
+_log_handler = None
+_log_listener = None
+
+def _acquire_log_queue():
+    """Route this module's records through a queue (the first running matcher starts the listener)"""
+    global _log_queue_users, _log_handler, _log_listener
+    with _log_queue_lock:
+        _log_queue_users += 1
+        if _log_queue_users > 1:
+            return
+        if any(isinstance(h, LocalQueueHandler) for h in logging.getLogger().handlers):
+            return  # ProductionLogger already queues every record; propagate straight to it
+        log_queue = queue.SimpleQueue()
+        _log_handler = LocalQueueHandler(log_queue)
+        _log_listener = logging.handlers.QueueListener(log_queue, _ForwardingHandler())
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        logger.addHandler(_log_handler)
+        logger.propagate = False
+
+def _release_log_queue():
+    """Undo _acquire_log_queue; the last matcher to stop drains the queue and stops the listener"""
+    global _log_queue_users, _log_handler, _log_listener
+    with _log_queue_lock:
+        _log_queue_users -= 1
+        if _log_queue_users > 0 or _log_listener is None:
+            return
+        logger.propagate = True
+        logger.removeHandler(_log_handler)
+        atexit.unregister(_log_listener.stop)
+        _log_listener.stop()
+        _log_handler = _log_listener = None
+
+ALL_SYMBOLS = '*'  # Index key for conditions without a symbol
+
+# Interned indicator names: Price and Volume are MarketData fields, the rest live in its indicators dict
+INDICATOR_IDS: Dict[str, int] = {}
+INDICATOR_NAMES: List[str] = []
+_indicator_lock = threading.Lock()
+
+def register_indicator(name: str) -> int:
+    """Return the integer ID for an indicator name, assigning the next one if it is new"""
+    indicator_id = INDICATOR_IDS.get(name)
+    if indicator_id is None:
+        with _indicator_lock:
+            indicator_id = INDICATOR_IDS.get(name)
+            if indicator_id is None:
+                indicator_id = INDICATOR_IDS[name] = len(INDICATOR_NAMES)
+                INDICATOR_NAMES.append(name)
+    return indicator_id
+
+PRICE_ID = register_indicator('Price')
+VOLUME_ID = register_indicator('Volume')
+
+# Integer codes used by the compiled (struct-of-arrays) condition set
+OPERATOR_IDS = {'<': 0, '>': 1, '<=': 2, '>=': 3}
+OPERATOR_FUNCS = {'<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge}
+_get_price = operator.attrgetter('price')
+_get_volume = operator.attrgetter('volume')
+
+def _never_met(current_value, target_value) -> bool:
+    """Operator function for unsupported operators"""
+    return False
+
+def _make_getter(indicator: str):
+    """Build a function extracting an indicator's value from MarketData (None when unavailable)"""
+    if indicator == 'Price':
+        return _get_price
+    if indicator == 'Volume':
+        return _get_volume
+    
+    def get_indicator(data):
+        indicators = data.indicators
+        return indicators.get(indicator) if indicators else None
+    return get_indicator
+
+def _no_indicators(name, default=None):
+    """Stand-in for dict.get when a tick carries no indicators"""
+    return default
 
-@dataclass
+def _build_specialized_evaluator(conditions: List[Condition]):
+    """Generate a function with this condition set's lookups and comparisons hard-coded.
+
+    The function takes (price, volume, indicators) and returns a tuple of completed
+    flags and a tuple of current values (NaN when an indicator is unavailable).
+    """
+    lines = ['def evaluate(price, volume, indicators):',
+             '    get = indicators.get if indicators else _no_indicators']
+    variables = {PRICE_ID: 'price', VOLUME_ID: 'volume'}
+    checks, values = [], []
+    for condition in conditions:
+        indicator_id = register_indicator(condition.indicator)
+        var = variables.get(indicator_id)
+        if var is None:  # Each distinct indicator is looked up once
+            var = variables[indicator_id] = f'v{indicator_id}'
+            lines.append(f'    {var} = get({condition.indicator!r}, nan)')
+        if condition.operator in OPERATOR_FUNCS:
+            checks.append(f'{var} {condition.operator} {float(condition.value)!r}')
+        else:
+            checks.append('False')
+        values.append(var)
+    lines.append('    return (%s), (%s)' % (''.join(f'{c}, ' for c in checks), ''.join(f'{v}, ' for v in values)))
+    
+    namespace = {'nan': float('nan'), 'inf': float('inf'), '_no_indicators': _no_indicators}
+    exec(compile('\n'.join(lines), '<conditions>', 'exec'), namespace)
+    return namespace['evaluate']
+
+def _call_all(callbacks: list, kind: str, *args):
+    """Call every callback in one guarded loop, reporting and skipping past any that raise"""
+    i = 0
+    while i < len(callbacks):
+        try:
+            for i in range(i, len(callbacks)):
+                callbacks[i](*args)
+            return
+        except Exception:
+            logger.exception("Error in %s callback %s", kind, getattr(callbacks[i], '__name__', callbacks[i]))
+            i += 1
+
+@dataclass(slots=True, frozen=True)
 class MarketData:
     symbol: str
     price: float
     volume: float
-    indicators: Dict[str, float] = field(default_factory=dict)
+    indicators: Optional[Dict[str, float]] = None  # None when the tick carries no indicators
     timestamp: float = field(default_factory=time.time)
 
+def _evaluate_vectorized(op_ids: np.ndarray, targets: np.ndarray, currents: np.ndarray) -> np.ndarray:
+    """Evaluate every compiled condition in one pass (NaN or unknown operators never match)"""
+    return (((op_ids == 0) & (currents < targets)) | ((op_ids == 1) & (currents > targets)) |
+            ((op_ids == 2) & (currents <= targets)) | ((op_ids == 3) & (currents >= targets)))
+
+if njit is not None:
+    @njit(cache=True)
+    def _eval_kernel(op_ids, targets, currents, completed_out):
+        """Compiled per-condition comparison loop"""
+        for i in range(op_ids.shape[0]):
+            v = currents[i]
+            t = targets[i]
+            op = op_ids[i]
+            if op == 0:
+                r = v < t
+            elif op == 1:
+                r = v > t
+            elif op == 2:
+                r = v <= t
+            elif op == 3:
+                r = v >= t
+            else:
+                r = False
+            completed_out[i] = r
+    
+    def _evaluate_jit(op_ids: np.ndarray, targets: np.ndarray, currents: np.ndarray) -> np.ndarray:
+        """Evaluate every compiled condition with the Numba kernel"""
+        completed = np.empty(op_ids.shape[0], dtype=np.bool_)
+        _eval_kernel(op_ids, targets, currents, completed)
+        return completed
+    
+    def _warm_up_kernel():
+        """Trigger JIT compilation (or cache load) before the first live tick"""
+        _evaluate_jit(np.zeros(1, dtype=np.int8), np.zeros(1), np.zeros(1))
+    
+    _evaluate_set = _evaluate_jit
+else:
+    def _warm_up_kernel():
+        pass
+    
+    _evaluate_set = _evaluate_vectorized
+
+class _CompiledConditions:
+    """Struct-of-arrays snapshot of the conditions for one symbol (or all symbols)"""
+    
+    def __init__(self, conditions: List[Condition], specialize: bool = True):
+        self.conditions = list(conditions)
+        self.ind_ids = np.asarray([register_indicator(c.indicator) for c in self.conditions], dtype=np.intp)
+        
+        # Each tick gathers price, volume, then every other distinct indicator once into a small
+        # value vector; slots maps each condition to its entry in that vector
+        dict_ids = sorted(set(self.ind_ids.tolist()) - {PRICE_ID, VOLUME_ID})
+        self.dict_indicators = tuple(INDICATOR_NAMES[i] for i in dict_ids)
+        position = {PRICE_ID: 0, VOLUME_ID: 1}
+        position.update((indicator_id, n) for n, indicator_id in enumerate(dict_ids, 2))
+        self.slots = np.asarray([position[i] for i in self.ind_ids.tolist()], dtype=np.intp)
+        
+        self.op_ids = np.asarray([OPERATOR_IDS.get(c.operator, -1) for c in self.conditions], dtype=np.int8)
+        self.targets = np.asarray([c.value for c in self.conditions], dtype=np.float64)
+        self.completed = np.asarray([c.completed for c in self.conditions], dtype=bool)
+        self.n_incomplete = len(self.conditions) - int(np.count_nonzero(self.completed))
+        self.currents = None
+        
+        # Scalar path: generated evaluator, with per-condition dispatch as the fallback
+        self.evaluator = _build_specialized_evaluator(self.conditions) if specialize else None
+        self.completed_flags = tuple(c.completed for c in self.conditions)
+        self.getters = [_make_getter(c.indicator) for c in self.conditions]
+        self.op_fns = [OPERATOR_FUNCS.get(c.operator, _never_met) for c in self.conditions]
+    
+    def current_values(self, data: 'MarketData') -> np.ndarray:
+        """Current value of each condition's indicator (NaN when unavailable)"""
+        values = [data.price, data.volume]
+        indicators = data.indicators
+        if indicators:
+            values.extend([indicators.get(name, np.nan) for name in self.dict_indicators])
+        else:
+            values.extend([np.nan] * len(self.dict_indicators))
+        return np.asarray(values, dtype=np.float64)[self.slots]
+    
+    def sync_current_values(self):
+        """Copy the last evaluated values back onto the Condition objects"""
+        currents = self.currents
+        if currents is None:
+            return
+        if isinstance(currents, np.ndarray):
+            currents = currents.tolist()  # One conversion instead of boxing a NumPy scalar per condition
+        for condition, value in zip(self.conditions, currents):
+            if value == value:  # Skip NaN (indicator unavailable)
+                condition.current_value = value
+
 class ConditionsMatcher:
+    VECTORIZE_MIN_CONDITIONS = 192 if njit is not None else 512  # Below this the generated evaluator is faster
+    
     def __init__(self):
         self.conditions: List[Condition] = []
         self.market_data: Dict[str, MarketData] = {}
-        self.task_queue = queue.Queue()
+        self._pending: Dict[str, MarketData] = {}  # Latest unprocessed tick per symbol
+        self._cv = threading.Condition()
         self.update_callbacks = []
         self.trade_executed_callbacks = []
         self.running = False
         self.matcher_thread = None
+        self._conditions_by_symbol: Dict[str, _CompiledConditions] = {}
+        self._indexed_count = 0
+        self._last_sig: Dict[str, Tuple] = {}  # Last evaluated tick contents per symbol
     
     def add_conditions(self, conditions: List[Condition]):
         """Add new conditions to track"""
         self.conditions.extend(conditions)
+        if self._indexed_count + len(conditions) == len(self.conditions):
+            self._index_conditions(conditions)
+        else:
+            self._compile_conditions()  # List was edited directly
         self._notify_update()
     
+    def clear_conditions(self):
+        """Remove all tracked conditions"""
+        self.conditions.clear()
+        self._compile_conditions()
+    
+    def _compile_conditions(self):
+        """Rebuild the per-symbol index from the full condition list"""
+        self._index_conditions(self.conditions, rebuild=True)
+    
+    def _index_conditions(self, conditions: List[Condition], rebuild: bool = False):
+        """Recompile only the symbol buckets that receive new conditions"""
+        added: Dict[str, List[Condition]] = {}
+        for condition in conditions:
+            added.setdefault(condition.symbol or ALL_SYMBOLS, []).append(condition)
+        
+        # Built aside and swapped in whole so the matcher thread never sees a partial index
+        by_symbol = {} if rebuild else dict(self._conditions_by_symbol)
+        for key, new_conditions in added.items():
+            existing = by_symbol.get(key)
+            group_conditions = (existing.conditions if existing else []) + new_conditions
+            vectorize = len(group_conditions) >= self.VECTORIZE_MIN_CONDITIONS
+            by_symbol[key] = _CompiledConditions(group_conditions, specialize=not vectorize)
+            if vectorize:
+                _warm_up_kernel()
+        
+        self._conditions_by_symbol = by_symbol
+        self._indexed_count = len(conditions) if rebuild else self._indexed_count + len(conditions)
+        self._last_sig = {}  # Condition sets changed, so every symbol must be re-evaluated
+    
     def update_market_data(self, symbol: str, data: MarketData):
         """Update market data for a symbol"""
         self.market_data[symbol] = data
-        self.task_queue.put(('update', symbol, data))
+        with self._cv:
+            self._pending[symbol] = data  # Overwrite any tick not yet evaluated
+            self._cv.notify()
     
     def start_matching(self):
         """Start the background matching process"""
         if not self.running:
+            _acquire_log_queue()
             self.running = True
             self.matcher_thread = threading.Thread(target=self._matching_loop, daemon=True)
             self.matcher_thread.start()
     
     def stop_matching(self):
         """Stop the matching process"""
-        self.running = False
+        with self._cv:
+            was_running, self.running = self.running, False
+            self._cv.notify()  # Wake the waiting matcher thread
         if self.matcher_thread:
             self.matcher_thread.join()
+        if was_running:
+            _release_log_queue()
     
     def register_update_callback(self, callback):
         """Register callback for condition updates"""
@@ -58,98 +335,137 @@ class ConditionsMatcher:
         """Main loop for evaluating conditions"""
         while self.running:
             try:
-                # Process any pending updates
-                while not self.task_queue.empty():
-                    action, symbol, data = self.task_queue.get_nowait()
-                    if action == 'update':
-                        self._evaluate_conditions_for_symbol(symbol, data)
+                # Sleep until an update arrives, then take every pending symbol at once
+                with self._cv:
+                    while self.running and not self._pending:
+                        self._cv.wait()
+                    pending, self._pending = self._pending, {}
                 
-                time.sleep(0.1)  # Check 10 times per second
+                for symbol, data in pending.items():
+                    self._evaluate_conditions_for_symbol(symbol, data)
                 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Error in matching loop: {e}")
+            except Exception:
+                logger.exception("Error in matching loop")
     
     def _evaluate_conditions_for_symbol(self, symbol: str, data: MarketData):
         """Evaluate all conditions for a given symbol"""
-        conditions_updated = False
-        all_completed = True
+        if self._indexed_count != len(self.conditions):  # List was edited directly
+            self._compile_conditions()
         
-        for condition in self.conditions:
-            if self._condition_applies_to_symbol(condition, symbol):
-                was_completed = condition.completed
-                condition.completed = self._evaluate_condition(condition, data)
-                
-                if condition.completed != was_completed:
-                    conditions_updated = True
-                
-                if not condition.completed:
-                    all_completed = False
+        # Skip ticks identical to the last one evaluated (e.g. resent unchanged quotes)
+        indicators = data.indicators
+        sig = (data.price, data.volume, tuple(indicators.items()) if indicators else None)
+        last_sig = self._last_sig
+        if last_sig.get(symbol) == sig:
+            return
+        last_sig[symbol] = sig
+        
+        by_symbol = self._conditions_by_symbol
+        groups = [group for group in (by_symbol.get(symbol), by_symbol.get(ALL_SYMBOLS)) if group]
+        if not groups:
+            return
+        
+        conditions_updated = False
+        for group in groups:
+            if len(group.conditions) >= self.VECTORIZE_MIN_CONDITIONS:
+                conditions_updated |= self._evaluate_compiled(group, data)
+            else:
+                conditions_updated |= self._evaluate_scalar(group, data)
         
         # Notify handlers
         if conditions_updated:
             self._notify_update()
         
-        if all_completed and self.conditions:
+        if all(group.n_incomplete == 0 for group in groups):
             self._execute_trade(symbol)
     
-    def _condition_applies_to_symbol(self, condition: Condition, symbol: str) -> bool:
-        """Check if condition applies to given symbol (for now, all apply)"""
-        return True  # Could be extended to symbol-specific conditions
+    def _evaluate_scalar(self, group: _CompiledConditions, data: MarketData) -> bool:
+        """Evaluate a small condition set with its generated evaluator"""
+        try:
+            completed, currents = group.evaluator(data.price, data.volume, data.indicators)
+        except Exception:
+            return self._evaluate_each(group, data)  # e.g. a non-numeric indicator value
+        
+        group.currents = currents
+        if completed == group.completed_flags:
+            return False
+        
+        for condition, is_completed in zip(group.conditions, completed):
+            if condition.completed != is_completed:
+                condition.completed = is_completed
+                group.n_incomplete += -1 if is_completed else 1
+        group.completed_flags = completed
+        return True
+    
+    def _evaluate_each(self, group: _CompiledConditions, data: MarketData) -> bool:
+        """Evaluate a condition set one condition at a time"""
+        group.currents = None  # current_value is written directly below
+        conditions_updated = False
+        for condition, getter, op_fn in zip(group.conditions, group.getters, group.op_fns):
+            was_completed = condition.completed
+            condition.completed = self._evaluate_condition(condition, data, getter, op_fn)
+            
+            if condition.completed != was_completed:
+                conditions_updated = True
+                group.n_incomplete += -1 if condition.completed else 1
+        
+        group.completed_flags = tuple(c.completed for c in group.conditions)
+        return conditions_updated
+    
+    def _evaluate_compiled(self, group: _CompiledConditions, data: MarketData) -> bool:
+        """Evaluate a compiled condition set, syncing Condition objects only on change"""
+        currents = group.current_values(data)
+        completed = _evaluate_set(group.op_ids, group.targets, currents)
+        
+        changed = np.flatnonzero(completed != group.completed)
+        for i in changed.tolist():
+            group.conditions[i].completed = bool(completed[i])
+        
+        group.completed = completed
+        group.currents = currents
+        group.n_incomplete = len(group.conditions) - int(np.count_nonzero(completed))
+        return changed.size > 0
     
-    def _evaluate_condition(self, condition: Condition, data: MarketData) -> bool:
+    def _evaluate_condition(self, condition: Condition, data: MarketData, getter, op_fn) -> bool:
         """Evaluate if a single condition is met"""
-        current_value = None
-        
-        # Get the current value based on indicator type
-        if condition.indicator == 'Price':
-            current_value = data.price
-        elif condition.indicator == 'Volume':
-            current_value = data.volume
-        elif condition.indicator in data.indicators:
-            current_value = data.indicators[condition.indicator]
-        else:
+        current_value = getter(data)
+        if current_value is None:
             return False  # Indicator not available
         
         condition.current_value = current_value
         
         # Evaluate the condition
         try:
-            if condition.operator == '<':
-                return current_value < condition.value
-            elif condition.operator == '>':
-                return current_value > condition.value
-            elif condition.operator == '<=':
-                return current_value <= condition.value
-            elif condition.operator == '>=':
-                return current_value >= condition.value
-            else:
-                return False
+            return op_fn(current_value, condition.value)
         except Exception as e:
-            print(f"Error evaluating condition: {e}")
+            logger.error("Error evaluating condition %s: %s", condition.task_id, e)
             return False
     
     def _notify_update(self):
         """Notify all registered callbacks of updates"""
-        for callback in self.update_callbacks:
-            try:
-                callback(self.conditions)
-            except Exception as e:
-                print(f"Error in update callback: {e}")
+        self._sync_current_values()
+        _call_all(self.update_callbacks, 'update', self.conditions)
     
     def _execute_trade(self, symbol: str):
         """Execute trade when all conditions are met"""
-        print(f"🚀 ALL CONDITIONS MET! Executing trade on {symbol}")
-        
-        for callback in self.trade_executed_callbacks:
-            try:
-                callback(symbol, self.conditions)
-            except Exception as e:
-                print(f"Error in trade callback: {e}")
+        logger.info("🚀 ALL CONDITIONS MET! Executing trade on %s", symbol)
+        self._sync_current_values()
+        _call_all(self.trade_executed_callbacks, 'trade', symbol, self.conditions)
+    
+    @property
+    def unmet_count(self) -> int:
+        """Number of tracked conditions not currently met (kept as a running count per bucket)"""
+        return sum(group.n_incomplete for group in self._conditions_by_symbol.values())
+    
+    def _sync_current_values(self):
+        """Copy vectorized evaluation results back onto the Condition objects"""
+        for group in self._conditions_by_symbol.values():
+            group.sync_current_values()
     
-    def get_conditions_status(self) -> List[Dict]:
-        """Get current status of all conditions"""
+    def get_conditions_status(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get current status of all conditions (or only the first `limit`)"""
+        self._sync_current_values()
+        conditions = self.conditions if limit is None else self.conditions[:limit]
         return [
             {
                 'task_id': c.task_id,
@@ -161,7 +477,7 @@ class ConditionsMatcher:
                 'completed': c.completed,
                 'status': '✅' if c.completed else '⏳'
             }
-            for c in self.conditions
+            for c in conditions
         ]
     
     def reset_conditions(self):
@@ -169,4 +485,5 @@ class ConditionsMatcher:
         for condition in self.conditions:
             condition.completed = False
             condition.current_value = None
+        self._compile_conditions()
         self._notify_update()
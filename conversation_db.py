@@ -5,9 +5,13 @@ Stores, analyzes, and learns from all user interactions
 
 import os
 import psycopg2
-from psycopg2.extras import Json, DictCursor
+from psycopg2.extras import Json, DictCursor, execute_values, execute_batch
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
 import json
 import time
+import threading
+import weakref
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, asdict
 import hashlib
@@ -45,9 +49,38 @@ class Conversation:
 class ConversationDatabase:
     """PostgreSQL database for conversation archiving and learning"""
     
+    TURN_BATCH_SIZE = 50  # Flush buffered turns once this many are waiting
+    TURN_FLUSH_INTERVAL = 2.0  # ...or when this many seconds have passed since the last flush
+    POOL_MIN_CONNECTIONS = 0  # No idle connections are kept; hold_connection() reuses one per worker
+    POOL_MAX_CONNECTIONS = 8
+    # TCP keepalives stop idle pooled connections from being dropped silently by firewalls/NAT
+    CONNECTION_OPTIONS = {'keepalives': 1, 'keepalives_idle': 60, 'keepalives_interval': 10, 'keepalives_count': 3}
+    EMBEDDING_DIM = 1536  # Width of the VECTOR columns; shorter embeddings are zero-padded
+    HYBRID_CANDIDATES = 20  # Results taken from each leg of a hybrid search before fusion
+    RRF_K = 60  # Reciprocal rank fusion constant
+    EVICT_AFTER_DAYS = 90  # Conversations not retrieved for this long are deleted by evict_unused
+    
+    # Hot statements, prepared once per pooled connection
+    PREPARED_STATEMENTS = (
+        """PREPARE start_conv(text, jsonb) AS
+           INSERT INTO conversations (topic_summary, tags) VALUES ($1, $2) RETURNING session_id""",
+        """PREPARE ins_turn(uuid, text, text, int, jsonb, jsonb, vector) AS
+           INSERT INTO conversation_turns
+           (session_id, user_input, ai_response, turn_number, context, metadata, user_input_embedding)
+           VALUES ($1, $2, $3, $4, $5, $6, $7)""",
+        """PREPARE end_conv(jsonb, uuid) AS
+           UPDATE conversations SET end_time = NOW(), outcomes = $1, updated_at = NOW()
+           WHERE session_id = $2""",
+    )
+    
     def __init__(self, database_url: str = None):
         self.database_url = database_url or self._get_default_db_url()
-        self.connection = None
+        self._pool = None
+        self._prepared_conns = weakref.WeakSet()
+        self._held = threading.local()  # Connection kept by a thread inside hold_connection()
+        self._pending_turns = []
+        self._turns_lock = threading.Lock()
+        self._last_flush = time.monotonic()
         self._initialize_database()
     
     def _get_default_db_url(self) -> str:
@@ -62,13 +95,16 @@ class ConversationDatabase:
     def _initialize_database(self):
         """Connect to database and create tables if needed"""
         try:
-            self.connection = psycopg2.connect(self.database_url)
-            self.connection.autocommit = True
+            self._pool = ThreadedConnectionPool(self.POOL_MIN_CONNECTIONS, self.POOL_MAX_CONNECTIONS,
+                                                self.database_url, **self.CONNECTION_OPTIONS)
             
-            with self.connection.cursor() as cursor:
+            with self._conn() as conn, conn.cursor() as cursor:
                 # Enable uuid-ossp for session IDs
                 cursor.execute("CREATE EXTENSION IF NOT EXISTS \"uuid-ossp\"")
                 
+                # Enable pgvector for the embedding columns
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                
                 # Create conversations table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS conversations (
@@ -115,13 +151,41 @@ class ConversationDatabase:
                     )
                 """)
                 
+                # Persist the full-text vector so similarity search can use an index
+                cursor.execute("""
+                    ALTER TABLE conversation_turns ADD COLUMN IF NOT EXISTS fts tsvector
+                    GENERATED ALWAYS AS (
+                        to_tsvector('english', coalesce(user_input, '') || ' ' || coalesce(ai_response, ''))
+                    ) STORED
+                """)
+                
+                # Track reuse so conversations that are never retrieved can be evicted.
+                # Rows that predate the counter get the upgrade time as their tracking start,
+                # so their age is measured from when retrievals began to be counted
+                cursor.execute("""
+                    ALTER TABLE conversations
+                    ADD COLUMN IF NOT EXISTS times_retrieved INTEGER DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS last_retrieved_at TIMESTAMP WITH TIME ZONE,
+                    ADD COLUMN IF NOT EXISTS retrieval_tracked_since TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+                """)
+                
                 # Create indexes for performance
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_conversations_start_time ON conversations(start_time)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_conversations_tags ON conversations USING GIN(tags)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_turns_session_id ON conversation_turns(session_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_turns_timestamp ON conversation_turns(timestamp)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_turns_fts ON conversation_turns USING GIN(fts)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_patterns_type ON learning_patterns(pattern_type)")
                 
+                # Approximate nearest-neighbour indexes for embedding search
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_conversations_emb ON conversations USING hnsw (embedding vector_cosine_ops)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_turns_user_emb ON conversation_turns USING hnsw (user_input_embedding vector_cosine_ops)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_turns_ai_emb ON conversation_turns USING hnsw (ai_response_embedding vector_cosine_ops)")
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS ux_patterns_type_data
+                    ON learning_patterns(pattern_type, md5(pattern_data::text))
+                """)
+                
             print("✅ PostgreSQL database initialized successfully")
             
         except psycopg2.OperationalError as e:
@@ -131,44 +195,115 @@ class ConversationDatabase:
             print("   2. Or set DATABASE_URL environment variable")
             raise
     
+    @contextmanager
+    def _conn(self, prepared: bool = False):
+        """Borrow a pooled connection, committing on success and rolling back on error"""
+        holding = getattr(self._held, 'active', False)
+        conn = getattr(self._held, 'conn', None) if holding else None
+        if conn is None or conn.closed:
+            if conn is not None:  # A held connection that broke is replaced
+                self._held.conn = None
+                self._pool.putconn(conn, close=True)
+            conn = self._pool.getconn()
+            if holding:
+                self._held.conn = conn
+        try:
+            if prepared and conn not in self._prepared_conns:
+                with conn.cursor() as cursor:
+                    cursor.execute("DEALLOCATE ALL")  # Clear any half-finished earlier attempt
+                    for statement in self.PREPARED_STATEMENTS:
+                        cursor.execute(statement)
+                self._prepared_conns.add(conn)
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            # Broken connections are discarded so the pool reconnects
+            if not holding:
+                self._pool.putconn(conn, close=bool(conn.closed))
+    
+    @contextmanager
+    def hold_connection(self):
+        """Reuse one connection for this thread's calls until the block ends, then close it"""
+        self._held.active = True
+        try:
+            yield
+        finally:
+            self._held.active = False
+            conn, self._held.conn = getattr(self._held, 'conn', None), None
+            if conn is not None and not self._pool.closed:  # close() may have closed the pool meanwhile
+                self._pool.putconn(conn, close=True)
+    
     def start_conversation(self, topic_summary: str = None, tags: List[str] = None) -> str:
         """Start a new conversation session"""
-        with self.connection.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO conversations (topic_summary, tags)
-                VALUES (%s, %s)
-                RETURNING session_id
-            """, (topic_summary, Json(tags or [])))
+        with self._conn(prepared=True) as conn, conn.cursor() as cursor:
+            cursor.execute("EXECUTE start_conv(%s, %s)", (topic_summary, Json(tags or [])))
             
             session_id = cursor.fetchone()[0]
             print(f"🗃️ Started conversation session: {session_id}")
             return str(session_id)
     
     def add_turn(self, session_id: str, user_input: str, ai_response: str, 
-                 turn_number: int = 1, context: Dict = None, metadata: Dict = None):
-        """Add a conversation turn to the database"""
-        with self.connection.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO conversation_turns 
-                (session_id, user_input, ai_response, turn_number, context, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (session_id, user_input, ai_response, turn_number, 
-                  Json(context or {}), Json(metadata or {})))
+                 turn_number: int = 1, context: Dict = None, metadata: Dict = None,
+                 embedding: Optional[List[float]] = None):
+        """Add a conversation turn (buffered and written in batches)"""
+        with self._turns_lock:
+            self._pending_turns.append((session_id, user_input, ai_response, turn_number, context, metadata, embedding))
+            flush_due = (len(self._pending_turns) >= self.TURN_BATCH_SIZE or
+                         time.monotonic() - self._last_flush >= self.TURN_FLUSH_INTERVAL)
+        
+        if flush_due:
+            self.flush()
+    
+    def add_turns_batch(self, rows: List[tuple]):
+        """Insert many (session_id, user_input, ai_response, turn_number, context, metadata, embedding) rows at once"""
+        if not rows:
+            return
+        
+        with self._conn(prepared=True) as conn, conn.cursor() as cursor:
+            execute_batch(cursor, "EXECUTE ins_turn(%s, %s, %s, %s, %s, %s, %s)",
+                          [(session_id, user_input, ai_response, turn_number, Json(context or {}), Json(metadata or {}),
+                            self._vector_literal(embedding))
+                           for session_id, user_input, ai_response, turn_number, context, metadata, embedding in rows],
+                          page_size=500)
+    
+    @classmethod
+    def _vector_literal(cls, embedding: Optional[List[float]]) -> Optional[str]:
+        """Format an embedding as a pgvector literal, zero-padded to the column width"""
+        if embedding is None:
+            return None
+        values = [str(float(x)) for x in embedding]
+        values += ['0'] * (cls.EMBEDDING_DIM - len(values))  # Padding leaves cosine distance unchanged
+        return '[' + ','.join(values) + ']'
+    
+    def flush(self):
+        """Write any buffered conversation turns to the database"""
+        with self._turns_lock:
+            rows, self._pending_turns = self._pending_turns, []
+            self._last_flush = time.monotonic()
+        
+        try:
+            self.add_turns_batch(rows)
+        except Exception:
+            # Keep the turns for the next flush rather than dropping them
+            with self._turns_lock:
+                self._pending_turns[:0] = rows
+            raise
     
     def end_conversation(self, session_id: str, outcomes: Dict = None):
         """Mark conversation as ended with outcomes"""
-        with self.connection.cursor() as cursor:
-            cursor.execute("""
-                UPDATE conversations 
-                SET end_time = NOW(), outcomes = %s, updated_at = NOW()
-                WHERE session_id = %s
-            """, (Json(outcomes or {}), session_id))
+        self.flush()
+        with self._conn(prepared=True) as conn, conn.cursor() as cursor:
+            cursor.execute("EXECUTE end_conv(%s, %s)", (Json(outcomes or {}), session_id))
     
     def get_conversation_history(self, limit: int = 10, 
                                topic_filter: str = None,
                                tag_filter: str = None) -> List[Dict]:
         """Retrieve recent conversation history with filtering"""
-        with self.connection.cursor(cursor_factory=DictCursor) as cursor:
+        with self._conn() as conn, conn.cursor(cursor_factory=DictCursor) as cursor:
             query = """
                 SELECT c.session_id, c.start_time, c.topic_summary, c.tags, c.outcomes,
                        COUNT(t.id) as turn_count
@@ -190,28 +325,89 @@ class ConversationDatabase:
             params.append(limit)
             
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            history = [dict(row) for row in cursor.fetchall()]
+            if history:
+                self._count_retrievals(cursor, history)
+            return history
     
-    def find_similar_conversations(self, query_text: str, limit: int = 5) -> List[Dict]:
-        """Find conversations with similar content (using text similarity for now)"""
-        with self.connection.cursor(cursor_factory=DictCursor) as cursor:
-            # Using text search for similarity (would be better with embeddings)
-            cursor.execute("""
-                SELECT DISTINCT c.session_id, c.topic_summary, c.start_time,
-                       ts_rank_cd(to_tsvector(text), query) as similarity
-                FROM conversations c
-                JOIN conversation_turns t ON c.session_id = t.session_id,
-                     plainto_tsquery(%s) query
-                WHERE to_tsvector(t.user_input || ' ' || t.ai_response) @@ query
-                ORDER BY similarity DESC
-                LIMIT %s
-            """, (query_text, limit))
+    @staticmethod
+    def _count_retrievals(cursor, rows: List[Dict]):
+        """Record that the given conversations were read, in one statement"""
+        cursor.execute("""
+            UPDATE conversations
+            SET times_retrieved = times_retrieved + 1, last_retrieved_at = NOW()
+            WHERE session_id = ANY(%s::uuid[])
+        """, ([str(row['session_id']) for row in rows],))
+    
+    def find_similar_conversations(self, query_text: str, limit: int = 5,
+                                   embedding: Optional[List[float]] = None) -> List[Dict]:
+        """Find conversations with similar content (hybrid text + embedding search when an embedding is given)"""
+        with self._conn() as conn, conn.cursor(cursor_factory=DictCursor) as cursor:
+            if embedding is None:
+                return self._text_search(cursor, query_text, limit)
             
-            return [dict(row) for row in cursor.fetchall()]
+            # Keyword and vector legs catch exact terms and conceptual matches respectively
+            keyword_hits = self._text_search(cursor, query_text, self.HYBRID_CANDIDATES)
+            vector_hits = self._vector_search(cursor, self._vector_literal(embedding), self.HYBRID_CANDIDATES)
+            return self._rrf_merge((keyword_hits, vector_hits), limit)
+    
+    @staticmethod
+    def _text_search(cursor, query_text: str, limit: int) -> List[Dict]:
+        """Rank conversations by full-text match on the indexed fts column"""
+        cursor.execute("""
+            SELECT c.session_id, c.topic_summary, c.start_time,
+                   MAX(ts_rank_cd(t.fts, query)) as similarity
+            FROM conversations c
+            JOIN conversation_turns t ON c.session_id = t.session_id,
+                 plainto_tsquery('english', %s) query
+            WHERE t.fts @@ query
+            GROUP BY c.session_id, c.topic_summary, c.start_time
+            ORDER BY similarity DESC
+            LIMIT %s
+        """, (query_text, limit))
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def _vector_search(cursor, vector: str, limit: int) -> List[Dict]:
+        """Rank conversations by cosine distance on the HNSW-indexed turn embeddings"""
+        # Over-fetch turns, keep the best per session
+        cursor.execute("""
+            SELECT c.session_id, c.topic_summary, c.start_time,
+                   1 - MIN(t.distance) as similarity
+            FROM (
+                SELECT session_id, user_input_embedding <=> %s::vector as distance
+                FROM conversation_turns
+                WHERE user_input_embedding IS NOT NULL
+                ORDER BY user_input_embedding <=> %s::vector
+                LIMIT %s
+            ) t
+            JOIN conversations c ON c.session_id = t.session_id
+            GROUP BY c.session_id, c.topic_summary, c.start_time
+            ORDER BY similarity DESC
+            LIMIT %s
+        """, (vector, vector, limit * 10, limit))
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @classmethod
+    def _rrf_merge(cls, rankings, limit: int) -> List[Dict]:
+        """Combine ranked result lists with reciprocal rank fusion"""
+        scores = {}
+        rows = {}
+        for ranking in rankings:
+            for rank, row in enumerate(ranking, start=1):
+                session_id = row['session_id']
+                scores[session_id] = scores.get(session_id, 0.0) + 1.0 / (cls.RRF_K + rank)
+                rows.setdefault(session_id, row)
+        
+        best = sorted(scores, key=scores.get, reverse=True)[:limit]
+        return [dict(rows[session_id], similarity=scores[session_id]) for session_id in best]
     
     def learn_patterns(self, session_id: str):
         """Analyze conversation to extract learning patterns"""
-        with self.connection.cursor(cursor_factory=DictCursor) as cursor:
+        self.flush()
+        with self._conn() as conn, conn.cursor(cursor_factory=DictCursor) as cursor:
             # Get conversation turns
             cursor.execute("""
                 SELECT user_input, ai_response, context, metadata
@@ -241,22 +437,31 @@ class ConversationDatabase:
                         'context': turn.get('context', {})
                     })
             
-            # Store learned patterns
+            # Store learned patterns, folding repeats within this conversation into one row
+            # (a single upsert statement may not touch the same row twice)
+            rows = {}
             for pattern in patterns_found:
-            cursor.execute("""
-                INSERT INTO learning_patterns (pattern_type, pattern_data, frequency)
-                VALUES (%s, %s, 1)
-                ON CONFLICT (pattern_type, pattern_data) 
-                DO UPDATE SET frequency = learning_patterns.frequency + 1,
-                            updated_at = NOW(),
-                            effectiveness_score = GREATEST(learning_patterns.effectiveness_score, 0.5)
-            """, (pattern['type'], Json(pattern)))
+                key = (pattern['type'], json.dumps(pattern, sort_keys=True, default=str))
+                if key in rows:
+                    rows[key][2] += 1
+                else:
+                    rows[key] = [pattern['type'], Json(pattern), 1]
+            
+            if rows:
+                execute_values(cursor, """
+                    INSERT INTO learning_patterns (pattern_type, pattern_data, frequency)
+                    VALUES %s
+                    ON CONFLICT (pattern_type, md5(pattern_data::text)) 
+                    DO UPDATE SET frequency = learning_patterns.frequency + EXCLUDED.frequency,
+                                updated_at = NOW(),
+                                effectiveness_score = GREATEST(learning_patterns.effectiveness_score, 0.5)
+                """, [tuple(row) for row in rows.values()])
             
             print(f"🧠 Learned {len(patterns_found)} patterns from conversation")
     
     def get_learning_insights(self) -> Dict:
         """Get insights from learned patterns"""
-        with self.connection.cursor(cursor_factory=DictCursor) as cursor:
+        with self._conn() as conn, conn.cursor(cursor_factory=DictCursor) as cursor:
             cursor.execute("""
                 SELECT pattern_type, COUNT(*) as frequency, 
                        AVG(effectiveness_score) as avg_effectiveness
@@ -286,9 +491,9 @@ class ConversationDatabase:
                 'pattern_insights': [dict(row) for row in pattern_stats]
             }
     
-    def get_context_for_query(self, query: str) -> Dict:
+    def get_context_for_query(self, query: str, embedding: Optional[List[float]] = None) -> Dict:
         """Get relevant context from previous conversations for new query"""
-        similar = self.find_similar_conversations(query, limit=3)
+        similar = self.find_similar_conversations(query, limit=3, embedding=embedding)
         
         context = {
             'similar_conversations': similar,
@@ -296,8 +501,11 @@ class ConversationDatabase:
             'suggested_approaches': []
         }
         
-        # Get recent relevant patterns
-        with self.connection.cursor(cursor_factory=DictCursor) as cursor:
+        with self._conn() as conn, conn.cursor(cursor_factory=DictCursor) as cursor:
+            if similar:
+                self._count_retrievals(cursor, similar)
+            
+            # Get recent relevant patterns
             cursor.execute("""
                 SELECT pattern_type, pattern_data, frequency
                 FROM learning_patterns
@@ -310,35 +518,113 @@ class ConversationDatabase:
             
         return context
     
+    def evict_unused(self, max_age_days: int = None) -> int:
+        """Delete ended conversations not retrieved within max_age_days of tracking starting"""
+        # One statement, so the turns deleted are exactly those of the conversations deleted:
+        # a conversation retrieved meanwhile fails the re-checked WHERE and keeps both.
+        # The foreign key is checked at the end of the statement, after the turns are gone
+        evict = """
+            WITH gone AS (
+                DELETE FROM conversations
+                WHERE times_retrieved = 0 AND end_time IS NOT NULL
+                  AND retrieval_tracked_since < NOW() - %s * INTERVAL '1 day'
+                RETURNING session_id
+            ), gone_turns AS (
+                DELETE FROM conversation_turns WHERE session_id IN (SELECT session_id FROM gone)
+            )
+            SELECT COUNT(*) FROM gone
+        """
+        days = self.EVICT_AFTER_DAYS if max_age_days is None else max_age_days
+        with self._conn() as conn, conn.cursor() as cursor:
+            cursor.execute(evict, (days,))
+            evicted = cursor.fetchone()[0]
+        
+        if evicted:
+            print(f"🧹 Evicted {evicted} unused conversations older than {days} days")
+        return evicted
+    
     def export_data(self, filepath: str):
-        """Export conversation data to JSON file"""
-        with self.connection.cursor(cursor_factory=DictCursor) as cursor:
+        """Export conversation data to JSON file, streaming one conversation at a time"""
+        self.flush()
+        turn_columns = ('turn_number', 'user_input', 'ai_response', 'timestamp', 'context', 'metadata')
+        exported = 0
+        
+        with self._conn() as conn, \
+                conn.cursor(name='export_conversations', cursor_factory=DictCursor) as cursor, \
+                open(filepath, 'w') as f:
+            cursor.itersize = 500  # Rows fetched per round trip from the server-side cursor
             cursor.execute("""
-                SELECT c.*, 
-                       JSON_AGG(
-                           JSON_BUILD_OBJECT(
-                               'turn_number', t.turn_number,
-                               'user_input', t.user_input,
-                               'ai_response', t.ai_response,
-                               'timestamp', t.timestamp,
-                               'context', t.context,
-                               'metadata', t.metadata
-                           ) ORDER BY t.turn_number
-                       ) as turns
+                SELECT c.*, %s
                 FROM conversations c
                 LEFT JOIN conversation_turns t ON c.session_id = t.session_id
-                GROUP BY c.session_id
-                ORDER BY c.start_time DESC
-            """)
+                ORDER BY c.start_time DESC, c.session_id, t.turn_number
+            """ % ', '.join(f't.{col} AS "turn.{col}"' for col in turn_columns))
             
-            data = cursor.fetchall()
+            f.write('[')
+            for conversation in self._group_conversation_rows(cursor, turn_columns):
+                f.write(',\n' if exported else '\n')
+                json.dump(conversation, f, indent=2, default=str)
+                exported += 1
+            f.write('\n]\n')
+        
+        print(f"📁 Exported {exported} conversations to {filepath}")
+    
+    # Columns dumped by export_csv / loaded by import_csv (the generated fts column is rebuilt on load)
+    # retrieval_tracked_since is left out so imported rows start a fresh eviction grace period
+    CSV_TABLES = (
+        ('conversations', ('session_id', 'start_time', 'end_time', 'topic_summary', 'tags', 'outcomes',
+                           'embedding', 'created_at', 'updated_at', 'times_retrieved', 'last_retrieved_at')),
+        ('conversation_turns', ('id', 'session_id', 'user_input', 'ai_response', 'timestamp', 'turn_number',
+                                'context', 'metadata', 'user_input_embedding', 'ai_response_embedding',
+                                'created_at')),
+    )
+    
+    def export_csv(self, directory: str):
+        """Dump conversations and turns to <table>.csv files with COPY"""
+        self.flush()
+        os.makedirs(directory, exist_ok=True)
+        
+        with self._conn() as conn, conn.cursor() as cursor:
+            for table, columns in self.CSV_TABLES:
+                order = 'session_id, turn_number' if table == 'conversation_turns' else 'start_time'
+                with open(os.path.join(directory, f"{table}.csv"), 'w', newline='') as f:
+                    cursor.copy_expert(
+                        f"COPY (SELECT {', '.join(columns)} FROM {table} ORDER BY {order}) "
+                        "TO STDOUT WITH (FORMAT csv, HEADER true)", f)
+        
+        print(f"📁 Exported conversation tables to {directory}")
+    
+    def import_csv(self, directory: str):
+        """Load <table>.csv files written by export_csv with COPY (rows must not already exist)"""
+        with self._conn() as conn, conn.cursor() as cursor:
+            for table, columns in self.CSV_TABLES:  # Conversations first for the foreign key
+                with open(os.path.join(directory, f"{table}.csv"), newline='') as f:
+                    cursor.copy_expert(
+                        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, HEADER true)", f)
+        
+        print(f"📥 Imported conversation tables from {directory}")
+    
+    @staticmethod
+    def _group_conversation_rows(rows, turn_columns):
+        """Fold joined conversation/turn rows (ordered by session) into nested conversation dicts"""
+        conversation = None
+        for row in rows:
+            if conversation is None or row['session_id'] != conversation['session_id']:
+                if conversation is not None:
+                    yield conversation
+                conversation = {key: row[key] for key in row.keys() if not key.startswith('turn.')}
+                conversation['turns'] = []
             
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            if row['turn.turn_number'] is not None:  # LEFT JOIN row for a conversation without turns
+                conversation['turns'].append({col: row[f'turn.{col}'] for col in turn_columns})
         
-        print(f"📁 Exported {len(data)} conversations to {filepath}")
+        if conversation is not None:
+            yield conversation
     
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+        """Flush buffered turns and close all pooled connections"""
+        if self._pool:
+            try:
+                self.flush()
+            finally:
+                self._pool.closeall()
@@ -4,26 +4,76 @@ Integrates PostgreSQL archiving with real-time learning and context enhancement
 """
 
 import os
+import re
 import time
 import json
+import functools
+from collections import OrderedDict, deque
 from typing import Dict, List, Optional
 from datetime import datetime
 from conversation_db import ConversationDatabase, Conversation, ConversationTurn
 import threading
-import queue
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional: similarity search falls back to full-text search
+    SentenceTransformer = None
+
+TRADING_KEYWORDS = frozenset({'trade', 'market', 'stock', 'price', 'rsi', 'volume', 'broker'})
+INDICATOR_KEYWORDS = ('rsi', 'sma', 'ema', 'macd', 'bollinger', 'volume')  # Ordered for reporting
+QUESTION_WORDS = frozenset({'how', 'what', 'why'})
+SETUP_WORDS = frozenset({'help', 'install', 'setup'})
+ACTION_EMOJIS = frozenset('✅🎯📋')
+
+_WORD_PATTERN = re.compile(r'[a-z]+')
+_NUMBER_PATTERN = re.compile(r'\d+\.?\d*')
+
+def _build_keyword_scanner():
+    """Generate a function with the keyword lists hard-coded as substring tests.
+
+    The function takes lower-cased text and returns whether it is trade related
+    and the list of indicators it mentions, in INDICATOR_KEYWORDS order.
+    """
+    trade_check = ' or '.join(f'{k!r} in text' for k in sorted(TRADING_KEYWORDS))
+    lines = ['def scan_keywords(text):',
+             f'    return ({trade_check}), [k for k, found in (',
+             *[f'        ({k!r}, {k!r} in text),' for k in INDICATOR_KEYWORDS],
+             '    ) if found]']
+    namespace = {}
+    exec(compile('\n'.join(lines), '<keywords>', 'exec'), namespace)
+    return namespace['scan_keywords']
+
+_scan_keywords = _build_keyword_scanner()
 
 class ConversationManager:
     """Manages conversation archiving and learning for the trading system"""
     
+    LEARNING_QUEUE_SIZE = 1000  # Oldest background tasks are dropped beyond this
+    TURN_BATCH_MAX = 32  # Turns written per database round trip
+    TURN_BATCH_SECONDS = 0.2  # Longest a queued turn waits for others to batch with
+    LEARNING_IDLE_EXIT_SECONDS = 60  # Idle time after which the background thread exits until needed
+    EVICTION_INTERVAL_SECONDS = 24 * 3600  # How often unused archived conversations are evicted (when enabled)
+    EMBEDDING_MODEL = 'all-MiniLM-L6-v2'  # Local sentence-transformers model for turn embeddings
+    EMBEDDING_CACHE_SIZE = 4096  # Recently embedded texts kept for reuse
+    
     def __init__(self):
         self.db = None
         self.current_session_id = None
         self.turn_count = 0
         self.learning_enabled = True
+        # Deleting archived history is opt-in: set CONVERSATION_AUTO_EVICT=true to enable the daily eviction
+        self.auto_evict_enabled = os.environ.get('CONVERSATION_AUTO_EVICT', '').lower() in ('1', 'true', 'yes')
         
         # Background processing for learning
-        self.learning_queue = queue.Queue()
+        self.learning_queue = deque(maxlen=self.LEARNING_QUEUE_SIZE)
         self.learning_thread = None
+        self._learning_cv = threading.Condition()  # Guards the queue and starting/retiring the thread
+        self._tasks_in_progress = 0
+        self._last_eviction = None
+        
+        self._embedder = None
+        self._embedder_lock = threading.Lock()
+        self._embedding_cache = OrderedDict()  # Normalized text -> embedding, least recently used first
         
         self._initialize_database()
         self._start_background_learning()
@@ -57,60 +107,63 @@ class ConversationManager:
             self.current_session_id = f"local_{int(time.time())}"
         
         self.turn_count = 0
+        
+        # Evict never-retrieved old conversations at most once a day, in the background
+        if self.db and self.auto_evict_enabled and (self._last_eviction is None or
+                                                    time.monotonic() - self._last_eviction >= self.EVICTION_INTERVAL_SECONDS):
+            self._last_eviction = time.monotonic()
+            self._enqueue(('evict',))
+        
         print(f"💬 Conversation session started: {self.current_session_id[:8]}...")
         return self.current_session_id
     
     def add_conversation_turn(self, user_input: str, ai_response: str, 
                             context: Dict = None, metadata: Dict = None):
-        """Add a conversation turn to the current session"""
+        """Add a conversation turn to the current session (persisted by the background thread)"""
         self.turn_count += 1
         
         if self.db and self.current_session_id:
-            # Determine context for this turn
-            turn_context = self._extract_context(user_input, context)
-            
-            self.db.add_turn(
-                session_id=self.current_session_id,
-                user_input=user_input,
-                ai_response=ai_response,
-                turn_number=self.turn_count,
-                context=turn_context,
-                metadata=metadata or {}
-            )
+            self._enqueue(('persist_turn', self.current_session_id, self.turn_count, time.time(),
+                           user_input, ai_response, context, metadata or {}))
+    
+    def _enqueue(self, task: tuple):
+        """Queue a background task, dropping the oldest one when the queue is full"""
+        with self._learning_cv:
+            # Respawn the background thread if it exited while idle
+            if self.learning_thread is None:
+                self._start_background_learning()
             
-            # Queue for background learning
-            if self.learning_enabled:
-                self.learning_queue.put(('turn', self.current_session_id, user_input, ai_response))
+            if len(self.learning_queue) == self.learning_queue.maxlen:
+                print("⚠️ Background queue full, dropped oldest task")
+            self.learning_queue.append(task)
+            self._learning_cv.notify()
     
-    def _extract_context(self, user_input: str, additional_context: Dict = None) -> Dict:
+    def _extract_context(self, user_input: str, additional_context: Dict = None,
+                         turn_number: int = None, timestamp: float = None) -> Dict:
         """Extract relevant context from user input and additional context"""
         context = {
-            'timestamp': datetime.now().isoformat(),
-            'turn_number': self.turn_count,
+            'timestamp': datetime.fromtimestamp(time.time() if timestamp is None else timestamp).isoformat(),
+            'turn_number': self.turn_count if turn_number is None else turn_number,
             'is_condition_task': False,
             'is_trade_related': False,
             'extracted_entities': {}
         }
         
+        user_lower = user_input.lower()
+        
         # Check for condition task list
-        if 'condition task list' in user_input.lower():
+        if 'condition task list' in user_lower:
             context['is_condition_task'] = True
             context['task_type'] = 'condition_task_list'
         
-        # Check for trading-related terms
-        trading_keywords = ['trade', 'market', 'stock', 'price', 'rsi', 'volume', 'broker']
-        if any(keyword in user_input.lower() for keyword in trading_keywords):
-            context['is_trade_related'] = True
-        
-        # Extract technical indicators mentioned
-        indicators = ['rsi', 'sma', 'ema', 'macd', 'bollinger', 'volume']
-        mentioned_indicators = [ind for ind in indicators if ind in user_input.lower()]
+        # Check for trading-related terms and technical indicators mentioned
+        is_trade_related, mentioned_indicators = _scan_keywords(user_lower)
+        context['is_trade_related'] = is_trade_related
         if mentioned_indicators:
             context['extracted_entities']['indicators'] = mentioned_indicators
         
         # Extract values (numbers)
-        import re
-        numbers = re.findall(r'\d+\.?\d*', user_input)
+        numbers = _NUMBER_PATTERN.findall(user_input)
         if numbers:
             context['extracted_entities']['values'] = [float(n) for n in numbers]
         
@@ -132,12 +185,9 @@ class ConversationManager:
         }
         
         try:
-            # Find similar past conversations
-            similar = self.db.find_similar_conversations(query, limit=3)
-            context['similar_conversations'] = similar
-            
-            # Get relevant patterns
-            context = self.db.get_context_for_query(query)
+            # Similar past conversations (nearest embeddings when available) and relevant patterns
+            embeddings = self._embed([query])
+            context.update(self.db.get_context_for_query(query, embedding=embeddings[0] if embeddings else None))
             
             # Generate suggested responses based on patterns
             for pattern in context.get('recent_patterns', []):
@@ -161,30 +211,139 @@ class ConversationManager:
             
             # Queue for final learning analysis
             if self.learning_enabled:
-                self.learning_queue.put(('analyze', self.current_session_id))
+                self._enqueue(('analyze', self.current_session_id))
         
-        print(f"🔚 Conversation session ended ({} turns)".format(self.turn_count))
+        print(f"🔚 Conversation session ended ({self.turn_count} turns)")
         self.current_session_id = None
         self.turn_count = 0
     
     def _background_learning_loop(self):
         """Background thread for processing learning queue"""
+        # The thread keeps one database connection while it runs and closes it when it exits idle
+        with self.db.hold_connection():
+            self._process_learning_queue()
+    
+    def _process_learning_queue(self):
+        """Run queued tasks until the queue has been empty for LEARNING_IDLE_EXIT_SECONDS"""
+        last_task_time = time.monotonic()
         while True:
-            try:
-                task_type, *args = self.learning_queue.get(timeout=1)
+            with self._learning_cv:
+                if not self.learning_queue:
+                    self._learning_cv.wait(timeout=1)
+                if not self.learning_queue:
+                    if time.monotonic() - last_task_time >= self.LEARNING_IDLE_EXIT_SECONDS:
+                        self.learning_thread = None  # The next _enqueue starts a new thread
+                        break
+                    continue
                 
-                if task_type == 'turn':
-                    session_id, user_input, ai_response = args
+                # Give a lone turn a moment to be joined by others so they share one round trip
+                self._learning_cv.wait_for(lambda: len(self.learning_queue) >= self.TURN_BATCH_MAX,
+                                           timeout=self.TURN_BATCH_SECONDS)
+                tasks = list(self.learning_queue)
+                self.learning_queue.clear()
+                self._tasks_in_progress = len(tasks)
+            
+            try:
+                self._run_tasks(tasks)
+            finally:
+                with self._learning_cv:
+                    self._tasks_in_progress = 0
+                    self._learning_cv.notify_all()
+            last_task_time = time.monotonic()
+    
+    def _run_tasks(self, tasks: List[tuple]):
+        """Run drained tasks in order, writing consecutive turns in batches"""
+        batch = []
+        for task in tasks:
+            if task[0] == 'persist_turn':
+                batch.append(task)
+                if len(batch) >= self.TURN_BATCH_MAX:
+                    self._persist_turns(batch)
+                    batch = []
+            else:
+                self._persist_turns(batch)  # Turns queued before this task go first
+                batch = []
+                self._run_task(task)
+        self._persist_turns(batch)
+    
+    def _wait_for_background_tasks(self):
+        """Block until every queued background task has been processed"""
+        with self._learning_cv:
+            self._learning_cv.wait_for(lambda: not self.learning_queue and not self._tasks_in_progress)
+    
+    def _persist_turns(self, batch: List[tuple]):
+        """Write a batch of queued turns and run per-turn learning on them"""
+        if not batch:
+            return
+        
+        try:
+            embeddings = self._embed([task[4] for task in batch]) or [None] * len(batch)
+            rows = []
+            for (_, session_id, turn_number, timestamp, user_input, ai_response, context, metadata), embedding in zip(batch, embeddings):
+                turn_context = self._extract_context(user_input, context, turn_number, timestamp)
+                rows.append((session_id, user_input, ai_response, turn_number, turn_context, metadata, embedding))
+            self.db.add_turns_batch(rows)
+            
+            if self.learning_enabled:
+                for session_id, user_input, ai_response, *_ in rows:
                     self._process_turn_learning(session_id, user_input, ai_response)
-                
-                elif task_type == 'analyze':
-                    session_id = args[0]
-                    self.db.learn_patterns(session_id)
-                
-            except queue.Empty:
-                continue
+        
+        except Exception as e:
+            print(f"⚠️ Background learning error: {e}")
+    
+    def _run_task(self, task: tuple):
+        """Run a queued non-turn task"""
+        task_type, *args = task
+        try:
+            if task_type == 'analyze':
+                session_id = args[0]
+                self.db.learn_patterns(session_id)
+            
+            elif task_type == 'evict':
+                self.db.evict_unused()
+        
+        except Exception as e:
+            print(f"⚠️ Background learning error: {e}")
+    
+    def _embed(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """Embed texts with the local model, or None when sentence-transformers is unavailable"""
+        if SentenceTransformer is None or self._embedder is False:
+            return None
+        
+        with self._embedder_lock:
+            if self._embedder is None:
+                try:
+                    self._embedder = SentenceTransformer(self.EMBEDDING_MODEL)
+                except Exception as e:
+                    print(f"⚠️ Embedding model unavailable, using text search: {e}")
+                    self._embedder = False
+                    return None
+        
+        # Reuse cached embeddings; a query is usually embedded again when its turn is stored
+        keys = [' '.join(text.split()) for text in texts]
+        found = {}
+        with self._embedder_lock:
+            for key in keys:
+                if key in self._embedding_cache:
+                    self._embedding_cache.move_to_end(key)
+                    found[key] = self._embedding_cache[key]
+        
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            try:
+                vectors = self._embedder.encode(missing, normalize_embeddings=True).tolist()
             except Exception as e:
-                print(f"⚠️ Background learning error: {e}")
+                print(f"⚠️ Embedding error: {e}")
+                return None
+            
+            found.update(zip(missing, vectors))
+            with self._embedder_lock:
+                for key, vector in zip(missing, vectors):
+                    self._embedding_cache[key] = vector
+                while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+        
+        return [found[key] for key in keys]
     
     def _process_turn_learning(self, session_id: str, user_input: str, ai_response: str):
         """Process learning from a single conversation turn"""
@@ -199,8 +358,10 @@ class ConversationManager:
         if insights['user_intent'] == 'condition_task' and insights['interaction_success'] > 0.8:
             print(f"✍️ Learned effective condition task handling pattern")
     
-    def _classify_intent(self, user_input: str) -> str:
-        """Classify user intent from input"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _classify_intent(user_input: str) -> str:
+        """Classify user intent from input (cached for repeated inputs)"""
         user_lower = user_input.lower()
         
         if 'condition task list' in user_lower:
@@ -209,15 +370,20 @@ class ConversationManager:
             return 'demo_request'
         elif 'broker' in user_lower:
             return 'broker_configuration'
-        elif any(word in user_lower for word in ['how', 'what', 'why']):
+        
+        # Tokenize once and intersect instead of scanning for each word
+        words = set(_WORD_PATTERN.findall(user_lower))
+        if not words.isdisjoint(QUESTION_WORDS):
             return 'question'
-        elif any(word in user_lower for word in ['help', 'install', 'setup']):
+        elif not words.isdisjoint(SETUP_WORDS):
             return 'setup_help'
         else:
             return 'general_inquiry'
     
-    def _classify_response(self, ai_response: str) -> str:
-        """Classify AI response type"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _classify_response(ai_response: str) -> str:
+        """Classify AI response type (cached for repeated responses)"""
         if '✅' in ai_response or 'completed' in ai_response.lower():
             return 'confirmation'
         elif '❌' in ai_response or 'error' in ai_response.lower():
@@ -229,19 +395,14 @@ class ConversationManager:
         else:
             return 'information'
     
-    def _assess_interaction_quality(self, user_input: str, ai_response: str) -> float:
+    @staticmethod
+    def _assess_interaction_quality(user_input: str, ai_response: str) -> float:
         """Assess quality of interaction (0.0 to 1.0)"""
-        score = 0.5  # base score
-        
-        # Check if response addresses user intent
-        if 'condition task list' in user_input.lower() and 'condition' in ai_response.lower():
-            score += 0.3
-        
-        # Check for actionable outcomes
-        if any(emoji in ai_response for emoji in ['✅', '🎯', '📋']):
-            score += 0.2
-        
-        return min(score, 1.0)
+        # Base score, plus 0.3 if the response addresses a condition task list and
+        # 0.2 for actionable outcomes; the bonuses sum to at most 1.0
+        addresses_task = 'condition task list' in user_input.lower() and 'condition' in ai_response.lower()
+        actionable = not ACTION_EMOJIS.isdisjoint(ai_response)
+        return 0.5 + 0.3 * addresses_task + 0.2 * actionable
     
     def get_conversation_insights(self) -> Dict:
         """Get insights from all archived conversations"""
@@ -267,11 +428,23 @@ class ConversationManager:
         if self.current_session_id:
             self.end_conversation({'reason': 'system_shutdown'})
         
-        # Close database connection
+        # Let queued turns reach the database, then close the connection
         if self.db:
+            if self.learning_thread and self.learning_thread.is_alive():
+                self._wait_for_background_tasks()
             self.db.close()
         
         print("👋 Conversation manager shut down")
 
-# Global instance for the application
-conversation_manager = ConversationManager()
+# Shared instance, created on first use so importing this module stays cheap
+_instance: Optional[ConversationManager] = None
+_instance_lock = threading.Lock()
+
+def get_conversation_manager() -> ConversationManager:
+    """Return the application's conversation manager, creating it on first call"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = ConversationManager()
+    return _instance
@@ -5,12 +5,28 @@ from typing import List, Dict, Callable, Optional
 from condition_parser import Condition
 from conditions_matcher import ConditionsMatcher, MarketData
 
+PROGRESS_FILL = "━"
+PROGRESS_EMPTY = "─"
+
 class TaskDashboard:
+    CONDITIONS_TOP = 7  # First screen row of the scrollable conditions view
+    INPUT_POLL_SECONDS = 0.05  # How often keys are checked while waiting for changes
+    VALUE_REFRESH_SECONDS = 0.5  # Current values are redrawn at least this often
+    
     def __init__(self):
         self.matcher = ConditionsMatcher()
         self.screen = None
         self.running = False
         self.current_symbol = ""
+        self._dirty = threading.Event()  # Set whenever the screen needs a redraw
+        self._last_lines: Dict[tuple, tuple] = {}  # (y, x) -> (text, attr) currently on screen
+        self._frame_keys = set()  # Positions written during the frame being rendered
+        self._last_size = None
+        self._last_progress = None  # ((completed, total, width), bar text, percent text, percent x)
+        self._pad = None  # Off-screen buffer holding every condition row
+        self._pad_rows = 0
+        self._pad_stale = True  # Condition data changed since the pad was filled
+        self._scroll = 0  # First pad row shown in the conditions view
         self.setup_matcher_callbacks()
     
     def setup_matcher_callbacks(self):
@@ -26,6 +42,7 @@ class TaskDashboard:
     def stop(self):
         """Stop the dashboard"""
         self.running = False
+        self._dirty.set()  # Wake the display loop so it can exit
         self.matcher.stop_matching()
     
     def _main_loop(self, stdscr):
@@ -37,8 +54,10 @@ class TaskDashboard:
         curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # In Progress
         curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)      # Alert
         
-        # Clear screen
+        # Clear screen; keys are read without blocking the display loop
         stdscr.clear()
+        stdscr.nodelay(True)
+        stdscr.keypad(True)
         
         # Start matcher
         self.matcher.start_matching()
@@ -48,13 +67,41 @@ class TaskDashboard:
         except KeyboardInterrupt:
             pass
         finally:
-            self.stop_matching()
+            self.stop()
     
     def _display_loop(self):
-        """Main display refresh loop"""
+        """Main display refresh loop (redraws only after a change)"""
+        self._dirty.set()  # Draw the first frame immediately
+        last_render = 0.0
         while self.running:
-            self._render_screen()
-            time.sleep(0.1)
+            changed = self._dirty.wait(timeout=self.INPUT_POLL_SECONDS)
+            if time.monotonic() - last_render >= self.VALUE_REFRESH_SECONDS:
+                # Indicator values move without flipping a condition, so refresh them periodically
+                self._pad_stale = changed = True
+            if self._handle_keys() or changed:
+                self._dirty.clear()
+                self._render_screen()
+                last_render = time.monotonic()
+    
+    def _handle_keys(self) -> bool:
+        """Process pending key presses, returning True if the screen needs a redraw"""
+        redraw = False
+        while True:
+            key = self.screen.getch()
+            if key == -1:
+                return redraw
+            
+            if key == ord('q'):
+                self.running = False
+            elif key in (ord('j'), curses.KEY_DOWN):
+                self._scroll += 1
+            elif key in (ord('k'), curses.KEY_UP):
+                self._scroll = max(0, self._scroll - 1)
+            elif key == ord('r'):
+                self.matcher.reset_conditions()
+            elif key != curses.KEY_RESIZE:
+                continue
+            redraw = True
     
     def _render_screen(self):
         """Render the dashboard screen"""
@@ -62,90 +109,145 @@ class TaskDashboard:
             return
         
         h, w = self.screen.getmaxyx()
-        self.screen.border()
+        if (h, w) != self._last_size:
+            # Resized: nothing on screen can be trusted, repaint from scratch
+            self._last_size = (h, w)
+            self._last_lines.clear()
+            self._pad_stale = True  # Rows are laid out for the old width
+            self.screen.erase()
+            self.screen.border()
+        self._frame_keys = set()
         
         # Title
         title = "📊 CONDITION TASK LIST TRADER"
-        self.screen.addstr(1, (w - len(title)) // 2, title, curses.A_BOLD)
+        self._put(1, (w - len(title)) // 2, title, curses.A_BOLD)
         
         # Current symbol
         if self.current_symbol:
             symbol_text = f"Symbol: {self.current_symbol}"
-            self.screen.addstr(3, 2, symbol_text)
+            self._put(3, 2, symbol_text)
         
         # Conditions section
-        self.screen.addstr(5, 2, "TASK CONDITIONS:", curses.A_BOLD)
+        self._put(5, 2, "TASK CONDITIONS:", curses.A_BOLD)
         
-        conditions = self.matcher.get_conditions_status()
-        y_offset = 7
+        # Condition rows live in a pad, rewritten only when condition data changes
+        if self._pad_stale:
+            self._pad_stale = False
+            self._fill_pad(self.matcher.get_conditions_status(), w)
+        total = len(self.matcher.conditions)
         
-        for i, condition in enumerate(conditions):
-            if y_offset >= h - 5:  # Prevent overflow
-                break
-            
+        completed_count = total - self.matcher.unmet_count
+        
+        # Progress bar
+        if total:
+            self._render_progress_bar(completed_count, total, h - 8, w)
+        
+        # Status line
+        status_text = f"Completed: {completed_count}/{total}"
+        self._put(h - 3, 2, status_text, curses.A_BOLD)
+        
+        # Instructions
+        help_text = "Press 'q' to quit | 'r' to reset | 'j'/'k' to scroll | 'i' for new conditions"
+        self._put(h - 2, 2, help_text)
+        
+        # Blank out text from the previous frame that was not drawn again, then
+        # restore anything this frame drew on the same rows
+        stale_rows = set()
+        for key in [k for k in self._last_lines if k not in self._frame_keys]:
+            self.screen.addstr(key[0], key[1], ' ' * len(self._last_lines.pop(key)[0]))
+            stale_rows.add(key[0])
+        for key in sorted(k for k in self._last_lines if k[0] in stale_rows):
+            text, attr = self._last_lines[key]
+            self.screen.addstr(key[0], key[1], text, attr)
+        
+        self.screen.noutrefresh()
+        
+        # Copy the visible slice of the pad over the conditions area
+        view_bottom = h - 10
+        if view_bottom >= self.CONDITIONS_TOP:
+            view_height = view_bottom - self.CONDITIONS_TOP + 1
+            self._scroll = max(0, min(self._scroll, self._pad_rows - view_height))
+            self._pad.noutrefresh(self._scroll, 0, self.CONDITIONS_TOP, 1, view_bottom, w - 2)
+        curses.doupdate()
+    
+    def _fill_pad(self, conditions: List[Dict], w: int):
+        """Lay out every condition in the off-screen pad"""
+        rows = sum(3 if c['current_value'] is not None else 2 for c in conditions)
+        width = max(w - 2, 1)  # Pad sits inside the border
+        
+        # One spare row: curses cannot write the pad's bottom-right cell
+        pad_height, pad_width = self._pad.getmaxyx() if self._pad else (0, 0)
+        if pad_height < rows + 1 or pad_width != width:
+            self._pad = curses.newpad(rows + 1, width)
+        else:
+            self._pad.erase()
+        self._pad_rows = rows
+        
+        y = 0
+        for condition in conditions:
             # Task status icon
-            status_icon = condition['status']
             color = 2 if condition['completed'] else 3
-            self.screen.addstr(y_offset, 4, f"[{status_icon}]", curses.color_pair(color))
+            self._pad_put(y, 3, f"[{condition['status']}]", curses.color_pair(color))
             
             # Task description
-            task_text = f"{condition['task_id']}: {condition['description']}"
-            self.screen.addstr(y_offset, 10, task_text)
+            self._pad_put(y, 9, f"{condition['task_id']}: {condition['description']}")
             
             # Current value if available
             if condition['current_value'] is not None:
-                current_val_text = f"Current: {condition['current_value']:.2f}"
-                self.screen.addstr(y_offset + 1, 14, current_val_text)
-                
-                target_text = f"Target: {condition['operator']} {condition['target_value']}"
-                self.screen.addstr(y_offset + 2, 14, target_text)
-                y_offset += 3
+                self._pad_put(y + 1, 13, f"Current: {condition['current_value']:.2f}")
+                self._pad_put(y + 2, 13, f"Target: {condition['operator']} {condition['target_value']}")
+                y += 3
             else:
-                y_offset += 2
-        
-        # Progress bar
-        if conditions:
-            self._render_progress_bar(conditions, h - 8, w)
-        
-        # Status line
-        completed_count = sum(1 for c in conditions if c['completed'])
-        status_text = f"Completed: {completed_count}/{len(conditions)}"
-        self.screen.addstr(h - 3, 2, status_text, curses.A_BOLD)
-        
-        # Instructions
-        help_text = "Press 'q' to quit | 'r' to reset | 'i' to input new conditions"
-        self.screen.addstr(h - 2, 2, help_text)
+                y += 2
+    
+    def _pad_put(self, y: int, x: int, text: str, attr: int = 0):
+        """Write text into the pad, clipped to its width"""
+        try:
+            self._pad.addstr(y, x, text[:max(self._pad.getmaxyx()[1] - x, 0)], attr)
+        except curses.error:
+            pass  # Wide characters can still run past the edge
+    
+    def _put(self, y: int, x: int, text: str, attr: int = 0):
+        """Write text at (y, x) only if it differs from what is already there"""
+        key = (y, x)
+        self._frame_keys.add(key)
+        previous = self._last_lines.get(key)
+        if previous == (text, attr):
+            return
         
-        self.screen.refresh()
+        # Pad over any leftover characters of a longer previous string
+        padded = text.ljust(len(previous[0])) if previous else text
+        self.screen.addstr(y, x, padded, attr)
+        self._last_lines[key] = (text, attr)
     
-    def _render_progress_bar(self, conditions: List[Dict], y: int, w: int):
+    def _render_progress_bar(self, completed: int, total: int, y: int, w: int):
         """Render a progress bar showing task completion"""
-        completed = sum(1 for c in conditions if c['completed'])
-        total = len(conditions)
-        
         if total == 0:
             return
         
-        progress = completed / total
-        bar_width = w - 20
-        
-        # Progress bar
-        filled_width = int(bar_width * progress)
-        bar = "━" * filled_width + "─" * (bar_width - filled_width)
+        # Rebuild the bar only when the completion count or width changes
+        key = (completed, total, w)
+        if self._last_progress is None or self._last_progress[0] != key:
+            progress = completed / total
+            bar_width = w - 20
+            filled_width = int(bar_width * progress)
+            bar_text = f"[{PROGRESS_FILL * filled_width}{PROGRESS_EMPTY * (bar_width - filled_width)}]"
+            progress_text = f"{progress * 100:.0f}%"
+            self._last_progress = (key, bar_text, progress_text, (w - len(progress_text)) // 2)
         
-        self.screen.addstr(y, 2, f"[{bar}]")
-        progress_text = f"{progress * 100:.0f}%"
-        self.screen.addstr(y + 1, (w - len(progress_text)) // 2, progress_text)
+        _, bar_text, progress_text, text_x = self._last_progress
+        self._put(y, 2, bar_text)
+        self._put(y + 1, text_x, progress_text)
     
     def update_display(self, conditions: List[Condition]):
         """Callback for condition updates"""
-        # Display will refresh automatically in the render loop
-        pass
+        self._pad_stale = True
+        self._dirty.set()
     
     def on_trade_executed(self, symbol: str, conditions: List[Condition]):
         """Callback when trade is executed"""
         # Flash alert (would need to implement alert display)
-        pass
+        self._dirty.set()
     
     def handle_input(self, conditions_text: str):
         """Handle user input for new conditions"""
@@ -154,13 +256,17 @@ class TaskDashboard:
         
         if new_conditions:
             # Clear existing conditions and add new ones
-            self.matcher.conditions.clear()
+            self.matcher.clear_conditions()
             self.matcher.add_conditions(new_conditions)
+            self._pad_stale = True
+            self._dirty.set()
             return True
         
         return False
     
     def update_symbol(self, symbol: str, market_data: MarketData):
         """Update market data for tracking"""
-        self.current_symbol = symbol
+        if symbol != self.current_symbol:
+            self.current_symbol = symbol
+            self._dirty.set()
         self.matcher.update_market_data(symbol, market_data)
@@ -0,0 +1,48 @@
+"""
+Cheap memory and disk readings for the health check hot path
+Linux reads /proc/meminfo and statvfs directly; other platforms go through psutil
+"""
+
+import os
+import sys
+from typing import Tuple
+
+import psutil
+
+LINUX = sys.platform.startswith('linux')
+PROCFS_PATH = '/proc'
+MEMINFO_PATH = f'{PROCFS_PATH}/meminfo'
+ROOT_DISK_PATH = '/'
+
+if LINUX:
+    psutil.PROCFS_PATH = PROCFS_PATH  # Pin psutil's /proc location once for every later read
+MEMINFO_HEAD_BYTES = 256  # MemTotal, MemFree and MemAvailable are the first three lines
+
+def memory_usage() -> Tuple[float, float]:
+    """Used memory in MB and as a percent of total (total minus available, as psutil reports percent)"""
+    if LINUX:
+        try:
+            with open(MEMINFO_PATH, 'rb') as f:
+                head = f.read(MEMINFO_HEAD_BYTES)
+            values = {}
+            for line in head.split(b'\n', 3)[:3]:
+                key, _, rest = line.partition(b':')
+                values[key] = int(rest.split()[0])  # kB
+            total = values[b'MemTotal']
+            used = total - values[b'MemAvailable']
+            return used / 1024, used / total * 100
+        except (OSError, KeyError, ValueError, IndexError):
+            pass  # Unusual /proc layout; psutil knows how to estimate it
+
+    memory = psutil.virtual_memory()
+    return memory.used / (1024 * 1024), memory.percent
+
+def disk_usage(path: str = ROOT_DISK_PATH) -> Tuple[float, float]:
+    """Used percent of the filesystem at path and GB free to unprivileged users"""
+    if LINUX:
+        stats = os.statvfs(path)
+        used_percent = (1 - stats.f_bfree / stats.f_blocks) * 100 if stats.f_blocks else 0.0
+        return used_percent, stats.f_bavail * stats.f_frsize / (1024 * 1024 * 1024)
+
+    disk = psutil.disk_usage(path)
+    return disk.used / disk.total * 100, disk.free / (1024 * 1024 * 1024)
@@ -8,90 +8,140 @@ import psutil
 import threading
 import json
 from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
-from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import logging
+import fast_metrics
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthStatus:
     """Health status of a component"""
     name: str
     status: str  # 'healthy', 'degraded', 'unhealthy'
-    last_check: datetime
+    last_check: float  # Epoch seconds
     response_time_ms: float
     details: Dict[str, Any] = None
     error_message: Optional[str] = None
 
+def _status_to_dict(status: HealthStatus) -> Dict[str, Any]:
+    """JSON-ready dict of a HealthStatus, built directly instead of through asdict()"""
+    return {
+        'name': status.name,
+        'status': status.status,
+        'last_check': status.last_check,
+        'response_time_ms': status.response_time_ms,
+        'details': status.details,
+        'error_message': status.error_message
+    }
+
+def _iso(timestamp: float) -> str:
+    """Format epoch seconds as an ISO 8601 UTC string"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+def _readable_sweep(full_check: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a sweep with its epoch timestamps formatted as ISO strings, for display"""
+    checks = {name: dict(result, last_check=_iso(result['last_check'])) for name, result in full_check['checks'].items()}
+    return dict(full_check, timestamp=_iso(full_check['timestamp']), checks=checks)
+
+@dataclass
+class SystemSnapshot:
+    """System readings taken once per sweep and shared by every check"""
+    memory_used_mb: float
+    memory_percent: float
+    disk_percent: float  # Root filesystem
+    disk_free_gb: float
+    cpu_percent: float
+    process_memory_mb: Optional[float] = None
+    
+    @classmethod
+    def take(cls, process: Optional[psutil.Process] = None) -> 'SystemSnapshot':
+        """Read memory, root disk usage, CPU usage since the last read and (given a handle) this process's RSS"""
+        return cls(
+            *fast_metrics.memory_usage(),
+            *fast_metrics.disk_usage(fast_metrics.ROOT_DISK_PATH),
+            psutil.cpu_percent(percpu=False, interval=None),
+            process.memory_info().rss / (1024 * 1024) if process else None
+        )
+
 class HealthCheck:
     """Base class for health checks"""
     
-    def __init__(self, name: str, timeout: float = 5.0):
+    MAX_CONSECUTIVE_FAILURES = 3  # Failed checks in a row before the component counts as unhealthy
+    
+    def __init__(self, name: str, timeout: float = 5.0, min_interval: float = 1.0):
         self.name = name
         self.timeout = timeout
+        self.min_interval = min_interval  # Results younger than this are reused instead of re-checking
         self.last_status = None
+        self.last_check_monotonic = 0.0
         self.consecutive_failures = 0
         self.is_healthy = True
     
-    def check(self) -> HealthStatus:
-        """Perform health check"""
+    def check(self, snapshot: Optional[SystemSnapshot] = None) -> HealthStatus:
+        """Perform health check (or return the cached result within min_interval)"""
+        if not self.is_due():
+            return self.last_status
+        
+        self.last_check_monotonic = time.monotonic()
         start_time = time.time()
         
         try:
-            result = self._check_health()
+            result = self._check_health(snapshot)
             response_time = (time.time() - start_time) * 1000
             
+            self._record_result(bool(result))
+            
             status = HealthStatus(
                 name=self.name,
                 status='healthy' if result else 'unhealthy',
-                last_check=datetime.now(),
+                last_check=time.time(),
                 response_time_ms=response_time,
                 details={'check_time': response_time}
             )
             
-            if result:
-                self.consecutive_failures = 0
-                self.is_healthy = True
-            else:
-                self.consecutive_failures += 1
-                if self.consecutive_failures >= 3:
-                    self.is_healthy = False
-                    status.status = 'unhealthy'
-            
             self.last_status = status
             return status
             
         except Exception as e:
             response_time = (time.time() - start_time) * 1000
-            self.consecutive_failures += 1
+            self._record_result(False)
             
             status = HealthStatus(
                 name=self.name,
                 status='unhealthy',
-                last_check=datetime.now(),
+                last_check=time.time(),
                 response_time_ms=response_time,
                 error_message=str(e),
                 details={'exception_type': type(e).__name__}
             )
             
-            if self.consecutive_failures >= 3:
-                self.is_healthy = False
-            
             self.last_status = status
             return status
     
-    def _check_health(self) -> bool:
-        """Override in subclasses"""
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """Whether the last result is older than min_interval (or there is none)"""
+        if now is None:
+            now = time.monotonic()
+        return self.last_status is None or now - self.last_check_monotonic >= self.min_interval
+    
+    def _record_result(self, passed: bool):
+        """Reset the failure streak on success, extend it on failure"""
+        self.consecutive_failures = (self.consecutive_failures + 1) * (not passed)
+        self.is_healthy = self.consecutive_failures < self.MAX_CONSECUTIVE_FAILURES
+    
+    def _check_health(self, snapshot: Optional[SystemSnapshot] = None) -> bool:
+        """Override in subclasses (snapshot holds this sweep's shared system readings)"""
         raise NotImplementedError
 
 class DatabaseHealthCheck(HealthCheck):
     """Database connectivity health check"""
     
-    def __init__(self, database_connection):
-        super().__init__("database")
+    def __init__(self, database_connection, min_interval: float = 5.0):
+        super().__init__("database", min_interval=min_interval)
         self.db_connection = database_connection
     
-    def _check_health(self) -> bool:
+    def _check_health(self, snapshot: Optional[SystemSnapshot] = None) -> bool:
         """Check database connectivity"""
         try:
             with self.db_connection.cursor() as cursor:
@@ -104,11 +154,11 @@ class DatabaseHealthCheck(HealthCheck):
 class BrokerHealthCheck(HealthCheck):
     """Broker API health check"""
     
-    def __init__(self, broker_manager):
-        super().__init__("broker_api")
+    def __init__(self, broker_manager, min_interval: float = 10.0):
+        super().__init__("broker_api", min_interval=min_interval)
         self.broker_manager = broker_manager
     
-    def _check_health(self) -> bool:
+    def _check_health(self, snapshot: Optional[SystemSnapshot] = None) -> bool:
         """Check broker connectivity"""
         try:
             if self.broker_manager.active_broker:
@@ -121,40 +171,43 @@ class BrokerHealthCheck(HealthCheck):
 class MemoryHealthCheck(HealthCheck):
     """Memory usage health check"""
     
-    def __init__(self, warning_threshold_mb: float = 1000, critical_threshold_mb: float = 2000):
-        super().__init__("memory")
+    def __init__(self, warning_threshold_mb: float = 1000, critical_threshold_mb: float = 2000,
+                 min_interval: float = 2.0):
+        super().__init__("memory", min_interval=min_interval)
         self.warning_threshold = warning_threshold_mb
         self.critical_threshold = critical_threshold_mb
     
-    def _check_health(self) -> bool:
+    def _check_health(self, snapshot: Optional[SystemSnapshot] = None) -> bool:
         """Check memory usage"""
-        memory = psutil.virtual_memory()
-        used_mb = memory.used / (1024 * 1024)
-        return used_mb < self.critical_threshold_mb
+        used_mb = snapshot.memory_used_mb if snapshot else fast_metrics.memory_usage()[0]
+        return used_mb < self.critical_threshold
 
 class DiskSpaceHealthCheck(HealthCheck):
     """Disk space health check"""
     
-    def __init__(self, path: str = "/", warning_threshold_percent: float = 80, critical_threshold_percent: float = 90):
-        super().__init__("disk_space")
+    def __init__(self, path: str = "/", warning_threshold_percent: float = 80, critical_threshold_percent: float = 90,
+                 min_interval: float = 30.0):
+        super().__init__("disk_space", min_interval=min_interval)
         self.path = path
         self.warning_threshold = warning_threshold_percent
         self.critical_threshold = critical_threshold_percent
     
-    def _check_health(self) -> bool:
+    def _check_health(self, snapshot: Optional[SystemSnapshot] = None) -> bool:
         """Check disk space"""
-        disk = psutil.disk_usage(self.path)
-        used_percent = (disk.used / disk.total) * 100
-        return used_percent < self.critical_threshold_percent
+        if snapshot and self.path == fast_metrics.ROOT_DISK_PATH:
+            used_percent = snapshot.disk_percent
+        else:
+            used_percent = fast_metrics.disk_usage(self.path)[0]
+        return used_percent < self.critical_threshold
 
 class ConditionsEngineHealthCheck(HealthCheck):
     """Conditions matching engine health check"""
     
-    def __init__(self, conditions_matcher):
-        super().__init__("conditions_engine")
+    def __init__(self, conditions_matcher, min_interval: float = 1.0):
+        super().__init__("conditions_engine", min_interval=min_interval)
         self.matcher = conditions_matcher
     
-    def _check_health(self) -> bool:
+    def _check_health(self, snapshot: Optional[SystemSnapshot] = None) -> bool:
         """Check conditions engine"""
         try:
             return self.matcher.running
@@ -164,23 +217,54 @@ class ConditionsEngineHealthCheck(HealthCheck):
 class HealthMonitor:
     """Main health monitoring system"""
     
+    CACHE_TTL = 1.0  # Seconds a full sweep is reused for repeated check_all calls (e.g. probes)
+    MIN_CHECK_WORKERS = 4
+    HISTORY_SIZE = 1000  # Sweeps kept in the history ring
+    MAX_BACKOFF_DOUBLINGS = 4  # Healthy sweeps stretch the monitoring interval up to 16x (capped by the max)
+    
     def __init__(self):
         self.health_checks: Dict[str, HealthCheck] = {}
-        self.health_history = deque(maxlen=1000)  # Keep last 1000 checks
+        self._checks_list: tuple = ()  # (name, check) pairs for sweeps, rebuilt when checks change
+        self._registry_lock = threading.Lock()
+        # Fixed ring of (epoch seconds, overall status, JSON of the sweep), oldest overwritten first
+        self.health_history: List[Optional[tuple]] = [None] * self.HISTORY_SIZE
+        self._history_cursor = 0  # Slot the next sweep is written to
+        self._history_count = 0
         self.alert_callbacks: List[Callable] = []
         self.monitoring_thread = None
         self.is_monitoring = False
+        self._stop = threading.Event()  # Set to end the monitoring loop, even mid-wait
         self.logger = logging.getLogger("health_monitor")
+        self._last_full_check = None
+        self._last_full_check_ts = 0.0
+        self._check_lock = threading.Lock()  # One sweep at a time; concurrent callers share its result
+        self._pool = None  # Runs a sweep's checks in parallel (created on first sweep)
+        self._pool_size = 0
+        self._pending_checks = {}  # name -> future of a check that outlived its sweep
+        self._reported_statuses: Dict[str, HealthStatus] = {}  # name -> status the last sweep reported (timeouts included)
+        self._overall_status = None  # (status, epoch timestamp, /health JSON) of the latest sweep
+        self._detailed_json = b''  # /health/detailed JSON of the latest sweep
+        self._healthy_streak = 0  # Consecutive sweeps with every check healthy
+        self._status_lock = threading.Lock()
+        
+        # Prime psutil's CPU counters so later non-blocking reads return the usage since the previous call
+        psutil.cpu_percent(percpu=False, interval=None)
+        self._process = psutil.Process()  # Reused every sweep so psutil keeps its per-process state
     
     def add_check(self, health_check: HealthCheck):
         """Add a health check"""
-        self.health_checks[health_check.name] = health_check
+        with self._registry_lock:
+            self.health_checks[health_check.name] = health_check
+            self._checks_list = tuple(self.health_checks.items())
         self.logger.info(f"Added health check: {health_check.name}")
     
     def remove_check(self, name: str):
         """Remove a health check"""
-        if name in self.health_checks:
-            del self.health_checks[name]
+        with self._registry_lock:
+            removed = self.health_checks.pop(name, None) is not None
+            self._checks_list = tuple(self.health_checks.items())
+            self._reported_statuses.pop(name, None)
+        if removed:
             self.logger.info(f"Removed health check: {name}")
     
     def add_alert_callback(self, callback: Callable[[HealthStatus], None]):
@@ -188,13 +272,51 @@ class HealthMonitor:
         self.alert_callbacks.append(callback)
     
     def check_all(self) -> Dict[str, Any]:
-        """Check all registered health checks"""
+        """Check all registered health checks (cached for CACHE_TTL seconds)"""
+        with self._check_lock:
+            if self._last_full_check is not None and time.monotonic() - self._last_full_check_ts < self.CACHE_TTL:
+                return self._last_full_check
+            
+            full_check = self._run_checks()
+            self._last_full_check = full_check
+            self._last_full_check_ts = time.monotonic()
+            return full_check
+    
+    def _run_checks(self) -> Dict[str, Any]:
+        """Run every registered health check and record the sweep in history"""
         results = {}
         overall_status = 'healthy'
+        try:
+            snapshot = SystemSnapshot.take(self._process)  # One set of system readings for the whole sweep
+        except Exception as e:
+            self.logger.error(f"Error reading system snapshot: {e}")
+            snapshot = None  # Checks take their own readings
+        
+        # Run the checks in parallel so one slow check doesn't hold up the others
+        checks = self._checks_list
+        if self._pool is None or self._pool_size < len(checks):
+            if self._pool:
+                self._pool.shutdown(wait=False)
+            self._pool_size = max(len(checks), self.MIN_CHECK_WORKERS)
+            self._pool = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="health_check")
         
-        for name, check in self.health_checks.items():
-            status = check.check()
-            results[name] = asdict(status)
+        started = time.monotonic()
+        futures = {}
+        for name, check in checks:
+            # A check still running from an earlier sweep is not started twice
+            future = self._pending_checks.get(name)
+            if future is None or future.done():
+                # Only checks whose min_interval has passed are run; the rest reuse last_status
+                future = self._pool.submit(check.check, snapshot) if check.is_due(started) else None
+            futures[name] = future
+        
+        for name, check in checks:
+            # Compare with what the last sweep reported, not check.last_status: a timed-out
+            # check never updates last_status, so it would look like a fresh change every sweep
+            previous = self._reported_statuses.get(name)
+            status = self._collect_status(name, check, futures[name], started)
+            self._reported_statuses[name] = status
+            results[name] = _status_to_dict(status)
             
             # Determine overall status
             if status.status == 'unhealthy':
@@ -203,39 +325,98 @@ class HealthMonitor:
                 overall_status = 'degraded'
             
             # Trigger alerts if status changed
-            if (check.last_status and 
-                check.last_status.status != status.status and
+            if (previous and
+                previous.status != status.status and
                 status.status in ['degraded', 'unhealthy']):
                 self._trigger_alert(status)
         
+        self._healthy_streak = (self._healthy_streak + 1) * (overall_status == 'healthy')
+        
         # Add system metrics
-        system_metrics = self._get_system_metrics()
+        system_metrics = self._get_system_metrics(snapshot)
         
         full_check = {
             'overall_status': overall_status,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'checks': results,
             'system_metrics': system_metrics
         }
         
-        # Store in history
-        self.health_history.append(full_check)
+        # Store in history, serialized once here rather than kept as nested dicts
+        self._record_history(full_check)
+        
+        # Serialize the HTTP payloads once per sweep instead of once per request
+        summary_json = json.dumps({'status': overall_status, 'timestamp': _iso(full_check['timestamp'])}).encode()
+        detailed_json = json.dumps(_readable_sweep(full_check)).encode()
+        with self._status_lock:
+            self._overall_status = (overall_status, full_check['timestamp'], summary_json)
+            self._detailed_json = detailed_json
         
         return full_check
     
-    def _get_system_metrics(self) -> Dict[str, Any]:
-        """Get system performance metrics"""
+    def _collect_status(self, name: str, check: HealthCheck, future, started: float) -> HealthStatus:
+        """Wait for a check's result within its timeout (no future means its last result is reused)"""
+        if future is None:
+            return check.last_status
+        
+        try:
+            status = future.result(timeout=max(check.timeout - (time.monotonic() - started), 0))
+            self._pending_checks.pop(name, None)
+            return status
+        except FutureTimeoutError:
+            self._pending_checks[name] = future
+            return HealthStatus(
+                name=name,
+                status='unhealthy',
+                last_check=time.time(),
+                response_time_ms=check.timeout * 1000,
+                error_message=f"Health check timed out after {check.timeout}s",
+                details={'exception_type': 'TimeoutError'}
+            )
+    
+    def get_overall_status(self) -> tuple:
+        """(overall status, timestamp) of the latest sweep, sweeping only if none has run yet"""
+        return self._latest_status()[:2]
+    
+    def get_summary_json(self) -> tuple:
+        """(overall status, pre-serialized /health JSON) of the latest sweep"""
+        status, _, summary_json = self._latest_status()
+        return status, summary_json
+    
+    def get_detailed_json(self) -> bytes:
+        """Pre-serialized JSON of a sweep no older than CACHE_TTL"""
+        self.check_all()
+        with self._status_lock:
+            return self._detailed_json
+    
+    def _latest_status(self) -> tuple:
+        """The latest sweep's (status, timestamp, /health JSON), sweeping first if none has run"""
+        with self._status_lock:
+            latest = self._overall_status
+        if latest is None:
+            self.check_all()
+            with self._status_lock:
+                latest = self._overall_status
+        return latest
+    
+    def _record_history(self, full_check: Dict[str, Any]):
+        """Write a sweep into the history ring"""
+        self.health_history[self._history_cursor] = (
+            time.time(), full_check['overall_status'], json.dumps(full_check).encode()
+        )
+        self._history_cursor = (self._history_cursor + 1) % self.HISTORY_SIZE
+        self._history_count = min(self._history_count + 1, self.HISTORY_SIZE)
+    
+    def _get_system_metrics(self, snapshot: SystemSnapshot) -> Dict[str, Any]:
+        """Get system performance metrics from the sweep's snapshot"""
         try:
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
             return {
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'memory_used_mb': memory.used / (1024 * 1024),
-                'disk_percent': disk.percent,
-                'disk_free_gb': disk.free / (1024 * 1024 * 1024),
+                'cpu_percent': snapshot.cpu_percent,  # Usage since the last sweep, without sleeping
+                'memory_percent': snapshot.memory_percent,
+                'memory_used_mb': snapshot.memory_used_mb,
+                'process_memory_mb': snapshot.process_memory_mb,
+                'disk_percent': snapshot.disk_percent,
+                'disk_free_gb': snapshot.disk_free_gb,
                 'uptime_hours': time.time() / 3600  # System uptime in hours
             }
         except Exception as e:
@@ -252,40 +433,51 @@ class HealthMonitor:
             except Exception as e:
                 self.logger.error(f"Error in alert callback: {e}")
     
-    def start_monitoring(self, interval_seconds: float = 30.0):
-        """Start continuous monitoring"""
+    def start_monitoring(self, interval_seconds: float = 5.0, max_interval_seconds: float = 60.0):
+        """Start continuous monitoring, backing off towards max_interval_seconds while everything is healthy"""
         if self.is_monitoring:
             return
         
         self.is_monitoring = True
+        self._stop.clear()
         self.monitoring_thread = threading.Thread(
             target=self._monitoring_loop,
-            args=(interval_seconds,),
+            args=(interval_seconds, max(max_interval_seconds, interval_seconds)),
             daemon=True
         )
         self.monitoring_thread.start()
-        self.logger.info(f"Started health monitoring with {interval_seconds}s interval")
+        self.logger.info(f"Started health monitoring with {interval_seconds}-{max_interval_seconds}s interval")
     
     def stop_monitoring(self):
         """Stop continuous monitoring"""
         self.is_monitoring = False
+        self._stop.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         self.logger.info("Stopped health monitoring")
     
-    def _monitoring_loop(self, interval: float):
+    def _monitoring_loop(self, interval: float, max_interval: float):
         """Background monitoring loop"""
-        while self.is_monitoring:
+        while not self._stop.is_set():
             try:
                 self.check_all()
-                time.sleep(interval)
             except Exception as e:
                 self.logger.error(f"Error in health monitoring loop: {e}")
-                time.sleep(interval)
+            self._stop.wait(self._next_interval(interval, max_interval))
+    
+    def _next_interval(self, interval: float, max_interval: float) -> float:
+        """Wait before the next sweep: doubled per healthy sweep in a row, back to the base on any problem"""
+        doublings = min(max(self._healthy_streak - 1, 0), self.MAX_BACKOFF_DOUBLINGS)
+        return min(interval * 2 ** doublings, max_interval)
     
     def get_recent_history(self, limit: int = 100) -> List[Dict]:
-        """Get recent health check history"""
-        return list(self.health_history)[-limit:]
+        """Get recent health check history (oldest first)"""
+        count = max(min(limit, self._history_count), 0)
+        entries = [self.health_history[(self._history_cursor - i) % self.HISTORY_SIZE] for i in range(count, 0, -1)]
+        return [json.loads(entry[2]) for entry in entries]
 
 class RecoveryManager:
     """Automatic recovery for failed components"""
@@ -328,55 +520,50 @@ class HealthCheckServer:
     def start_server(self):
         """Start simple HTTP health check server"""
         try:
-            from http.server import HTTPServer, BaseHTTPRequestHandler
+            from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
             
             class HealthHandler(BaseHTTPRequestHandler):
-                def __init__(self, health_monitor, *args, **kwargs):
-                    self.health_monitor = health_monitor
-                    super().__init__(*args, **kwargs)
+                # Shared by every request; no per-request wrapper is needed
+                health_monitor = self.health_monitor
                 
                 def do_GET(self):
-                    if self.path == '/health':
+                    path, _, query = self.path.partition('?')
+                    if path == '/health':
                         self.send_health_response()
-                    elif self.path == '/health/detailed':
-                        self.send_detailed_health_response()
+                    elif path == '/health/detailed':
+                        self.send_detailed_health_response(pretty='pretty=1' in query.split('&'))
                     else:
                         self.send_error(404, "Not Found")
                 
                 def send_health_response(self):
-                    health_status = self.health_monitor.check_all()
-                    overall_status = health_status['overall_status']
+                    # Latest aggregate kept current by the monitoring loop; no checks run here
+                    overall_status, body = self.health_monitor.get_summary_json()
                     
                     status_code = 200 if overall_status == 'healthy' else 503
-                    
-                    self.send_response(status_code)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    
-                    response = {
-                        'status': overall_status,
-                        'timestamp': health_status['timestamp']
-                    }
-                    
-                    self.wfile.write(json.dumps(response).encode())
+                    self.send_json(status_code, body)
                 
-                def send_detailed_health_response(self):
-                    health_status = self.health_monitor.check_all()
+                def send_detailed_health_response(self, pretty: bool = False):
+                    body = self.health_monitor.get_detailed_json()
+                    if pretty:
+                        body = json.dumps(json.loads(body), indent=2).encode()
                     
-                    self.send_response(200)
+                    self.send_json(200, body)
+                
+                def send_json(self, status_code: int, body: bytes):
+                    self.send_response(status_code)
                     self.send_header('Content-type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
                     self.end_headers()
-                    
-                    self.wfile.write(json.dumps(health_status, indent=2).encode())
+                    self.wfile.write(body)
                 
                 def log_message(self, format, *args):
                     # Suppress default HTTP logging
                     pass
             
-            # Create handler with health_monitor reference
-            handler_factory = lambda *args, **kwargs: HealthHandler(self.health_monitor, *args, **kwargs)
-            
-            server = HTTPServer(('0.0.0.0', self.port), handler_factory)
+            # Each probe gets its own thread, so a slow sweep doesn't queue up the
+            # others; concurrent probes share one sweep through check_all's lock
+            server = ThreadingHTTPServer(('0.0.0.0', self.port), HealthHandler)
+            server.daemon_threads = True
             self.logger.info(f"Health check server started on port {self.port}")
             server.serve_forever()
             
@@ -6,6 +6,7 @@ before executing trades.
 """
 
 import time
+import logging
 import threading
 from condition_parser import ConditionParser
 from conditions_matcher import ConditionsMatcher, MarketData
@@ -13,9 +14,12 @@ from market_data_simulator import MarketDataSimulator
 from dashboard import TaskDashboard
 from trade_executor import TradeExecutor
 from broker_integrations import BrokerManager
-from conversation_manager import conversation_manager
+from conversation_manager import get_conversation_manager
 
 def main():
+    # Trade executor and matcher report through logging; show their messages on the terminal
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     print("🚀 CONDITION TASK LIST TRADER")
     print("=" * 50)
     print("Waiting for your 'Condition Task List'...")
@@ -25,6 +29,7 @@ def main():
     print("=" * 50)
     
     # Start conversation archiving
+    conversation_manager = get_conversation_manager()
     conversation_manager.start_conversation("Trading System Session")
     
     # Create components
@@ -36,8 +41,7 @@ def main():
     # The executor will automatically connect to available brokers
     print(f"📊 Trade executor initialized")
     if executor.using_real_broker:
-        broker_name = type(executor.broker_manager.active_broker).__name__.replace('Broker', '')
-        print(f"🎯 Connected to {broker_name} for real trade execution")
+        print(f"🎯 Connected to {executor.broker_manager.active_broker_name} for real trade execution")
     else:
         print("⚠️  No broker connected - using simulation mode")
     
@@ -63,8 +67,8 @@ def main():
     
     def on_conditions_updated(conditions):
         # Display current status
-        completed = sum(1 for c in conditions if c.completed)
         total = len(conditions)
+        completed = total - matcher.unmet_count
         print(f"\\rStatus: {completed}/{total} conditions met", end="", flush=True)
     
     matcher.register_trade_callback(on_trade_executed)
@@ -137,7 +141,7 @@ def main():
                         print(f"   [⏳] {task_description(condition)}")
                     
                     # Clear existing conditions and add new ones
-                    matcher.conditions.clear()
+                    matcher.clear_conditions()
                     matcher.add_conditions(conditions)
                     print(f"\\n🔄 Monitoring conditions for AAPL...")
                     
@@ -177,7 +181,7 @@ def run_demo_scenario(matcher: ConditionsMatcher, simulator: MarketDataSimulator
     demo_input = "Condition Task List: RSI < 30, price < 150, volume > 2000000"
     conditions = parser.parse_task_list(demo_input)
     
-    matcher.conditions.clear()
+    matcher.clear_conditions()
     matcher.add_conditions(conditions)
     
     print(f"\\n📋 Created demo tasks:")
@@ -201,8 +205,8 @@ def run_demo_scenario(matcher: ConditionsMatcher, simulator: MarketDataSimulator
         time.sleep(2)
         
         # Show current status
-        completed = sum(1 for c in matcher.conditions if c.completed)
         total = len(matcher.conditions)
+        completed = total - matcher.unmet_count
         print(f"   Status: {completed}/{total} conditions met")
         
         for condition in matcher.conditions:
@@ -1,37 +1,57 @@
-import random
 import time
 import math
+import threading
+from collections import deque
+import numpy as np
+import market_indicators
 from conditions_matcher import MarketData
-from typing import Dict
+from typing import Dict, List, Optional
 
 class MarketDataSimulator:
     """Simulates real-time market data for testing purposes"""
     
-    def __init__(self, symbol: str = "AAPL"):
+    HISTORY_SIZE = 200  # Prices kept for indicator calculations
+    SMA_PERIODS = (20, 50)
+    EMA_PERIODS = (10, 12, 26)
+    RSI_PERIODS = 14
+    RANDOM_BATCH = 4096  # Ticks of random draws generated per NumPy call
+    
+    def __init__(self, symbol: str = "AAPL", seed: Optional[int] = None):
         self.symbol = symbol
         self.base_price = 150.0
         self.current_price = self.base_price
         self.base_volume = 1000000
-        self.rsi_history = []
-        self.price_history = []
+        self.rsi_history = deque(maxlen=self.HISTORY_SIZE)
+        self.price_history = deque(maxlen=self.HISTORY_SIZE)  # Oldest price drops off on append
         self.running = False
+        self._stop = threading.Event()  # Set to end the data stream, even mid-wait
+        
+        # Running indicator state, updated in O(1) per tick
+        self._sma_sums = dict.fromkeys(self.SMA_PERIODS, 0.0)
+        self._emas = dict.fromkeys(self.EMA_PERIODS)  # None until enough prices to seed with an SMA
+        self._price_changes = deque(maxlen=self.RSI_PERIODS)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        
+        # Random draws are generated in batches and consumed one per tick
+        self._rng = np.random.default_rng(seed)
+        self._price_changes_batch: List[float] = []
+        self._volume_multipliers_batch: List[float] = []
+        self._batch_index = 0
     
     def generate_market_data(self) -> MarketData:
         """Generate realistic market data"""
         # Simulate price movement with some randomness
-        price_change = random.gauss(0, 0.02)  # 2% standard deviation
+        price_change, volume_multiplier = self._next_draws()
         self.current_price *= (1 + price_change)
         
         # Keep price within reasonable bounds
         self.current_price = max(50, min(250, self.current_price))
         
         # Update price history for indicators
-        self.price_history.append(self.current_price)
-        if len(self.price_history) > 200:  # Keep last 200 values
-            self.price_history.pop(0)
+        self._add_price(self.current_price)
         
         # Generate volume
-        volume_multiplier = random.uniform(0.5, 2.5)
         current_volume = self.base_volume * volume_multiplier
         
         # Calculate technical indicators
@@ -45,6 +65,18 @@ class MarketDataSimulator:
             timestamp=time.time()
         )
     
+    def _next_draws(self) -> tuple:
+        """Next tick's (price change, volume multiplier), refilling the batch when it runs out"""
+        if self._batch_index >= len(self._price_changes_batch):
+            # Plain floats: cheaper to index per tick than NumPy scalars
+            self._price_changes_batch = self._rng.normal(0, 0.02, self.RANDOM_BATCH).tolist()  # 2% standard deviation
+            self._volume_multipliers_batch = self._rng.uniform(0.5, 2.5, self.RANDOM_BATCH).tolist()
+            self._batch_index = 0
+        
+        i = self._batch_index
+        self._batch_index = i + 1
+        return self._price_changes_batch[i], self._volume_multipliers_batch[i]
+    
     def _calculate_indicators(self) -> Dict[str, float]:
         """Calculate technical indicators"""
         indicators = {}
@@ -56,9 +88,9 @@ class MarketDataSimulator:
             
             # Moving Averages
             if len(self.price_history) >= 20:
-                indicators['SMA 20'] = sum(self.price_history[-20:]) / 20
+                indicators['SMA 20'] = self._calculate_sma(20)
             if len(self.price_history) >= 50:
-                indicators['SMA 50'] = sum(self.price_history[-50:]) / 50
+                indicators['SMA 50'] = self._calculate_sma(50)
             if len(self.price_history) >= 10:
                 indicators['EMA 10'] = self._calculate_ema(10)
             
@@ -70,27 +102,50 @@ class MarketDataSimulator:
         
         return indicators
     
-    def _calculate_rsi(self, periods: int = 14) -> float:
+    def _add_price(self, price: float):
+        """Append a price to the history and roll the indicator state forward"""
+        history = self.price_history
+        
+        # Window sums: add the new price, drop the one leaving the window
+        for periods in self.SMA_PERIODS:
+            if len(history) >= periods:
+                self._sma_sums[periods] -= history[-periods]
+            self._sma_sums[periods] += price
+        
+        # Gains and losses over the last RSI_PERIODS price changes
+        if history:
+            if len(self._price_changes) == self.RSI_PERIODS:
+                oldest = self._price_changes[0]
+                self._gain_sum -= max(oldest, 0.0)
+                self._loss_sum -= max(-oldest, 0.0)
+            change = price - history[-1]
+            self._price_changes.append(change)
+            self._gain_sum += max(change, 0.0)
+            self._loss_sum += max(-change, 0.0)
+        
+        history.append(price)
+        
+        # EMAs are seeded with the SMA of their first `periods` prices
+        for periods, ema in self._emas.items():
+            if ema is not None:
+                multiplier = 2 / (periods + 1)
+                self._emas[periods] = (price * multiplier) + (ema * (1 - multiplier))
+            elif len(history) == periods:
+                self._emas[periods] = sum(history) / periods
+    
+    def _calculate_sma(self, periods: int) -> float:
+        """Simple Moving Average over the most recent prices"""
+        return self._sma_sums[periods] / periods
+    
+    def _calculate_rsi(self, periods: int = RSI_PERIODS) -> float:
         """Calculate RSI indicator"""
         if len(self.price_history) < periods + 1:
             return 50.0  # Neutral RSI
         
-        gains = []
-        losses = []
+        avg_gain = self._gain_sum / periods
+        avg_loss = self._loss_sum / periods
         
-        for i in range(1, len(self.price_history)):
-            change = self.price_history[i] - self.price_history[i-1]
-            if change >= 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        avg_gain = sum(gains[-periods:]) / periods
-        avg_loss = sum(losses[-periods:]) / periods
-        
-        if avg_loss == 0:
+        if avg_loss <= 0:
             return 100.0
         
         rs = avg_gain / avg_loss
@@ -99,33 +154,51 @@ class MarketDataSimulator:
         return rsi
     
     def _calculate_ema(self, periods: int) -> float:
-        """Calculate Exponential Moving Average"""
-        if len(self.price_history) < periods:
-            return sum(self.price_history) / len(self.price_history)
-        
-        # Calculate SMA for initial EMA
-        initial_sma = sum(self.price_history[:periods]) / periods
-        ema = initial_sma
-        multiplier = 2 / (periods + 1)
-        
-        # Calculate EMA
-        for price in self.price_history[periods:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-        
-        return ema
+        """Exponential Moving Average"""
+        return self._emas[periods]
+    
+    def replay(self, prices: List[float], volumes: Optional[List[float]] = None) -> List[MarketData]:
+        """Build market data for a whole price series at once, with indicators computed in bulk"""
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.full(prices.shape[0], float(self.base_volume)) if volumes is None else np.asarray(volumes, dtype=np.float64)
+        
+        # Same indicators, and the same history required for each, as the live stream
+        series = {
+            'RSI': (market_indicators.rsi(prices, self.RSI_PERIODS), self.RSI_PERIODS),
+            'SMA 20': (market_indicators.sma(prices, 20), 20),
+            'SMA 50': (market_indicators.sma(prices, 50), 50),
+            'EMA 10': (market_indicators.ema(prices, 10), self.RSI_PERIODS),
+            'MACD': (market_indicators.ema(prices, 12) - market_indicators.ema(prices, 26), 26),
+        }
+        columns = [(name, values.tolist(), min_history) for name, (values, min_history) in series.items()]
+        
+        now = time.time()
+        return [
+            MarketData(
+                symbol=self.symbol,
+                price=price,
+                volume=volume,
+                indicators={name: values[i] for name, values, min_history in columns if i + 1 >= min_history},
+                timestamp=now
+            )
+            for i, (price, volume) in enumerate(zip(prices.tolist(), volumes.tolist()))
+        ]
     
     def simulate_data_stream(self, callback, interval: float = 0.5):
         """Simulate continuous market data stream"""
         self.running = True
+        self._stop.clear()
         
-        while self.running:
+        while not self._stop.is_set():
             data = self.generate_market_data()
             callback(self.symbol, data)
-            time.sleep(interval)
+            self._stop.wait(interval)
+        self.running = False
     
     def stop_simulation(self):
         """Stop the simulation"""
         self.running = False
+        self._stop.set()
     
     def create_custom_scenario(self, scenario: str) -> MarketData:
         """Create specific market scenarios for testing"""
@@ -0,0 +1,59 @@
+"""
+Bulk technical indicator calculations for replaying price series
+Each function returns one value per price (NaN until enough history)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional JIT; the EMA recurrence runs as a Python loop instead
+    njit = None
+
+def sma(prices: np.ndarray, periods: int) -> np.ndarray:
+    """Simple Moving Average of the last `periods` prices"""
+    prices = np.asarray(prices, dtype=np.float64)
+    out = np.full(prices.shape[0], np.nan)
+    if prices.shape[0] >= periods:
+        sums = np.cumsum(np.concatenate(([0.0], prices)))
+        out[periods - 1:] = (sums[periods:] - sums[:-periods]) / periods
+    return out
+
+def rsi(prices: np.ndarray, periods: int = 14) -> np.ndarray:
+    """RSI from the average gain and loss over the last `periods` price changes (50 while too short)"""
+    prices = np.asarray(prices, dtype=np.float64)
+    out = np.full(prices.shape[0], 50.0)
+    if prices.shape[0] > periods:
+        changes = np.diff(prices)
+        gains = np.cumsum(np.concatenate(([0.0], np.maximum(changes, 0.0))))
+        losses = np.cumsum(np.concatenate(([0.0], np.maximum(-changes, 0.0))))
+        avg_gain = (gains[periods:] - gains[:-periods]) / periods
+        avg_loss = (losses[periods:] - losses[:-periods]) / periods
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = 100 - (100 / (1 + avg_gain / avg_loss))
+        out[periods:] = np.where(avg_loss > 0, values, 100.0)
+    return out
+
+def _ema_loop(prices, periods, out):
+    """EMA recurrence seeded with the SMA of the first `periods` prices"""
+    multiplier = 2 / (periods + 1)
+    ema = 0.0
+    for i in range(periods):
+        ema += prices[i]
+    ema /= periods
+    out[periods - 1] = ema
+    for i in range(periods, len(prices)):
+        ema = (prices[i] * multiplier) + (ema * (1 - multiplier))
+        out[i] = ema
+
+if njit is not None:
+    _ema_loop = njit(cache=True)(_ema_loop)
+
+def ema(prices: np.ndarray, periods: int) -> np.ndarray:
+    """Exponential Moving Average"""
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    out = np.full(prices.shape[0], np.nan)
+    if prices.shape[0] >= periods:
+        # Plain floats make the interpreted loop much cheaper than indexing the array
+        _ema_loop(prices if njit is not None else prices.tolist(), periods, out)
+    return out
@@ -6,10 +6,15 @@ Handles environment-specific settings, secrets, and security
 import os
 import logging
 import secrets
+import threading
+from functools import lru_cache, cached_property
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+# Module logger: root-level logging calls would install a default root handler before logging is set up
+logger = logging.getLogger(__name__)
+
 @dataclass
 class DatabaseConfig:
     """Database configuration"""
@@ -21,6 +26,13 @@ class DatabaseConfig:
     ssl_mode: str = "require"
     pool_size: int = 10
     max_overflow: int = 20
+    
+    @cached_property
+    def url(self) -> str:
+        """Connection URL, built on first use (a reloaded config brings a new DatabaseConfig)"""
+        if self.password:
+            return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.name}"
+        return f"postgresql://{self.username}@{self.host}:{self.port}/{self.name}"
 
 @dataclass
 class BrokerConfig:
@@ -68,61 +80,89 @@ class RiskConfig:
     emergency_stop_loss_percentage: float = 0.05
     max_positions_per_symbol: int = 3
 
+_TRUTHY = frozenset(('1', 'true', 'yes', 'on'))  # Accepted spellings of an enabled flag (any case)
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value"""
+    return value.strip().casefold() in _TRUTHY
+
+# Environment variable -> config field: (variable, section (None for top level), attribute, parser, default)
+ENV_SPECS = [
+    # Environment settings
+    ('ENVIRONMENT', None, 'environment', str, 'production'),
+    ('DEBUG', None, 'debug', _parse_bool, False),
+    ('SHUTDOWN_GRACE_SECONDS', None, 'shutdown_grace_seconds', float, 10.0),
+    
+    # Database settings
+    ('DB_HOST', 'database', 'host', str, 'localhost'),
+    ('DB_PORT', 'database', 'port', int, 5432),
+    ('DB_NAME', 'database', 'name', str, 'condition_task_list_trader'),
+    ('DB_USERNAME', 'database', 'username', str, 'postgres'),
+    ('DB_PASSWORD', 'database', 'password', str, None),
+    ('DB_SSL_MODE', 'database', 'ssl_mode', str, 'require'),
+    
+    # Broker settings
+    ('ALPACA_API_KEY', 'brokers', 'alpaca_api_key', str, None),
+    ('ALPACA_API_SECRET', 'brokers', 'alpaca_api_secret', str, None),
+    ('ALPACA_PAPER', 'brokers', 'alpaca_paper', _parse_bool, True),
+    ('BINANCE_API_KEY', 'brokers', 'binance_api_key', str, None),
+    ('BINANCE_API_SECRET', 'brokers', 'binance_api_secret', str, None),
+    ('BINANCE_TESTNET', 'brokers', 'binance_testnet', _parse_bool, True),
+    
+    # Security settings
+    ('SECRET_KEY', 'security', 'secret_key', str, None),
+    ('JWT_EXPIRATION_HOURS', 'security', 'jwt_expiration_hours', int, 24),
+    ('RATE_LIMIT_REQUESTS', 'security', 'rate_limit_requests', int, 100),
+    ('LOG_SENSITIVE_DATA', 'security', 'log_sensitive_data', _parse_bool, False),
+    
+    # Monitoring settings
+    ('ENABLE_PROMETHEUS', 'monitoring', 'enable_prometheus', _parse_bool, True),
+    ('PROMETHEUS_PORT', 'monitoring', 'prometheus_port', int, 8000),
+    ('LOG_LEVEL', 'monitoring', 'log_level', str.upper, 'INFO'),
+    ('ENABLE_ERROR_ALERTS', 'monitoring', 'enable_error_alerts', _parse_bool, True),
+    
+    # Risk settings
+    ('MAX_POSITION_SIZE', 'risk', 'max_position_size', float, 10000.0),
+    ('MAX_DAILY_LOSS', 'risk', 'max_daily_loss', float, 1000.0),
+    ('STOP_LOSS_PERCENTAGE', 'risk', 'stop_loss_percentage', float, 0.02),
+    ('TAKE_PROFIT_PERCENTAGE', 'risk', 'take_profit_percentage', float, 0.05),
+    ('MAX_RISK_PER_TRADE', 'risk', 'max_risk_per_trade', float, 0.01),
+    ('REQUIRE_MANUAL_CONFIRMATION', 'risk', 'require_manual_confirmation', _parse_bool, False),
+]
+
+# Upper bounds on risk settings: (RiskConfig attribute, maximum, issue reported above it)
+RISK_LIMITS = [
+    ('max_risk_per_trade', 0.05, "Max risk per trade should not exceed 5%"),
+    ('stop_loss_percentage', 0.10, "Stop loss percentage should not exceed 10%"),
+]
+
 @dataclass
 class ProductionConfig:
     """Complete production configuration"""
     environment: str = "development"
     debug: bool = False
-    database: DatabaseConfig = DatabaseConfig()
-    brokers: BrokerConfig = BrokerConfig()
-    security: SecurityConfig = SecurityConfig()
-    monitoring: MonitoringConfig = MonitoringConfig()
-    risk: RiskConfig = RiskConfig()
+    shutdown_grace_seconds: float = 10.0  # How long shutdown waits for components to stop
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    brokers: BrokerConfig = field(default_factory=BrokerConfig)
+    security: SecurityConfig = field(default_factory=SecurityConfig)
+    monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    risk: RiskConfig = field(default_factory=RiskConfig)
     
     @classmethod
+    @lru_cache(maxsize=1)
     def from_environment(cls) -> 'ProductionConfig':
-        """Load configuration from environment variables"""
+        """Load configuration from environment variables (cached; call from_environment.cache_clear() to re-read)"""
         config = cls()
+        environ = os.environ
         
-        # Environment settings
-        config.environment = os.getenv('ENVIRONMENT', 'production')
-        config.debug = os.getenv('DEBUG', 'false').lower() == 'true'
-        
-        # Database settings
-        config.database.host = os.getenv('DB_HOST', 'localhost')
-        config.database.port = int(os.getenv('DB_PORT', 5432))
-        config.database.name = os.getenv('DB_NAME', 'condition_task_list_trader')
-        config.database.username = os.getenv('DB_USERNAME', 'postgres')
-        config.database.password = os.getenv('DB_PASSWORD')
-        config.database.ssl_mode = os.getenv('DB_SSL_MODE', 'require')
-        
-        # Broker settings
-        config.brokers.alpaca_api_key = os.getenv('ALPACA_API_KEY')
-        config.brokers.alpaca_api_secret = os.getenv('ALPACA_API_SECRET')
-        config.brokers.alpaca_paper = os.getenv('ALPACA_PAPER', 'true').lower() == 'true'
-        config.brokers.binance_api_key = os.getenv('BINANCE_API_KEY')
-        config.brokers.binance_api_secret = os.getenv('BINANCE_API_SECRET')
-        config.brokers.binance_testnet = os.getenv('BINANCE_TESTNET', 'true').lower() == 'true'
-        
-        # Security settings
-        config.security.secret_key = os.getenv('SECRET_KEY', secrets.token_urlsafe(32))
-        config.security.jwt_expiration_hours = int(os.getenv('JWT_EXPIRATION_HOURS', 24))
-        config.security.rate_limit_requests = int(os.getenv('RATE_LIMIT_REQUESTS', 100))
-        config.security.log_sensitive_data = os.getenv('LOG_SENSITIVE_DATA', 'false').lower() == 'true'
-        
-        # Monitoring settings
-        config.monitoring.enable_prometheus = os.getenv('ENABLE_PROMETHEUS', 'true').lower() == 'true'
-        config.monitoring.prometheus_port = int(os.getenv('PROMETHEUS_PORT', 8000))
-        config.monitoring.log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
-        config.monitoring.enable_error_alerts = os.getenv('ENABLE_ERROR_ALERTS', 'true').lower() == 'true'
+        for env_name, section, attr, parser, default in ENV_SPECS:
+            raw = environ.get(env_name)
+            target = getattr(config, section) if section else config
+            setattr(target, attr, default if raw is None else parser(raw))
         
-        # Risk settings
-        config.risk.max_position_size = float(os.getenv('MAX_POSITION_SIZE', 10000.0))
-        config.risk.max_daily_loss = float(os.getenv('MAX_DAILY_LOSS', 1000.0))
-        config.risk.stop_loss_percentage = float(os.getenv('STOP_LOSS_PERCENTAGE', 0.02))
-        config.risk.take_profit_percentage = float(os.getenv('TAKE_PROFIT_PERCENTAGE', 0.05))
-        config.risk.max_risk_per_trade = float(os.getenv('MAX_RISK_PER_TRADE', 0.01))
-        config.risk.require_manual_confirmation = os.getenv('REQUIRE_MANUAL_CONFIRMATION', 'false').lower() == 'true'
+        # Never run without a secret key: generate a throwaway one if none is configured
+        if config.security.secret_key is None:
+            config.security.secret_key = secrets.token_urlsafe(32)
         
         return config
     
@@ -145,11 +185,9 @@ class ProductionConfig:
                 issues.append("Secret key should be at least 32 characters")
         
         # Check risk settings
-        if self.risk.max_risk_per_trade > 0.05:  # 5%
-            issues.append("Max risk per trade should not exceed 5%")
-        
-        if self.risk.stop_loss_percentage > 0.10:  # 10%
-            issues.append("Stop loss percentage should not exceed 10%")
+        for attr, maximum, issue in RISK_LIMITS:
+            if getattr(self.risk, attr) > maximum:
+                issues.append(issue)
         
         return {
             'valid': len(issues) == 0,
@@ -159,12 +197,7 @@ class ProductionConfig:
     
     def get_database_url(self) -> str:
         """Get database connection URL"""
-        if self.database.password:
-            return (f"postgresql://{self.database.username}:{self.database.password}@"
-                   f"{self.database.host}:{self.database.port}/{self.database.name}")
-        else:
-            return (f"postgresql://{self.database.username}@"
-                   f"{self.database.host}:{self.database.port}/{self.database.name}")
+        return self.database.url
 
 class ConfigManager:
     """Manages configuration loading and validation"""
@@ -172,17 +205,18 @@ class ConfigManager:
     def __init__(self, config_path: str = None):
         self.config_path = config_path or "production_config.yaml"
         self.config = ProductionConfig.from_environment()
+        self.validation = None  # Result of validating the loaded config, computed once per load
         self._validate_and_log()
     
     def _validate_and_log(self):
         """Validate configuration and log results"""
-        validation = self.config.validate()
+        validation = self.validation = self.config.validate()
         
         if validation['valid']:
-            logging.info(f"✅ Configuration valid for {validation['environment']} environment")
+            logger.info(f"✅ Configuration valid for {validation['environment']} environment")
         else:
             for issue in validation['issues']:
-                logging.warning(f"⚠️ Configuration issue: {issue}")
+                logger.warning(f"⚠️ Configuration issue: {issue}")
             
             if self.config.environment == 'production':
                 raise ValueError("Configuration validation failed for production deployment")
@@ -193,8 +227,26 @@ class ConfigManager:
     
     def reload_config(self):
         """Reload configuration from environment"""
+        ProductionConfig.from_environment.cache_clear()
         self.config = ProductionConfig.from_environment()
         self._validate_and_log()
 
-# Global configuration instance
-config_manager = ConfigManager()
+# Global configuration instance, created on first use rather than at import
+_config_manager = None
+_config_manager_lock = threading.Lock()
+
+def get_config_manager() -> ConfigManager:
+    """Return the global configuration manager, loading and validating the config on first call"""
+    global _config_manager
+    if _config_manager is None:
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager()
+    return _config_manager
+
+def __getattr__(name: str):
+    """Resolve `config_manager` lazily, so importing this module reads no environment"""
+    if name == 'config_manager':
+        manager = globals()['config_manager'] = get_config_manager()
+        return manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,13 +8,28 @@ import logging.handlers
 import json
 import time
 import os
+import copy
+import queue
+import atexit
+import re
 import sys
+import threading
 from typing import Dict, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import traceback
-from functools import wraps
+from functools import wraps, lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional C encoder for log lines; the standard json module is used otherwise
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; the keyword prefilter falls back to plain substring scans
+    ahocorasick = None
 
 @dataclass
 class LogEntry:
@@ -36,86 +51,281 @@ class SecurityFilter(logging.Filter):
         'password', 'api_key', 'api_secret', 'token', 
         'secret', 'credential', 'key', 'auth', 'private'
     ]
+    # Every field appears in one of these, so text without them needs no regex work
+    _KEYWORDS = ('password', 'token', 'secret', 'credential', 'key', 'auth', 'private')
+    # Compiled once, applied in field order: "field: value", "field='value'", ...
+    _PATTERNS = [
+        (re.compile(rf'{field}["\':\s]+["\']*([^"\'\s,}}]+)["\']*', re.IGNORECASE), f'{field}="[REDACTED]"')
+        for field in SENSITIVE_FIELDS
+    ]
+    _KEYWORD_AUTOMATON = None  # Aho-Corasick automaton matching every keyword in one pass (when installed)
+    if ahocorasick is not None:
+        _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+        for _keyword in _KEYWORDS:
+            _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+        _KEYWORD_AUTOMATON.make_automaton()
+        del _keyword
+    MIN_SENSITIVE_LENGTH = 5  # Shortest redactable text: "key" plus a separator and one value character
+    
+    def __init__(self, config=None):
+        super().__init__()
+        # Deployments that opt into logging sensitive data skip sanitizing altogether
+        self.allow_sensitive_data = bool(config is not None and config.security.log_sensitive_data)
     
     def filter(self, record):
         """Replace sensitive data in log records"""
+        if self.allow_sensitive_data:
+            return True
+        if not record.args and isinstance(record.msg, str) and len(record.msg) < self.MIN_SENSITIVE_LENGTH:
+            return True  # Too short to hold any "field: value" pair
         if hasattr(record, 'msg') and record.msg:
-            record.msg = self._sanitize_data(record.msg)
-        
-        if hasattr(record, 'args') and record.args:
-            record.args = tuple(self._sanitize_data(str(arg)) for arg in record.args)
+            try:
+                message = record.getMessage()
+            except Exception:
+                return True  # Malformed arguments are reported by the handler when it formats the record
+            
+            # Sanitize the formatted text: redacting the template alone could drop its placeholders
+            sanitized = self._sanitize_data(message)
+            if sanitized != message:
+                record.msg, record.args = sanitized, ()
         
         return True
     
+    def _has_keyword(self, lowered: str) -> bool:
+        """Whether lowercased text contains any sensitive keyword"""
+        if self._KEYWORD_AUTOMATON is not None:
+            return next(self._KEYWORD_AUTOMATON.iter(lowered), None) is not None
+        for keyword in self._KEYWORDS:  # A loop stops sooner and costs less than any() over a generator
+            if keyword in lowered:
+                return True
+        return False
+    
     def _sanitize_data(self, data: str) -> str:
         """Replace sensitive data with placeholder"""
-        sanitized = data
-        for field in self.SENSITIVE_FIELDS:
-            # Simple pattern matching for sensitive fields
-            import re
-            pattern = rf'{field}["\':\s]+["\']*([^"\'\s,}}]+)["\']*'
-            sanitized = re.sub(pattern, f'{field}="[REDACTED]"', sanitized, flags=re.IGNORECASE)
-        return sanitized
+        if not self._has_keyword(data.lower()):
+            return data
+        for pattern, replacement in self._PATTERNS:
+            data = pattern.sub(replacement, data)
+        return data
 
 class StructuredFormatter(logging.Formatter):
     """JSON structured logging formatter"""
     
+    OPTIONAL_FIELDS = ('session_id', 'user_id', 'trade_id')  # Copied from extra when a record carries them
+    
     def __init__(self, include_metadata: bool = True):
         super().__init__()
         self.include_metadata = include_metadata
+        self._second_cache = (None, '')  # (whole epoch second, its ISO text) of the previous record
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO timestamp with microseconds, reusing the date/time text within the same second"""
+        second = int(created)
+        micros = round((created - second) * 1e6)
+        if micros == 1000000:  # Rounds up into the next second
+            return datetime.fromtimestamp(created).isoformat(timespec='microseconds')
+        if second != self._second_cache[0]:
+            self._second_cache = (second, datetime.fromtimestamp(second).isoformat())
+        return f"{self._second_cache[1]}.{micros:06d}"
     
     def format(self, record):
         """Format log record as JSON"""
+        fields = record.__dict__  # extra values live here; one dict lookup each instead of hasattr + getattr
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'message': record.getMessage(),
-            'component': getattr(record, 'component', 'unknown'),
+            'component': fields.get('component', 'unknown'),
             'function': record.funcName,
             'line': record.lineno,
             'module': record.module
         }
         
         # Add optional fields if present
-        optional_fields = ['session_id', 'user_id', 'trade_id']
-        for field in optional_fields:
-            if hasattr(record, field):
-                log_entry[field] = getattr(record, field)
+        for field in self.OPTIONAL_FIELDS:
+            if field in fields:
+                log_entry[field] = fields[field]
         
         # Add metadata if available
-        if self.include_metadata and hasattr(record, 'metadata'):
-            log_entry['metadata'] = record.metadata
+        if self.include_metadata and 'metadata' in fields:
+            log_entry['metadata'] = fields['metadata']
         
         # Add error details for exceptions
         if record.exc_info:
             log_entry['error_details'] = {
                 'type': record.exc_info[0].__name__,
                 'message': str(record.exc_info[1]),
-                'traceback': traceback.format_exception(*record.exc_info)
+                'traceback': _traceback_text(*record.exc_info)
             }
         
-        return json.dumps(log_entry, default=str, separators=(',', ':'))
+        return _dumps_log_entry(log_entry)
+
+_TRACEBACK_CACHE_SIZE = 32  # Recently rendered exceptions kept for the other handlers and repeat logs
+_traceback_cache: Dict[int, tuple] = {}  # id(exception) -> (exception, rendered traceback)
+
+def _traceback_text(exc_type, exc, tb) -> str:
+    """Rendered traceback, formatted once per exception however many handlers write it"""
+    cached = _traceback_cache.get(id(exc))
+    # The entry holds the exception itself, so its id cannot be reused while cached
+    if cached is not None and cached[0] is exc:
+        return cached[1]
+    
+    text = ''.join(traceback.TracebackException(exc_type, exc, tb).format())
+    if len(_traceback_cache) >= _TRACEBACK_CACHE_SIZE:
+        _traceback_cache.pop(next(iter(_traceback_cache)), None)  # Oldest first
+    _traceback_cache[id(exc)] = (exc, text)
+    return text
+
+def _dumps_log_entry(log_entry: Dict[str, Any]) -> str:
+    """Compact JSON for a log entry, through orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the standard encoder handles them
+    return json.dumps(log_entry, default=str, separators=(',', ':'))
+
+AUDIT_LOGGER_NAME = "trading.audit"  # Records logged here also land in trades.log
+_audit_sink = None  # AuditSink owning trades.log while file logging is set up
+
+class AuditSink:
+    """Appends pre-serialized JSON lines to the trade audit log, bypassing LogRecord handling"""
+    
+    FLUSH_INTERVAL = 0.25  # Seconds between background flushes of the write buffer
+    BUFFER_BYTES = 1 << 20
+    ROTATE_CHECK_WRITES = 256  # File size is checked for rotation once per this many writes
+    
+    def __init__(self, path: Path, max_bytes: int = 20*1024*1024, backup_count: int = 20):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._stream = open(self.path, 'ab', buffering=self.BUFFER_BYTES)
+        self._writes = 0
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="audit-sink-flush")
+        self._flusher.start()
+    
+    def write(self, event: Dict[str, Any]):
+        """Serialize one audit event as a JSON line"""
+        self.write_line(_dumps_log_entry(event))
+    
+    def write_line(self, line: str):
+        """Append an already serialized JSON line"""
+        data = line.encode() + b'\n'
+        with self._lock:
+            if self._stream is None:
+                return  # Closed during shutdown
+            self._stream.write(data)
+            self._writes += 1
+            if self._writes % self.ROTATE_CHECK_WRITES == 0 and self._stream.tell() >= self.max_bytes:
+                self._rotate()
+    
+    def flush(self):
+        """Push buffered lines to the file"""
+        with self._lock:
+            if self._stream is not None:
+                self._stream.flush()
+    
+    def close(self):
+        """Stop the flush thread and close the file"""
+        self._closed.set()
+        with self._lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+    
+    def _flush_loop(self):
+        """Flush the buffer every FLUSH_INTERVAL until closed"""
+        while not self._closed.wait(self.FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"⚠️  Audit log flush failed: {e}", file=sys.stderr)
+    
+    def _rotate(self):
+        """Shift trades.log to trades.log.1 and so on, as RotatingFileHandler names its backups"""
+        self._stream.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{i}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backup_count > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._stream = open(self.path, 'ab', buffering=self.BUFFER_BYTES)
+
+class _AuditSinkHandler(logging.Handler):
+    """Writes audit records that still go through logging into the AuditSink's file"""
+    
+    def __init__(self, sink: AuditSink):
+        super().__init__(logging.INFO)
+        self.sink = sink
+    
+    def close(self):
+        """Close the sink along with the handler (closing an already closed sink is a no-op)"""
+        self.sink.close()
+        super().close()
+    
+    def emit(self, record):
+        """Format the record and append it to trades.log"""
+        try:
+            self.sink.write_line(self.format(record))
+        except Exception:
+            self.handleError(record)
 
 class ProductionLogger:
     """Production-ready logging system"""
     
+    _initialized = False  # Root handlers are installed once per process, by the first instance
+    _setup_lock = threading.Lock()
+    
     def __init__(self, config):
         self.config = config
         self.loggers = {}
+        self._listener = None  # Writes queued records to the real handlers on its own thread
+        self._audit_sink = None
+        self._queue_handler = None
         self._setup_logging()
     
     def _setup_logging(self):
-        """Setup logging configuration"""
+        """Setup logging configuration (once; later instances share the running setup)"""
+        with ProductionLogger._setup_lock:
+            if ProductionLogger._initialized:
+                return
+            
+            handlers = []
+            try:
+                audit_sink = self._build_handlers(handlers)
+            except Exception:
+                # Leave nothing half set up: the next instance retries from scratch
+                for handler in handlers:
+                    handler.close()
+                raise
+            
+            # Root logger setup; handlers other libraries installed on it are left in place
+            root_logger = logging.getLogger()
+            root_logger.setLevel(getattr(logging, self.config.monitoring.log_level))
+            
+            # Logging threads only enqueue records; formatting, filtering and file I/O run on the listener
+            global _audit_sink
+            if audit_sink is not None:
+                _audit_sink = self._audit_sink = audit_sink
+            log_queue = queue.SimpleQueue()
+            self._queue_handler = LocalQueueHandler(log_queue)
+            root_logger.addHandler(self._queue_handler)
+            self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self.shutdown)
+            ProductionLogger._initialized = True  # Only once setup has fully succeeded
+    
+    def _build_handlers(self, handlers: list) -> Optional['AuditSink']:
+        """Create the log directory and append the output handlers; returns the trade log's sink"""
         # Create log directory if it doesn't exist
         log_dir = Path(self.config.monitoring.log_file_path)
         log_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Root logger setup
-        root_logger = logging.getLogger()
-        root_logger.setLevel(getattr(logging, self.config.monitoring.log_level))
-        
-        # Clear existing handlers
-        root_logger.handlers.clear()
+        audit_sink = None
         
         # Console handler (human readable for terminal)
         console_handler = logging.StreamHandler(sys.stdout)
@@ -125,7 +335,7 @@ class ProductionLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler (structured JSON)
         if self.config.monitoring.file_logging:
@@ -136,9 +346,9 @@ class ProductionLogger:
                 backupCount=10
             )
             file_handler.setLevel(getattr(logging, self.config.monitoring.log_level))
-            file_handler.addFilter(SecurityFilter())
+            file_handler.addFilter(SecurityFilter(self.config))
             file_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
             # Error log file (for critical errors)
             error_log_file = log_dir / "errors.log"
@@ -148,47 +358,93 @@ class ProductionLogger:
                 backupCount=5
             )
             error_handler.setLevel(logging.ERROR)
-            error_handler.addFilter(SecurityFilter())
+            error_handler.addFilter(SecurityFilter(self.config))
             error_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(error_handler)
+            handlers.append(error_handler)
             
-            # Trade log file (for audit trail)
-            trade_log_file = log_dir / "trades.log"
-            trade_handler = logging.handlers.RotatingFileHandler(
-                str(trade_log_file),
-                maxBytes=20*1024*1024,  # 20MB
-                backupCount=20
-            )
-            trade_handler.setLevel(logging.INFO)
-            trade_handler.addFilter(TradeLogFilter())
+            # Trade log file (for audit trail), fed only by the audit logger's records
+            # (a name check) rather than a trade-keyword scan of every message.
+            # Trade executions are written to it directly by the sink; records logged by
+            # name reach the same file through a handler
+            audit_sink = AuditSink(log_dir / "trades.log", max_bytes=20*1024*1024, backup_count=20)  # 20MB
+            trade_handler = _AuditSinkHandler(audit_sink)
+            trade_handler.addFilter(logging.Filter(AUDIT_LOGGER_NAME))
             trade_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(trade_handler)
+            handlers.append(trade_handler)
+        
+        return audit_sink
+    
+    def shutdown(self):
+        """Write out every queued record and stop the listener thread"""
+        global _audit_sink
+        if self._listener is None:
+            return  # Never set up, or already shut down
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._queue_handler = None
+        self._listener.stop()
+        self._listener = None
+        if self._audit_sink is not None:
+            # After the listener, which may still be writing audit records through it
+            if _audit_sink is self._audit_sink:
+                _audit_sink = None
+            self._audit_sink.close()
+            self._audit_sink = None
+        with ProductionLogger._setup_lock:
+            ProductionLogger._initialized = False  # A new instance may set logging up again
     
-    def get_logger(self, name: str, component: str = None) -> logging.Logger:
-        """Get configured logger with additional fields"""
+    def get_logger(self, name: str, component: str = None):
+        """Get configured logger, tagging its records with component if provided"""
         logger = logging.getLogger(name)
         
-        # Add component information if provided
+        # Tag only this logger's records; the global record factory is left alone
         if component:
-            old_factory = logging.getLogRecordFactory()
-            
-            def record_factory(*args, **kwargs):
-                record = old_factory(*args, **kwargs)
-                record.component = component
-                return record
-            
-            logging.setLogRecordFactory(record_factory)
+            return ComponentLoggerAdapter(logger, {'component': component})
         
         return logger
 
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queues records for a listener in this process, keeping exc_info for StructuredFormatter"""
+    
+    def prepare(self, record):
+        """Merge args into the message now (they may change later) without pre-formatting the record"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class ComponentLoggerAdapter(logging.LoggerAdapter):
+    """Adds a default component to records; an explicit extra={'component': ...} still wins"""
+    
+    def process(self, msg, kwargs):
+        """Merge the adapter's fields under the caller's extra instead of replacing it"""
+        extra = kwargs.get('extra')
+        kwargs['extra'] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
 class TradeLogFilter(logging.Filter):
-    """Filter for trade-related logs"""
+    """Filter for trade-related logs (for handlers that pick trades out of general traffic)"""
+    
+    TRADE_KEYWORDS = ('trade', 'order', 'position', 'execution', 'broker')
     
     def filter(self, record):
         """Only allow trade-related logs"""
-        trade_keywords = ['trade', 'order', 'position', 'execution', 'broker']
-        message = record.getMessage().lower()
-        return any(keyword in message for keyword in trade_keywords)
+        # Check the unformatted template first; args are only interpolated when it has no keyword
+        if isinstance(record.msg, str):
+            if self._has_keyword(record.msg.lower()):
+                return True
+            if not record.args:
+                return False
+        try:
+            return self._has_keyword(record.getMessage().lower())
+        except Exception:
+            return False  # Malformed arguments; the other handlers report the record
+    
+    def _has_keyword(self, lowered: str) -> bool:
+        """Whether lowercased text mentions trading"""
+        for keyword in self.TRADE_KEYWORDS:
+            if keyword in lowered:
+                return True
+        return False
 
 class AuditLogger:
     """Specialized logger for compliance and audit trails"""
@@ -198,24 +454,43 @@ class AuditLogger:
     
     def log_trade_execution(self, trade_data: Dict[str, Any]):
         """Log trade execution for audit"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        metadata = {
+            'symbol': trade_data.get('symbol'),
+            'quantity': trade_data.get('quantity'),
+            'price': trade_data.get('price'),
+            'order_type': trade_data.get('order_type'),
+            'broker': trade_data.get('broker'),
+            'timestamp': trade_data.get('timestamp')
+        }
+        
+        sink = _audit_sink
+        if sink is not None:
+            # Same fields StructuredFormatter writes, serialized straight into trades.log
+            sink.write({
+                'timestamp': datetime.now().isoformat(timespec='microseconds'),
+                'level': 'INFO',
+                'message': "Trade executed",
+                'component': 'trade_executor',
+                'trade_id': trade_data.get('execution_id'),
+                'metadata': metadata
+            })
+            return
+        
         self.logger.info(
             "Trade executed",
             extra={
                 'component': 'trade_executor',
                 'trade_id': trade_data.get('execution_id'),
-                'metadata': {
-                    'symbol': trade_data.get('symbol'),
-                    'quantity': trade_data.get('quantity'),
-                    'price': trade_data.get('price'),
-                    'order_type': trade_data.get('order_type'),
-                    'broker': trade_data.get('broker'),
-                    'timestamp': trade_data.get('timestamp')
-                }
+                'metadata': metadata
             }
         )
     
     def log_condition_change(self, condition_data: Dict[str, Any]):
         """Log condition status changes"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "Condition status changed",
             extra={
@@ -233,6 +508,8 @@ class AuditLogger:
     
     def log_security_event(self, security_event: Dict[str, Any]):
         """Log security-related events"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         self.logger.warning(
             f"Security event: {security_event.get('event_type')}",
             extra={
@@ -256,20 +533,20 @@ class MetricsLogger:
     
     def log_timing(self, operation: str, duration: float, metadata: Dict = None):
         """Log operation timing"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return  # Skip building the message and metadata for a filtered record
+        fields = {'operation': operation, 'duration_seconds': duration}
+        if metadata:
+            fields.update(metadata)
         self.logger.info(
             f"Operation timing: {operation}",
-            extra={
-                'component': 'performance',
-                'metadata': {
-                    'operation': operation,
-                    'duration_seconds': duration,
-                    **(metadata or {})
-                }
-            }
+            extra={'component': 'performance', 'metadata': fields}
         )
     
     def log_memory_usage(self, component: str, memory_mb: float):
         """Log memory usage"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(
             f"Memory usage: {component}",
             extra={
@@ -284,6 +561,8 @@ class MetricsLogger:
     
     def log_error_rate(self, component: str, errors: int, total: float):
         """Log error rate"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         error_rate = (errors / total) * 100 if total > 0 else 0
         self.logger.info(
             f"Error rate for {component}: {error_rate:.2f}%",
@@ -302,49 +581,67 @@ class MetricsLogger:
 def log_execution_time(logger: logging.Logger = None):
     """Decorator to log function execution time"""
     def decorator(func):
+        target_logger = logger or logging.getLogger(func.__module__)  # Resolved once per decorated function
+        name = func.__name__
+        # Message templates are built per function; records keep their own metadata
+        # dict because the queue listener formats them after the call returns
+        executed_template = f"Function {name} executed in %.3fs"
+        failed_template = f"Function {name} failed after %.3fs: %s"
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
-                
-                target_logger = logger or logging.getLogger(func.__module__)
-                target_logger.debug(
-                    f"Function {func.__name__} executed in {duration:.3f}s",
-                    extra={'component': 'performance', 'metadata': {'function': func.__name__, 'duration': duration}}
-                )
-                
-                return result
             except Exception as e:
-                duration = time.time() - start_time
-                target_logger = logger or logging.getLogger(func.__module__)
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 target_logger.error(
-                    f"Function {func.__name__} failed after {duration:.3f}s: {str(e)}",
-                    extra={'component': 'performance', 'metadata': {'function': func.__name__, 'duration': duration}}
+                    failed_template, duration, e,
+                    extra={'component': 'performance', 'metadata': {'function': name, 'duration': duration}}
                 )
                 raise
+            
+            if target_logger.isEnabledFor(logging.DEBUG):
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                target_logger.debug(
+                    executed_template, duration,
+                    extra={'component': 'performance', 'metadata': {'function': name, 'duration': duration}}
+                )
+            return result
         return wrapper
     return decorator
 
-# Global logger instances
+# Global logger instances (each built once; later calls return the same one)
+@lru_cache(maxsize=1)
 def get_production_logger():
     """Get production logger instance"""
-    from production_config import config_manager
-    production_logger = ProductionLogger(config_manager.get_config())
+    from production_config import get_config_manager
+    production_logger = ProductionLogger(get_config_manager().get_config())
     return production_logger.get_logger("condition_task_list_trader", "main_application")
 
+@lru_cache(maxsize=1)
 def get_audit_logger():
     """Get audit logger for compliance"""
-    base_logger = logging.getLogger("audit")
+    base_logger = logging.getLogger(AUDIT_LOGGER_NAME)
     return AuditLogger(base_logger)
 
+@lru_cache(maxsize=1)
 def get_metrics_logger():
     """Get metrics logger"""
     base_logger = logging.getLogger("metrics")
     return MetricsLogger(base_logger)
 
-# Initialize logging system
-production_logger = get_production_logger()
-audit_logger = get_audit_logger()
-metrics_logger = get_metrics_logger()
+# Module-level loggers, set up on first access so importing this module configures nothing
+_LAZY_LOGGERS = {
+    'production_logger': get_production_logger,
+    'audit_logger': get_audit_logger,
+    'metrics_logger': get_metrics_logger
+}
+
+def __getattr__(name: str):
+    """Build `production_logger`, `audit_logger` and `metrics_logger` on first access"""
+    getter = _LAZY_LOGGERS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    logger = globals()[name] = getter()
+    return logger
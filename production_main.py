@@ -10,6 +10,9 @@ import threading
 import time
 import logging
 from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import psutil
 
 # Add application directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -17,24 +20,23 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import production components
 from production_config import config_manager
 from production_logger import get_production_logger, production_logger
-from health_checks import health_monitor, RecoveryManager, HealthCheckServer
-from conversation_manager import conversation_manager
-
-# Import application components
-from condition_parser import ConditionParser
-from conditions_matcher import ConditionsMatcher
-from trade_executor import TradeExecutor
-from market_data_simulator import MarketDataSimulator
-from broker_integrations import BrokerManager
+from health_checks import (
+    health_monitor, RecoveryManager, HealthCheckServer,
+    DatabaseHealthCheck, BrokerHealthCheck, MemoryHealthCheck, DiskSpaceHealthCheck, ConditionsEngineHealthCheck
+)
+from conversation_manager import get_conversation_manager
 
 class ProductionApplication:
     """Production-ready application wrapper"""
     
+    STATUS_LOG_INTERVAL = 300.0  # Seconds between periodic system status logs
+    
     def __init__(self):
         self.config = config_manager.get_config()
         self.logger = production_logger
         self.running = False
         self.shutdown_event = threading.Event()
+        self._wake = threading.Event()  # Set on shutdown or a health alert to wake the main loop early
         
         # Application components
         self.parser = None
@@ -47,6 +49,9 @@ class ProductionApplication:
         self.health_server = None
         self.recovery_manager = None
         
+        # Prime the CPU counter so status logs can read usage since the last call without sleeping
+        psutil.cpu_percent(interval=None)
+        
         # Setup graceful shutdown
         self._setup_signal_handlers()
     
@@ -65,20 +70,25 @@ class ProductionApplication:
         self.logger.info("Initializing production application...")
         
         try:
-            # Validate configuration
-            validation = self.config.validate()
+            # Configuration was validated when it was loaded
+            validation = config_manager.validation
             if not validation['valid']:
                 self.logger.error(f"Configuration validation failed: {validation['issues']}")
                 raise RuntimeError("Invalid configuration")
             
-            # Initialize application components
+            # Initialize application components (imported here so loading this module stays cheap)
+            from condition_parser import ConditionParser
+            from conditions_matcher import ConditionsMatcher
+            from trade_executor import TradeExecutor
+            from market_data_simulator import MarketDataSimulator
+            
             self.parser = ConditionParser()
             self.matcher = ConditionsMatcher()
             self.executor = TradeExecutor()
             self.simulator = MarketDataSimulator("AAPL")
             
             # Start conversation manager
-            conversation_manager.start_conversation("Production Trading Session")
+            get_conversation_manager().start_conversation("Production Trading Session")
             
             # Setup monitoring
             self._setup_monitoring()
@@ -97,10 +107,10 @@ class ProductionApplication:
     
     def _setup_monitoring(self):
         """Setup health checks and monitoring"""
-        from health_checks import DatabaseHealthCheck, BrokerHealthCheck, MemoryHealthCheck, DiskSpaceHealthCheck, ConditionsEngineHealthCheck
-        
-        # Add health checks
-        health_monitor.add_check(DatabaseHealthCheck(self.executor.broker_manager.db))
+        # Add health checks (the database check only when the broker manager holds a connection)
+        database_connection = getattr(self.executor.broker_manager, 'db', None)
+        if database_connection is not None:
+            health_monitor.add_check(DatabaseHealthCheck(database_connection))
         health_monitor.add_check(BrokerHealthCheck(self.executor.broker_manager))
         health_monitor.add_check(MemoryHealthCheck())
         health_monitor.add_check(DiskSpaceHealthCheck())
@@ -110,6 +120,9 @@ class ProductionApplication:
         self.recovery_manager = RecoveryManager(health_monitor)
         self._setup_recovery_actions()
         
+        # A component turning degraded or unhealthy wakes the main loop to report it
+        health_monitor.add_alert_callback(lambda status: self._wake.set())
+        
         # Start health monitoring
         health_monitor.start_monitoring(interval_seconds=30.0)
         
@@ -135,7 +148,7 @@ class ProductionApplication:
         
         def reconnect_brokers() -> bool:
             try:
-                connection_results = self.executor.broker_manager.connect_all()
+                connection_results = self.executor.broker_manager.connect_all(force=True)
                 connected = any(connection_results.values())
                 if connected:
                     self.logger.info("Broker connections re-established")
@@ -151,8 +164,7 @@ class ProductionApplication:
     def _connect_brokers(self):
         """Connect to broker APIs"""
         if self.executor.using_real_broker:
-            broker_name = type(self.executor.broker_manager.active_broker).__name__.replace('Broker', '')
-            self.logger.info(f"🎯 Connected to {broker_name} for real trade execution")
+            self.logger.info(f"🎯 Connected to {self.executor.broker_manager.active_broker_name} for real trade execution")
         else:
             self.logger.info("⚠️ No broker connected - using simulation mode")
     
@@ -170,16 +182,17 @@ class ProductionApplication:
                     self.logger.info(f"🚀 {trade_type} trade executed successfully!")
             
             # Archive trade execution
-            conversation_manager.add_conversation_turn(
+            get_conversation_manager().add_conversation_turn(
                 "TRADE_EXECUTED", 
                 f"Trade executed on {symbol} with {len(conditions)} conditions met",
                 {'trade_execution': True, 'symbol': symbol, 'conditions_count': len(conditions)}
             )
         
         def on_conditions_updated(conditions):
-            completed = sum(1 for c in conditions if c.completed)
-            total = len(conditions)
-            self.logger.debug(f"Condition status: {completed}/{total} conditions met")
+            # Runs on every market tick; skip the work entirely at production log levels
+            if self.logger.isEnabledFor(logging.DEBUG):
+                total = len(conditions)
+                self.logger.debug("Condition status: %d/%d conditions met", total - self.matcher.unmet_count, total)
         
         self.matcher.register_trade_callback(on_trade_executed)
         self.matcher.register_update_callback(on_conditions_updated)
@@ -187,13 +200,11 @@ class ProductionApplication:
         # Start conditions matching engine
         self.matcher.start_matching()
         
-        # Start market data simulation
-        def update_market_data(symbol: str, data):
-            self.matcher.update_market_data(symbol, data)
-        
+        # Start market data simulation; ticks are handed straight to the matcher, which only
+        # stores the latest tick per symbol and wakes its own thread to evaluate it
         self.simulation_thread = threading.Thread(
             target=self.simulator.simulate_data_stream,
-            args=(update_market_data, 0.1),
+            args=(self.matcher.update_market_data, 0.1),
             daemon=True
         )
         self.simulation_thread.start()
@@ -221,21 +232,24 @@ class ProductionApplication:
     
     def _run_application(self):
         """Main application loop"""
+        next_status_log = time.monotonic() + self.STATUS_LOG_INTERVAL
         while self.running and not self.shutdown_event.is_set():
             try:
-                # Check application health
-                health_status = health_monitor.check_all()
+                # Read the background monitor's latest sweep rather than running the checks here
+                overall_status, _ = health_monitor.get_overall_status()
                 
-                if health_status['overall_status'] == 'unhealthy':
+                if overall_status == 'unhealthy':
                     self.logger.warning("Application health status is unhealthy")
                 
-                # Log system metrics periodically
-                if int(time.time()) % 300 == 0:  # Every 5 minutes
+                # Log system metrics periodically (a monotonic deadline, checked whenever the loop wakes)
+                now = time.monotonic()
+                if now >= next_status_log:
                     self._log_system_status()
+                    next_status_log = now + self.STATUS_LOG_INTERVAL
                 
-                # Check for shutdown signal
-                if self.shutdown_event.wait(timeout=10):
-                    break
+                # Park until shutdown, a health alert or the next status log is due
+                self._wake.wait(timeout=max(next_status_log - time.monotonic(), 0))
+                self._wake.clear()
                 
             except Exception as e:
                 self.logger.error(f"Error in application loop: {e}")
@@ -244,11 +258,9 @@ class ProductionApplication:
     def _log_system_status(self):
         """Log current system status"""
         try:
-            import psutil
-            
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             self.logger.info(f"System status - CPU: {cpu_percent:.1f}%, "
                            f"Memory: {memory.percent:.1f}%, "
@@ -258,7 +270,7 @@ class ProductionApplication:
             component_status = {
                 'matcher_running': self.matcher.running if self.matcher else False,
                 'using_real_broker': self.executor.using_real_broker if self.executor else False,
-                'active_conversation': conversation_manager.current_session_id is not None
+                'active_conversation': get_conversation_manager().current_session_id is not None
             }
             
             self.logger.debug(f"Component status: {component_status}")
@@ -274,28 +286,59 @@ class ProductionApplication:
         self.logger.info("Initiating graceful shutdown...")
         self.running = False
         self.shutdown_event.set()
+        self._wake.set()
         
-        try:
-            # Stop simulation
-            if self.simulator:
-                self.simulator.stop_simulation()
-            
-            # Stop matcher
-            if self.matcher:
-                self.matcher.stop_matching()
-            
-            # Stop monitoring
-            if health_monitor:
-                health_monitor.stop_monitoring()
-            
-            # End conversation
+        deadline = time.monotonic() + self.config.shutdown_grace_seconds
+        
+        # Producers first, in parallel: the matcher's trade callback archives turns, so the
+        # conversation manager may only close once the simulator and matcher have stopped
+        stop_actions = {}
+        if self.simulator:
+            stop_actions['simulator'] = self.simulator.stop_simulation
+        if self.matcher:
+            stop_actions['matcher'] = self.matcher.stop_matching
+        if health_monitor:
+            stop_actions['health_monitor'] = health_monitor.stop_monitoring
+        failed, pending = self._run_stop_actions(stop_actions, deadline)
+        
+        def end_conversation():
+            conversation_manager = get_conversation_manager()
             conversation_manager.end_conversation({'reason': 'shutdown'})
             conversation_manager.shutdown()
-            
+        
+        # Still attempted if a producer overran, so queued turns get a chance to reach the database
+        conversation_failed, conversation_pending = self._run_stop_actions({'conversation': end_conversation}, deadline)
+        failed += conversation_failed
+        pending += conversation_pending
+        
+        if pending:
+            self.logger.warning(f"Shutdown grace period expired waiting for: {', '.join(sorted(pending))}")
+        elif not failed:
             self.logger.info("✅ Application shutdown complete")
-            
-        except Exception as e:
-            self.logger.error(f"Error during shutdown: {e}")
+    
+    def _run_stop_actions(self, actions: Dict[str, Callable[[], None]], deadline: float) -> Tuple[List[str], List[str]]:
+        """Run stop actions on daemon threads until the monotonic deadline; returns (failed, still running) names"""
+        errors: Dict[str, Exception] = {}
+        
+        def run(name: str, action: Callable[[], None]):
+            try:
+                action()
+            except Exception as e:
+                errors[name] = e
+        
+        # Daemon threads, so a component that overruns cannot hold up interpreter exit
+        threads = {
+            name: threading.Thread(target=run, args=(name, action), daemon=True, name=f"shutdown-{name}")
+            for name, action in actions.items()
+        }
+        for thread in threads.values():
+            thread.start()
+        for thread in threads.values():
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+        
+        for name, error in errors.items():
+            self.logger.error(f"Error during shutdown of {name}: {error}")
+        return list(errors), [name for name, thread in threads.items() if thread.is_alive()]
 
 def main():
     """Main production entry point"""
@@ -1,11 +1,18 @@
 import time
-from typing import Dict, List, Optional
+import logging
+import itertools
+from collections import deque
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass, field
+import numpy as np
 from condition_parser import Condition
 from conditions_matcher import MarketData
-from broker_integrations import BrokerManager
 
-@dataclass
+logger = logging.getLogger(__name__)
+TRADE_BANNER_RULE = "=" * 60
+_execution_sequence = itertools.count()  # Suffix keeping simulated IDs unique within one millisecond
+
+@dataclass(slots=True, frozen=True)
 class TradeOrder:
     symbol: str
     order_type: str  # 'market', 'limit', 'stop'
@@ -14,7 +21,7 @@ class TradeOrder:
     stop_price: Optional[float] = None  # For stop orders
     time_in_force: str = 'IOC'  # Immediate or Cancel
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeExecution:
     order: TradeOrder
     executed_price: float
@@ -23,13 +30,20 @@ class TradeExecution:
     execution_id: str
     commission: float = 0.0
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskParameters:
+    """Risk limits; frozen so the price factors derived from them cannot go stale"""
     max_position_size: float = 10000.0  # Maximum position value
     max_daily_loss: float = 1000.0  # Maximum daily loss limit
     stop_loss_percentage: float = 0.02  # 2% stop loss
     take_profit_percentage: float = 0.05  # 5% take profit
     max_risk_per_trade: float = 0.01  # 1% of portfolio per trade
+    stop_loss_factor: float = field(init=False, repr=False)  # Entry price multiplier for the stop order
+    take_profit_factor: float = field(init=False, repr=False)  # Entry price multiplier for the profit target
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'stop_loss_factor', 1 - self.stop_loss_percentage)
+        object.__setattr__(self, 'take_profit_factor', 1 + self.take_profit_percentage)
 
 class TradeExecutor:
     """
@@ -37,14 +51,26 @@ class TradeExecutor:
     Integrates with real broker APIs when available
     """
     
-    def __init__(self, portfolio_value: float = 100000.0):
+    SLIPPAGE_BATCH = 4096  # Simulated slippage draws generated per NumPy call
+    MAX_TRADE_HISTORY = 10000  # Executions kept in executed_trades; older ones roll out
+    
+    def __init__(self, portfolio_value: float = 100000.0, seed: Optional[int] = None):
         self.portfolio_value = portfolio_value
         self.risk_params = RiskParameters()
-        self.executed_trades: List[TradeExecution] = []
+        self.executed_trades: Deque[TradeExecution] = deque(maxlen=self.MAX_TRADE_HISTORY)
+        # Running totals over every execution, including those rolled out of executed_trades
+        self._total_invested = 0.0
+        self._total_commission = 0.0
+        self._trade_count = 0
         self.daily_pnl = 0.0
-        self.last_reset_date = time.time() // 86400  # Days since epoch
+        self._next_reset_monotonic = time.monotonic() + self._seconds_to_utc_midnight()
+        self._rng = np.random.default_rng(seed)
+        self._slippage_batch: List[float] = []
+        self._slippage_index = 0
         
-        # Initialize broker manager for real integration
+        # Initialize broker manager for real integration (imported here: broker_integrations
+        # imports this module's order types, so a top-level import would be circular)
+        from broker_integrations import BrokerManager
         self.broker_manager = BrokerManager()
         self.using_real_broker = False
         
@@ -60,9 +86,9 @@ class TradeExecutor:
         if connected_brokers:
             self.using_real_broker = True
             broker_name = connected_brokers[0]
-            print(f"🎯 Connected to {broker_name.capitalize()} for real trade execution")
+            logger.info("🎯 Connected to %s for real trade execution", broker_name.capitalize())
         else:
-            print("⚠️  No broker connected - using simulation mode")
+            logger.warning("⚠️  No broker connected - using simulation mode")
 
     def execute_trade(self, symbol: str, market_data: MarketData, 
                      conditions: List[Condition]) -> Optional[TradeExecution]:
@@ -90,6 +116,9 @@ class TradeExecutor:
         
         if execution:
             self.executed_trades.append(execution)
+            self._total_invested += execution.executed_price * execution.executed_quantity
+            self._total_commission += execution.commission
+            self._trade_count += 1
             self._log_execution(execution, conditions)
             
             # Set risk management orders for real trades
@@ -103,19 +132,18 @@ class TradeExecutor:
         try:
             execution = self.broker_manager.execute_trade(order)
             if execution:
-                print(f"🎯 REAL trade executed via {type(self.broker_manager.active_broker).__name__}")
+                logger.info("🎯 REAL trade executed via %s", self.broker_manager.active_broker_name)
             return execution
         except Exception as e:
-            print(f"❌ Real broker execution failed: {e}")
-            print("Falling back to simulation...")
+            logger.error("❌ Real broker execution failed: %s - falling back to simulation", e)
             return self._simulate_execution(order, market_data)
     
     def _set_broker_risk_orders(self, execution: TradeExecution, market_data: MarketData):
         """Set stop loss and take profit orders with broker"""
         try:
             # Calculate risk management prices
-            stop_loss_price = execution.executed_price * (1 - self.risk_params.stop_loss_percentage)
-            take_profit_price = execution.executed_price * (1 + self.risk_params.take_profit_percentage)
+            stop_loss_price = execution.executed_price * self.risk_params.stop_loss_factor
+            take_profit_price = execution.executed_price * self.risk_params.take_profit_factor
             
             # Create risk orders
             stop_order = TradeOrder(
@@ -136,25 +164,24 @@ class TradeExecutor:
             self.broker_manager.execute_trade(stop_order)
             self.broker_manager.execute_trade(limit_order)
             
-            print(f"🛑 Stop loss set at ${stop_loss_price:.2f}")
-            print(f"🎯 Take profit set at ${take_profit_price:.2f}")
+            logger.info("🛑 Stop loss set at $%.2f, 🎯 take profit set at $%.2f", stop_loss_price, take_profit_price)
             
         except Exception as e:
-            print(f"❌ Failed to set risk orders: {e}")
+            logger.error("❌ Failed to set risk orders: %s", e)
     
     def _check_risk_limits(self, symbol: str, market_data: MarketData) -> bool:
         """Check if trade passes risk management rules"""
         
         # Check daily loss limit
         if self.daily_pnl < -self.risk_params.max_daily_loss:
-            print(f"❌ Daily loss limit exceeded: ${self.daily_pnl:.2f}")
+            logger.warning("❌ Daily loss limit exceeded: $%.2f", self.daily_pnl)
             return False
         
         # Check maximum position size
         current_price = market_data.price
         order_value = current_price * 100  # Assuming 100 shares
         if order_value > self.risk_params.max_position_size:
-            print(f"❌ Position size too large: ${order_value:.2f}")
+            logger.warning("❌ Position size too large: $%.2f", order_value)
             return False
         
         return True
@@ -197,79 +224,86 @@ class TradeExecutor:
         """
         try:
             # For market order, execute at current price (with small slippage)
-            slippage = random.uniform(-0.0005, 0.0005)  # Small random slippage
+            slippage = self._next_slippage()  # Small random slippage
             executed_price = market_data.price * (1 + slippage)
             
             # Calculate commission (0.1% of trade value)
             trade_value = executed_price * order.quantity
             commission = trade_value * 0.001
             
+            now_ns = time.time_ns()
             execution = TradeExecution(
                 order=order,
                 executed_price=executed_price,
                 executed_quantity=order.quantity,
-                timestamp=time.time(),
-                execution_id=f"EXEC_{int(time.time() * 1000)}",
+                timestamp=now_ns / 1e9,
+                execution_id=f"EXEC_{now_ns // 1_000_000}_{next(_execution_sequence)}",
                 commission=commission
             )
             
             return execution
             
         except Exception as e:
-            print(f"❌ Trade execution failed: {e}")
+            logger.error("❌ Trade execution failed: %s", e)
             return None
     
+    def _next_slippage(self) -> float:
+        """Next simulated slippage fraction, refilling the batch when it runs out"""
+        if self._slippage_index >= len(self._slippage_batch):
+            # Plain floats: cheaper to index per trade than NumPy scalars
+            self._slippage_batch = self._rng.uniform(-0.0005, 0.0005, self.SLIPPAGE_BATCH).tolist()
+            self._slippage_index = 0
+        
+        slippage = self._slippage_batch[self._slippage_index]
+        self._slippage_index += 1
+        return slippage
+    
     def _log_execution(self, execution: TradeExecution, conditions: List[Condition]):
-        """Log trade execution details"""
-        print("\n" + "="*60)
-        print("🚀 TRADE EXECUTED SUCCESSFULLY")
-        print("="*60)
-        print(f"Symbol: {execution.order.symbol}")
-        print(f"Price: ${execution.executed_price:.2f}")
-        print(f"Quantity: {execution.executed_quantity} shares")
-        print(f"Value: ${execution.executed_price * execution.executed_quantity:.2f}")
-        print(f"Commission: ${execution.commission:.2f}")
-        print(f"Execution ID: {execution.execution_id}")
-        print("\nConditions Met:")
-        for condition in conditions:
-            status = "✅"
-            print(f"  {status} {condition.description}")
-        print("="*60)
+        """Log trade execution details as one record"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        conditions_met = "\n".join(f"  ✅ {condition.description}" for condition in conditions)
+        logger.info(
+            "\n%s\n🚀 TRADE EXECUTED SUCCESSFULLY\n%s\n"
+            "Symbol: %s\nPrice: $%.2f\nQuantity: %d shares\nValue: $%.2f\n"
+            "Commission: $%.2f\nExecution ID: %s\n\nConditions Met:\n%s\n%s",
+            TRADE_BANNER_RULE, TRADE_BANNER_RULE,
+            execution.order.symbol, execution.executed_price, execution.executed_quantity,
+            execution.executed_price * execution.executed_quantity,
+            execution.commission, execution.execution_id, conditions_met, TRADE_BANNER_RULE
+        )
     
     def set_stop_loss(self, execution_id: str, stop_price: float):
         """Set stop loss for existing position"""
         # In real implementation, this would send stop order to broker
-        print(f"🛑 Stop loss set for {execution_id} at ${stop_price:.2f}")
+        logger.info("🛑 Stop loss set for %s at $%.2f", execution_id, stop_price)
     
     def set_take_profit(self, execution_id: str, target_price: float):
         """Set take profit target for existing position"""
         # In real implementation, this would send limit order to broker
-        print(f"🎯 Take profit set for {execution_id} at ${target_price:.2f}")
+        logger.info("🎯 Take profit set for %s at $%.2f", execution_id, target_price)
     
     def get_portfolio_status(self) -> Dict:
         """Get current portfolio status"""
-        total_invested = sum(
-            exec.executed_price * exec.executed_quantity 
-            for exec in self.executed_trades
-        )
-        total_commission = sum(exec.commission for exec in self.executed_trades)
-        
         return {
             'portfolio_value': self.portfolio_value,
-            'total_invested': total_invested,
-            'total_commission': total_commission,
+            'total_invested': self._total_invested,
+            'total_commission': self._total_commission,
             'daily_pnl': self.daily_pnl,
-            'trade_count': len(self.executed_trades),
-            'cash_available': self.portfolio_value - total_invested
+            'trade_count': self._trade_count,
+            'cash_available': self.portfolio_value - self._total_invested
         }
     
     def reset_daily_account(self):
         """Reset daily tracking for new trading day"""
-        current_date = time.time() // 86400
-        if current_date > self.last_reset_date:
+        now = time.monotonic()
+        if now >= self._next_reset_monotonic:
             self.daily_pnl = 0.0
-            self.last_reset_date = current_date
-            print("📅 Daily account reset - new trading day")
-
-# Import random for slippage simulation
-import random
+            # Re-aligned to the wall clock once a day; in between, clock steps cannot trigger a reset
+            self._next_reset_monotonic = now + self._seconds_to_utc_midnight()
+            logger.info("📅 Daily account reset - new trading day")
+    
+    @staticmethod
+    def _seconds_to_utc_midnight() -> float:
+        """Seconds until the next UTC day starts"""
+        return 86400 - time.time() % 86400